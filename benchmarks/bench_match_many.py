@@ -0,0 +1,58 @@
+"""
+Benchmark: ResumeMatcher.match_many versus a per-resume match loop.
+
+Usage:
+    python benchmarks/bench_match_many.py [n_resumes]
+"""
+
+import random
+import sys
+import time
+
+from resumematch import ResumeMatcher
+
+VOCABULARY = (
+    "python java sql docker kubernetes aws azure react django flask spark hadoop "
+    "linux git terraform pandas numpy tensorflow pytorch scala go rust kafka redis "
+    "postgresql mongodb graphql typescript javascript agile scrum leadership"
+).split()
+FILLER = "worked on team projects delivering reliable software for customers".split()
+
+
+def make_resumes(n, seed=0):
+    """Generate n synthetic parsed resumes."""
+    rng = random.Random(seed)
+    resumes = []
+    for _ in range(n):
+        words = rng.choices(VOCABULARY, k=40) + rng.choices(FILLER, k=160)
+        rng.shuffle(words)
+        resumes.append({
+            "raw_text": " ".join(words),
+            "skills": rng.sample(VOCABULARY, 8),
+        })
+    return resumes
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    matcher = ResumeMatcher()
+    resumes = make_resumes(n)
+    job = "Senior engineer: Python, Django, PostgreSQL, Docker, Kubernetes, AWS and Kafka."
+
+    start = time.perf_counter()
+    loop_results = [matcher.match(resume, job) for resume in resumes]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_results = matcher.match_many(resumes, job)
+    batch_time = time.perf_counter() - start
+
+    assert batch_results == loop_results
+    print(f"resumes:      {n}")
+    print(f"match loop:   {loop_time:.3f}s  ({n / loop_time:,.0f} resumes/s)")
+    print(f"match_many:   {batch_time:.3f}s  ({n / batch_time:,.0f} resumes/s)")
+    print(f"speedup:      {loop_time / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Microbenchmark: TextNormalizer versus the chained re.sub implementation.
+
+Usage:
+    python benchmarks/bench_normalize.py [n_texts]
+"""
+
+import random
+import re
+import sys
+import timeit
+
+from resumematch.utils import TextNormalizer
+
+WORDS = (
+    "Senior software engineer with 8+ years building Python & Go services, "
+    "CI/CD pipelines (GitHub Actions), and data platforms @ scale; led teams of 5-10."
+).split()
+
+
+def legacy_clean_text(text):
+    """The previous clean_text: two re.sub calls and two strips."""
+    text = re.sub(r'\s+', ' ', text)
+    text = text.strip()
+    text = re.sub(r'[^\w\s\.\,\(\)\:\;\-]', '', text)
+    return text.strip()
+
+
+def make_texts(n, seed=0):
+    """Generate n resume-sized texts with mixed whitespace and symbols."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        words = rng.choices(WORDS, k=400)
+        texts.append("".join(w + rng.choice([" ", "  ", "\n", "\t", " \n "]) for w in words))
+    return texts
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    texts = make_texts(n)
+    normalizer = TextNormalizer()
+    assert normalizer.normalize_many(texts) == [legacy_clean_text(t) for t in texts]
+
+    legacy = min(timeit.repeat(lambda: [legacy_clean_text(t) for t in texts], number=1, repeat=5))
+    fast = min(timeit.repeat(lambda: normalizer.normalize_many(texts), number=1, repeat=5))
+    print(f"texts:            {n}")
+    print(f"re.sub chain:     {legacy * 1e6 / n:.1f} us/text")
+    print(f"TextNormalizer:   {fast * 1e6 / n:.1f} us/text")
+    print(f"speedup:          {legacy / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Benchmark suite: parse, clean_text, extract_keywords, match and analyze at scale.
+
+Each (stage, size) pair runs in a freshly spawned process. Memory is
+reported as the growth of that process's peak RSS over a baseline taken
+once the stage's inputs are built, so it covers the timed loop and not
+the corpus held in memory. The corpus is written once for the largest
+size and reused (see corpus.py).
+
+Usage:
+    python benchmarks/bench_pipeline.py [--sizes 1,1000,100000]
+        [--stages parse,clean_text,extract_keywords,match,analyze]
+        [--formats txt,docx,pdf] [--corpus-dir DIR] [--json OUT]
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from corpus import FORMATS, build_corpus, iter_resumes, make_job, resume_text
+
+STAGES = ("parse", "clean_text", "extract_keywords", "match", "analyze")
+
+
+def peak_rss_kib():
+    """Peak resident set size of this process so far, in KiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_stage(stage, paths, seed):
+    """Time one stage over a corpus; runs inside a spawned worker process."""
+    from resumematch import ResumeAnalyzer, ResumeMatcher, ResumeParser
+    from resumematch.utils import clean_text, default_skill_automaton
+
+    n = len(paths)
+    job = make_job(random.Random(seed))
+    texts = []
+    if stage in ("clean_text", "extract_keywords", "match"):
+        texts = [resume_text(pages) for pages in iter_resumes(n, seed)]
+
+    if stage == "parse":
+        parser = ResumeParser()
+        call, inputs = parser.parse, [str(path) for path in paths]
+    elif stage == "clean_text":
+        call, inputs = clean_text, texts
+    elif stage == "extract_keywords":
+        call, inputs = ResumeMatcher().extract_keywords, texts
+    elif stage == "match":
+        matcher = ResumeMatcher()
+        skills = default_skill_automaton()
+        inputs = [{"raw_text": text, "skills": skills.find(text)} for text in texts]
+        job = matcher.compile_job(job)
+        call = lambda resume: matcher.match(resume, job)  # noqa: E731
+    else:
+        analyzer = ResumeAnalyzer()
+        job = analyzer.matcher.compile_job(job)
+        call = lambda path: analyzer.analyze(path, job)  # noqa: E731
+        inputs = [str(path) for path in paths]
+    del texts
+
+    clock = time.perf_counter
+    latencies = []
+    append = latencies.append
+    baseline_kib = peak_rss_kib()
+    start = clock()
+    for item in inputs:
+        t0 = clock()
+        call(item)
+        append(clock() - t0)
+    total = clock() - start
+    return latencies, total, peak_rss_kib() - baseline_kib
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an ascending list."""
+    index = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1,1000,100000")
+    parser.add_argument("--stages", default=",".join(STAGES))
+    parser.add_argument("--formats", default=",".join(FORMATS))
+    parser.add_argument(
+        "--corpus-dir", default=str(Path(tempfile.gettempdir()) / "resumematch-bench")
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    stages = args.stages.split(",")
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+
+    print(f"building corpus of {max(sizes)} resumes in {args.corpus_dir} ...", flush=True)
+    corpus = build_corpus(args.corpus_dir, max(sizes), args.formats.split(","), seed=args.seed)
+
+    spawn = multiprocessing.get_context("spawn")
+    header = (
+        f"{'stage':<17}{'docs':>8}{'docs/s':>12}{'p50 ms':>10}{'p99 ms':>10}"
+        f"{'+RSS MiB':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    results = []
+    for stage in stages:
+        for size in sizes:
+            with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+                latencies, total, rss_kib = pool.submit(
+                    run_stage, stage, corpus[:size], args.seed
+                ).result()
+            latencies.sort()
+            row = {
+                "stage": stage,
+                "docs": size,
+                "throughput": size / total if total else float("inf"),
+                "p50_ms": percentile(latencies, 50) * 1000,
+                "p99_ms": percentile(latencies, 99) * 1000,
+                "rss_growth_mib": rss_kib / 1024,
+            }
+            results.append(row)
+            print(
+                f"{stage:<17}{size:>8}{row['throughput']:>12,.0f}{row['p50_ms']:>10.3f}"
+                f"{row['p99_ms']:>10.3f}{row['rss_growth_mib']:>10.1f}",
+                flush=True,
+            )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
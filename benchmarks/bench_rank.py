@@ -0,0 +1,65 @@
+"""
+Microbenchmark: streaming top-k ``ResumeMatcher.rank`` versus sort-everything.
+
+Both variants score the same generator of synthetic resumes; the baseline
+keeps every result dictionary and sorts, ``rank`` keeps a k-entry heap.
+Peak traced memory is reported alongside wall time.
+
+Usage:
+    python benchmarks/bench_rank.py [n_resumes] [k]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from corpus import iter_resumes, make_job, resume_text
+from resumematch import ResumeMatcher
+
+
+def stream(n):
+    """Yield (resume_id, resume_data) pairs without materializing the corpus."""
+    for i, pages in enumerate(iter_resumes(n)):
+        yield i, {"raw_text": resume_text(pages)}
+
+
+def sort_everything(matcher, job, n, k):
+    results = []
+    for resume_id, resume_data in stream(n):
+        result = matcher.match(resume_data, job)
+        result["resume_id"] = resume_id
+        results.append(result)
+    results.sort(key=lambda r: r["overall_score"], reverse=True)
+    return results[:k]
+
+
+def measure(function, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    matcher = ResumeMatcher()
+    job = make_job(random.Random(0))
+
+    baseline, base_time, base_peak = measure(sort_everything, matcher, job, n, k)
+    ranked, rank_time, rank_peak = measure(
+        lambda: matcher.rank(stream(n), job, k=k)
+    )
+    assert [r["resume_id"] for r in ranked] == [r["resume_id"] for r in baseline]
+
+    print(f"resumes: {n}, k: {k}")
+    print(f"sort everything: {base_time:6.2f} s  peak {base_peak / 1e6:7.1f} MB")
+    print(f"rank (heap):     {rank_time:6.2f} s  peak {rank_peak / 1e6:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
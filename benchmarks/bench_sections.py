@@ -0,0 +1,56 @@
+"""
+Microbenchmark: section segmentation cost versus resume length.
+
+Times ``extract_sections`` on synthetic resumes of 1 to 10 pages and a
+naive extractor that re-scans the whole text with one regex per section
+and field. Per-page cost of the segmenter should stay flat.
+
+Usage:
+    python benchmarks/bench_sections.py [n_resumes]
+"""
+
+import re
+import sys
+import timeit
+
+from corpus import iter_resumes, resume_text
+from resumematch.parser.sections import DEFAULT_HEADINGS, extract_sections
+
+PAGE_COUNTS = (1, 2, 5, 10)
+
+_ALL_HEADINGS = "|".join(p for phrases in DEFAULT_HEADINGS.values() for p in phrases)
+
+
+def naive_extract(text):
+    """One full-text search per section and field, as a regex-per-field parser would."""
+    fields = {}
+    for section, phrases in DEFAULT_HEADINGS.items():
+        heading = "|".join(phrases)
+        body = re.search(
+            rf"^(?:{heading})\s*$(.*?)(?=^(?:{_ALL_HEADINGS})\s*$|\Z)",
+            text, re.IGNORECASE | re.MULTILINE | re.DOTALL,
+        )
+        fields[section] = body.group(1) if body else ""
+    fields["email"] = re.findall(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+", text)
+    fields["dates"] = re.findall(r"\b\w+ \d{4}\s*-\s*(?:\w+ \d{4}|Present)", text)
+    fields["years"] = re.findall(r"\b(?:19|20)\d{2}\b", text)
+    return fields
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"resumes per size: {n}")
+    print(f"{'pages':>5} {'lines':>6} {'naive us/page':>14} {'segmenter us/page':>18}")
+    for pages in PAGE_COUNTS:
+        texts = [resume_text(resume) for resume in iter_resumes(n, pages=pages)]
+        lines = sum(text.count("\n") + text.count("\f") + 1 for text in texts) / n
+        naive = min(timeit.repeat(lambda: [naive_extract(t) for t in texts], number=1, repeat=3))
+        fast = min(timeit.repeat(lambda: [extract_sections(t) for t in texts], number=1, repeat=3))
+        print(
+            f"{pages:>5} {lines:>6.0f} {naive * 1e6 / n / pages:>14.1f} "
+            f"{fast * 1e6 / n / pages:>18.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
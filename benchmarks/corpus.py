@@ -0,0 +1,263 @@
+"""
+Synthetic resume and job description corpus for benchmarks.
+
+Resumes have the usual sections (contact details, summary, experience,
+education, skills, certifications) drawn from fixed word lists, so a seed
+always produces the same corpus. Files are written as TXT, DOCX or PDF
+with the standard library only.
+
+Usage:
+    python benchmarks/corpus.py OUT_DIR [n_resumes] [--formats txt,docx,pdf] [--pages N]
+"""
+
+import argparse
+import random
+import zipfile
+import zlib
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+FORMATS = ("txt", "docx", "pdf")
+
+FIRST_NAMES = "Alex Jordan Taylor Morgan Casey Riley Sam Jamie Avery Quinn".split()
+LAST_NAMES = "Smith Garcia Chen Patel Kim Novak Rossi Silva Okafor Larsen".split()
+TITLES = (
+    "Software Engineer", "Senior Software Engineer", "Data Scientist", "Data Engineer",
+    "DevOps Engineer", "Backend Developer", "Frontend Developer", "Engineering Manager",
+    "Machine Learning Engineer", "Site Reliability Engineer",
+)
+COMPANIES = (
+    "Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Hooli",
+    "Wayne Enterprises", "Vandelay Industries", "Soylent Systems", "Tyrell Analytics",
+)
+DEGREES = (
+    "Bachelor of Science in Computer Science", "Master of Science in Data Science",
+    "Bachelor of Engineering in Electrical Engineering", "PhD in Statistics",
+    "Master of Business Administration",
+)
+SCHOOLS = (
+    "State University", "Institute of Technology", "City College",
+    "University of Northfield", "Polytechnic University",
+)
+CERTIFICATIONS = (
+    "AWS Certified Solutions Architect", "Certified Kubernetes Administrator",
+    "Google Professional Data Engineer", "PMP", "Certified ScrumMaster",
+)
+SKILLS = (
+    "Python", "Java", "JavaScript", "TypeScript", "SQL", "Docker", "Kubernetes", "AWS",
+    "Azure", "GCP", "React.js", "Django", "Flask", "Spark", "Kafka", "Redis", "PostgreSQL",
+    "MongoDB", "Terraform", "Linux", "Git", "pandas", "NumPy", "TensorFlow", "PyTorch",
+    "Machine Learning", "CI/CD", "GraphQL", "Agile", "Scrum",
+)
+VERBS = (
+    "Built", "Designed", "Led", "Migrated", "Optimized", "Maintained", "Automated",
+    "Launched", "Scaled", "Refactored",
+)
+OBJECTS = (
+    "data pipelines", "REST APIs", "microservices", "internal tooling", "dashboards",
+    "deployment workflows", "recommendation models", "billing systems", "search services",
+    "monitoring and alerting",
+)
+OUTCOMES = (
+    "reducing latency by 40%", "serving 2M daily users", "cutting costs by 25%",
+    "improving reliability to 99.95%", "for a team of 8 engineers",
+    "across three regions", "ahead of schedule",
+)
+MONTHS = "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split()
+
+# Approximate number of lines filling one page.
+LINES_PER_PAGE = 45
+
+
+def make_resume(rng, pages=1):
+    """
+    Generate one synthetic resume.
+
+    Args:
+        rng: random.Random instance.
+        pages: Approximate number of pages; longer resumes get more
+              positions and bullet points.
+
+    Returns:
+        List of pages, each a list of text lines.
+    """
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    lines = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}@example.com | +1 (555) {rng.randint(100, 999)}-"
+        f"{rng.randint(1000, 9999)}",
+        "",
+        "Summary",
+        f"{rng.choice(TITLES)} with {rng.randint(2, 15)} years of experience in "
+        f"{', '.join(rng.sample(SKILLS, 3))}.",
+        "",
+        "Experience",
+    ]
+    year = 2024
+    target = max(1, pages) * LINES_PER_PAGE - 20
+    while len(lines) < target:
+        start = year - rng.randint(1, 4)
+        end = "Present" if year == 2024 else f"{rng.choice(MONTHS)} {year}"
+        lines.append(f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)}")
+        lines.append(f"{rng.choice(MONTHS)} {start} - {end}")
+        for _ in range(rng.randint(3, 6)):
+            lines.append(
+                f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} with "
+                f"{' and '.join(rng.sample(SKILLS, 2))}, {rng.choice(OUTCOMES)}."
+            )
+        lines.append("")
+        year = start
+    lines += [
+        "Education",
+        f"{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)}, {year - rng.randint(0, 3)}",
+        "",
+        "Skills",
+        ", ".join(rng.sample(SKILLS, 12)),
+        "",
+        "Certifications",
+        *rng.sample(CERTIFICATIONS, 2),
+    ]
+    return [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)]
+
+
+def make_job(rng):
+    """
+    Generate one synthetic job description.
+
+    Args:
+        rng: random.Random instance.
+
+    Returns:
+        Job description text.
+    """
+    required = rng.sample(SKILLS, 4)
+    nice = rng.sample([skill for skill in SKILLS if skill not in required], 4)
+    return "\n".join([
+        f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)}",
+        f"We are looking for an engineer to work on {rng.choice(OBJECTS)} and "
+        f"{rng.choice(OBJECTS)}.",
+        f"Requirements: {', '.join(required)} and {rng.randint(3, 8)}+ years of experience.",
+        f"Nice to have: {', '.join(nice)}.",
+    ])
+
+
+def resume_text(pages):
+    """Join generated pages the way the TXT writer lays them out."""
+    return "\f".join("\n".join(lines) for lines in pages)
+
+
+def write_txt(path, pages):
+    """Write a resume as plain text with form feeds between pages."""
+    path.write_text(resume_text(pages), encoding="utf-8")
+
+
+def write_docx(path, pages):
+    """Write a resume as a minimal DOCX with page breaks between pages."""
+    body = []
+    for number, lines in enumerate(pages):
+        if number:
+            body.append('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+        body.extend(f"<w:p><w:r><w:t>{escape(line)}</w:t></w:r></w:p>" for line in lines)
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{''.join(body)}</w:body></w:document>"
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        archive.writestr("word/document.xml", xml)
+
+
+def write_pdf(path, pages):
+    """Write a resume as a minimal PDF with one Flate-compressed text stream per page."""
+    objects = {}
+    kids = []
+    for number, lines in enumerate(pages):
+        page_num, content_num = 3 + 2 * number, 4 + 2 * number
+        ops = ["BT", "/F1 11 Tf", "72 740 Td"]
+        for i, line in enumerate(lines):
+            if i:
+                ops.append("0 -15 Td")
+            line = line.encode("latin-1", "replace").decode("latin-1")
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            ops.append(f"({escaped}) Tj")
+        ops.append("ET")
+        stream = zlib.compress("\n".join(ops).encode("latin-1"))
+        objects[content_num] = (
+            b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(stream)
+            + stream + b"\nendstream"
+        )
+        objects[page_num] = b"<< /Type /Page /Parent 2 0 R /Contents %d 0 R >>" % content_num
+        kids.append(b"%d 0 R" % page_num)
+    objects[1] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[2] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for num in sorted(objects):
+        offsets[num] = len(out)
+        out += b"%d 0 obj\n" % num + objects[num] + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for num in sorted(objects):
+        out += b"%010d 00000 n \n" % offsets[num]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+
+
+WRITERS = {"txt": write_txt, "docx": write_docx, "pdf": write_pdf}
+
+
+def iter_resumes(n, seed=0, pages=1):
+    """Yield the pages of n deterministic synthetic resumes."""
+    for i in range(n):
+        yield make_resume(random.Random(f"{seed}:{i}"), pages)
+
+
+def build_corpus(directory, n, formats=FORMATS, seed=0, pages=1):
+    """
+    Write n resumes to a directory, cycling through formats.
+
+    Files that already exist are kept, so a corpus built once for the
+    largest size serves every smaller run.
+
+    Args:
+        directory: Output directory (created if needed).
+        n: Number of resumes.
+        formats: File formats to cycle through.
+        seed: Corpus seed.
+        pages: Approximate pages per resume.
+
+    Returns:
+        List of n file paths.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i, pages_of_resume in enumerate(iter_resumes(n, seed, pages)):
+        fmt = formats[i % len(formats)]
+        path = directory / f"resume_{seed}_{pages}p_{i:06d}.{fmt}"
+        if not path.exists():
+            WRITERS[fmt](path, pages_of_resume)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("out_dir")
+    parser.add_argument("n", nargs="?", type=int, default=1000)
+    parser.add_argument("--formats", default=",".join(FORMATS))
+    parser.add_argument("--pages", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    paths = build_corpus(
+        args.out_dir, args.n, args.formats.split(","), seed=args.seed, pages=args.pages
+    )
+    print(f"{len(paths)} resumes in {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ This example shows how to integrate ResumeMatch into your own
 Python application or workflow.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List
 from resumematch import ResumeAnalyzer, ResumeParser, ResumeMatcher
 
 
@@ -58,39 +58,33 @@ class JobApplicationProcessor:
     
     def batch_process_applications(
         self,
-        resume_paths: List[str],
-        job_description: str
+        resume_paths: Iterable[str],
+        job_description: str,
+        k: int = 50
     ) -> List[Dict[str, Any]]:
         """
-        Process multiple applications for the same job posting.
+        Rank applications for the same job posting.
+        
+        Resumes are parsed and scored one at a time, and only the best k
+        match results are kept, so any number of paths can be streamed.
         
         Args:
-            resume_paths: List of paths to resume files.
+            resume_paths: Paths to resume files (may be a generator).
             job_description: Job description to match against.
+            k: Number of top applications returned.
         
         Returns:
-            List of analysis results, one per resume.
+            The k best match results, highest score first, each with the
+            resume path as ``resume_id``.
         """
-        results = []
-        
-        for resume_path in resume_paths:
-            try:
-                result = self.process_application(resume_path, job_description)
-                results.append(result)
-            except Exception as e:
-                print(f"Error processing {resume_path}: {e}")
-                results.append({
-                    "error": str(e),
-                    "resume_path": resume_path,
-                })
-        
-        # Sort by overall score (highest first)
-        results.sort(
-            key=lambda x: x.get("overall_score", 0),
-            reverse=True
-        )
+        def parsed_resumes():
+            for item in self.parser.iter_parse(resume_paths):
+                if "error" in item:
+                    print(f"Error processing {item['resume_path']}: {item['error']}")
+                    continue
+                yield item["resume_path"], item["data"]
         
-        return results
+        return self.matcher.rank(parsed_resumes(), job_description, k=k)
 
 
 def main():
@@ -118,12 +112,13 @@ def main():
     print("        'resumes/applicant2.pdf',")
     print("        'resumes/applicant3.pdf',")
     print("    ],")
-    print("    job_description='Job description text...'")
+    print("    job_description='Job description text...',")
+    print("    k=50,")
     print(")")
     print()
-    print("# Results are automatically sorted by score")
+    print("# Only the top 50 results are kept, sorted by score")
     print("for result in results:")
-    print("    print(f\"Score: {result['overall_score']}\")")
+    print("    print(f\"{result['resume_id']}: {result['overall_score']}\")")
     print()
 
 
@@ -52,6 +52,11 @@ setup(
             "pre-commit>=3.0.0",
         ],
     },
+    entry_points={
+        "console_scripts": [
+            "resumematch=resumematch.cli:main",
+        ],
+    },
     include_package_data=True,
     zip_safe=False,
 )
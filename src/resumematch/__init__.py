@@ -3,17 +3,31 @@ ResumeMatch - AI-Powered Resume Analysis & Job Matching Platform.
 
 A Python package for analyzing resumes and matching them with job descriptions
 using natural language processing and semantic analysis.
+
+The public classes are imported on first access, so ``import resumematch``
+does not load the parsing and matching machinery until it is used.
 """
 
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 __author__ = "Anshuman Nanda"
 
-from resumematch.core import ResumeAnalyzer
-from resumematch.matcher import ResumeMatcher
-from resumematch.parser import ResumeParser
+from resumematch._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from resumematch.core import ResumeAnalyzer
+    from resumematch.matcher import ResumeMatcher
+    from resumematch.parser import ResumeParser
 
 __all__ = [
     "ResumeAnalyzer",
     "ResumeMatcher",
     "ResumeParser",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ResumeAnalyzer": "resumematch.core.analyzer",
+    "ResumeMatcher": "resumematch.matcher.resume_matcher",
+    "ResumeParser": "resumematch.parser.resume_parser",
+})
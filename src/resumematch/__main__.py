@@ -0,0 +1,7 @@
+"""Allow ``python -m resumematch``."""
+
+import sys
+
+from resumematch.cli import main
+
+sys.exit(main())
@@ -0,0 +1,37 @@
+"""Helpers for lazily resolved package attributes."""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module-level ``__getattr__`` and ``__dir__`` of a package.
+
+    Each exported name is imported from its defining module the first time
+    it is accessed and then cached in the package namespace, so importing
+    the package itself stays cheap.
+
+    Args:
+        package: Name of the package (its ``__name__``).
+        exports: Mapping of exported name to the module defining it.
+
+    Returns:
+        ``(__getattr__, __dir__)`` functions for the package.
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
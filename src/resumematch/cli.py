@@ -0,0 +1,56 @@
+"""Command-line interface: ``resumematch <command>``."""
+
+import argparse
+from typing import List, Optional
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the command-line interface.
+
+    Args:
+        argv: Arguments (defaults to ``sys.argv[1:]``).
+
+    Returns:
+        Process exit status.
+    """
+    from resumematch import __version__
+
+    parser = argparse.ArgumentParser(prog="resumematch")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser(
+        "serve", help="keep the parser, matcher and index warm behind a local RPC endpoint"
+    )
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--socket", help="listen on this Unix socket instead of TCP")
+    serve.add_argument("--max-batch", type=int, default=64,
+                       help="maximum requests executed as one batch")
+    serve.add_argument("--max-wait-ms", type=float, default=2.0,
+                       help="time to wait for a batch to fill")
+    serve.add_argument("--parse-cache", help="path of a persistent parse cache")
+    serve.add_argument("--index", nargs="*", default=[], metavar="RESUME",
+                       help="resume files to parse and index for top_k at startup")
+
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        return _serve(args)
+    return 2
+
+
+def _serve(args: argparse.Namespace) -> int:
+    from resumematch.core.analyzer import ResumeAnalyzer
+    from resumematch.server import ResumeService, serve
+
+    config = {"parse_cache_path": args.parse_cache} if args.parse_cache else None
+    service = ResumeService(
+        ResumeAnalyzer(config), max_batch=args.max_batch, max_wait=args.max_wait_ms / 1000
+    )
+    for path in args.index:
+        service.index.add(path, service.analyzer.parser.parse(path))
+    where = args.socket or f"http://{args.host}:{args.port}"
+    print(f"resumematch serving {len(service.index)} indexed resumes on {where}", flush=True)
+    serve(service, args.host, args.port, args.socket)
+    return 0
@@ -1,5 +1,14 @@
 """Core functionality for resume analysis."""
 
-from resumematch.core.analyzer import ResumeAnalyzer
+from typing import TYPE_CHECKING
+
+from resumematch._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from resumematch.core.analyzer import ResumeAnalyzer
 
 __all__ = ["ResumeAnalyzer"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ResumeAnalyzer": "resumematch.core.analyzer",
+})
@@ -1,7 +1,16 @@
 """Resume analysis core functionality."""
 
-from typing import Dict, Any, Optional
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterable, AsyncIterator, Dict, Iterable, Optional, Set, Union
+)
 from resumematch import __version__
+from resumematch.matcher import CompiledJob, ResumeMatcher
+from resumematch.parser import ResumeParser
+from resumematch.utils.profiling import NULL_TIMER, StageTimer
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
 
 
 class ResumeAnalyzer:
@@ -13,25 +22,66 @@ class ResumeAnalyzer:
     
     Attributes:
         config: Configuration dictionary for the analyzer.
+        parser: ResumeParser used to read resume files.
+        matcher: ResumeMatcher used for keyword extraction and scoring.
+        executor: Executor running the blocking work of the async API
+                 (None means the event loop's default thread pool).
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        executor: Optional["Executor"] = None,
+    ):
         """
         Initialize the ResumeAnalyzer.
         
         Args:
             config: Optional configuration dictionary. If not provided,
-                   default configuration will be used.
+                   default configuration will be used. Recognized keys:
+                       - parse_cache_path: Enables a persistent ParseCache
+                         at this location, so repeat analyses of an
+                         unchanged file skip re-parsing.
+                       - parse_cache_max_bytes: Size cap of that cache.
+                       - profile: If True, ``analyze`` results include a
+                         ``timings`` breakdown in seconds per stage.
+                       - metrics_sink: Callable receiving
+                         ``(stage, seconds)`` for every timed stage of
+                         every analysis, e.g. ``MetricsRegistry.observe``.
+                         Setting it also enables stage timing.
+            executor: Optional executor for ``analyze_async``. Use a
+                     ProcessPoolExecutor to spread CPU-bound parsing over
+                     cores; the default is the loop's thread pool.
         """
         self.config = config or {}
+        
+        cache = None
+        if self.config.get("parse_cache_path"):
+            from resumematch.parser.cache import DEFAULT_MAX_BYTES, ParseCache
+            
+            cache = ParseCache(
+                self.config["parse_cache_path"],
+                max_bytes=self.config.get("parse_cache_max_bytes", DEFAULT_MAX_BYTES),
+            )
+        self.parser = ResumeParser(cache=cache)
+        self.matcher = ResumeMatcher()
+        self.executor = executor
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["executor"] = None
+        return state
     
-    def analyze(self, resume_path: str, job_description: Optional[str] = None) -> Dict[str, Any]:
+    def analyze(
+        self, resume_path: str, job_description: Optional[Union[str, CompiledJob]] = None
+    ) -> Dict[str, Any]:
         """
         Analyze a resume and optionally match it against a job description.
         
         Args:
             resume_path: Path to the resume file (PDF, DOCX, or TXT).
-            job_description: Optional job description text to match against.
+            job_description: Optional job description text (or CompiledJob)
+                            to match against.
         
         Returns:
             Dictionary containing analysis results including:
@@ -39,18 +89,150 @@ class ResumeAnalyzer:
                 - keywords: Extracted keywords
                 - recommendations: List of improvement suggestions
                 - ats_score: ATS compatibility score
+                - timings: Seconds spent per pipeline stage (only with the
+                  ``profile`` config option)
         
         Raises:
             FileNotFoundError: If the resume file doesn't exist.
             ValueError: If the file format is not supported.
         """
-        # Placeholder implementation
-        return {
-            "overall_score": 0.0,
-            "keywords": [],
-            "recommendations": [],
-            "ats_score": 0.0,
-        }
+        timer = self._new_timer()
+        with timer.stage("total"):
+            resume_data = self.parser.parse(resume_path, timer=timer)
+            with timer.stage("keywords"):
+                keywords = self.matcher.extract_keywords(resume_data.get("raw_text", ""))
+            with timer.stage("ats_score"):
+                ats_score = self.matcher.calculate_ats_score(resume_data)
+            result = {
+                "overall_score": 0.0,
+                "keywords": keywords,
+                "recommendations": [],
+                "ats_score": ats_score,
+            }
+            
+            if job_description:
+                match_results = self.matcher.match(resume_data, job_description, timer=timer)
+                result["overall_score"] = match_results["overall_score"]
+                result["recommendations"] = match_results["recommendations"]
+        
+        if self.config.get("profile"):
+            result["timings"] = timer.timings
+        return result
+    
+    async def analyze_async(
+        self,
+        resume_path: str,
+        job_description: Optional[Union[str, CompiledJob]] = None,
+        executor: Optional["Executor"] = None,
+    ) -> Dict[str, Any]:
+        """
+        Analyze a resume without blocking the event loop.
+        
+        File reads, text extraction and scoring all run on an executor, so
+        the calling coroutine only awaits the result.
+        
+        Args:
+            resume_path: Path to the resume file (PDF, DOCX, RTF or TXT).
+            job_description: Optional job description text (or CompiledJob)
+                            to match against.
+            executor: Executor to use instead of ``self.executor``.
+        
+        Returns:
+            Dictionary of analysis results, as returned by ``analyze``.
+        
+        Raises:
+            FileNotFoundError: If the resume file doesn't exist.
+            ValueError: If the file format is not supported.
+        """
+        # Imported here: asyncio is slow to import and synchronous callers
+        # never need it.
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor or self.executor, self.analyze, resume_path, job_description
+        )
+    
+    async def analyze_many_async(
+        self,
+        resume_paths: Union[Iterable[str], AsyncIterable[str]],
+        job_description: Optional[str] = None,
+        concurrency: int = 8,
+        executor: Optional["Executor"] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Analyze many resumes concurrently, yielding results as they finish.
+        
+        The job description is compiled once for the whole batch. At most
+        ``concurrency`` analyses are in flight, and the next path is only
+        pulled from ``resume_paths`` while a slot is free, so a slow
+        consumer or a huge input applies backpressure instead of queueing
+        unbounded work. Pulling the next path and waiting for analyses
+        happen concurrently, so a result is yielded as soon as it is
+        ready even while the input is slow to produce a path. A failing
+        resume is reported inline and does not stop the batch.
+        
+        Args:
+            resume_paths: Iterable or async iterable of resume file paths.
+            job_description: Optional job description text to match against.
+            concurrency: Maximum number of analyses in flight.
+            executor: Executor to use instead of ``self.executor``.
+        
+        Yields:
+            One dictionary per resume, in completion order, containing
+            ``resume_path`` and either ``analysis`` (the ``analyze``
+            result) or ``error`` (the message of the raised exception).
+        
+        Raises:
+            ValueError: If concurrency is less than 1.
+        """
+        import asyncio
+        
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        
+        job = self.matcher.compile_job(job_description) if job_description else None
+        paths = _aiter(resume_paths)
+        pending: Set["asyncio.Future[Dict[str, Any]]"] = set()
+        pull: Optional["asyncio.Future[Optional[str]]"] = None
+        exhausted = False
+        
+        async def run(path: str) -> Dict[str, Any]:
+            try:
+                analysis = await self.analyze_async(path, job, executor)
+                return {"resume_path": path, "analysis": analysis}
+            except Exception as e:
+                return {"resume_path": path, "error": str(e)}
+        
+        try:
+            while True:
+                if pull is None and not exhausted and len(pending) < concurrency:
+                    pull = asyncio.ensure_future(_anext(paths))
+                waiting = pending if pull is None else pending | {pull}
+                if not waiting:
+                    break
+                
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                if pull is not None and pull in done:
+                    path = pull.result()
+                    pull = None
+                    if path is None:
+                        exhausted = True
+                    else:
+                        pending.add(asyncio.ensure_future(run(path)))
+                for task in done & pending:
+                    pending.discard(task)
+                    yield task.result()
+        finally:
+            for task in pending if pull is None else pending | {pull}:
+                task.cancel()
+    
+    def _new_timer(self) -> StageTimer:
+        """Return a fresh StageTimer if profiling is configured, else the null timer."""
+        sink = self.config.get("metrics_sink")
+        if sink is None and not self.config.get("profile"):
+            return NULL_TIMER
+        return StageTimer(sink=sink)
     
     def get_version(self) -> str:
         """
@@ -60,3 +242,21 @@ class ResumeAnalyzer:
             Version string.
         """
         return __version__
+
+
+async def _anext(paths: AsyncIterator[str]) -> Optional[str]:
+    """Return the next path, or None once the iterator is exhausted."""
+    try:
+        return await paths.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+async def _aiter(items: Union[Iterable[str], AsyncIterable[str]]) -> AsyncIterator[str]:
+    """Iterate a sync or async iterable asynchronously."""
+    if hasattr(items, "__aiter__"):
+        async for item in items:  # type: ignore[union-attr]
+            yield item
+    else:
+        for item in items:  # type: ignore[union-attr]
+            yield item
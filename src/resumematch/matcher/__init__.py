@@ -1,5 +1,30 @@
 """Resume and job description matching functionality."""
 
-from resumematch.matcher.resume_matcher import ResumeMatcher
+from typing import TYPE_CHECKING
 
-__all__ = ["ResumeMatcher"]
+from resumematch._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from resumematch.matcher.cascade import MatchCascade
+    from resumematch.matcher.compiled_job import CompiledJob
+    from resumematch.matcher.incremental import IncrementalScorer
+    from resumematch.matcher.index import ResumeIndex
+    from resumematch.matcher.resume_matcher import ResumeMatcher
+    from resumematch.matcher.semantic import HashingEmbedder, SemanticIndex
+    from resumematch.matcher.shared_corpus import SharedCorpus
+
+__all__ = [
+    "CompiledJob", "HashingEmbedder", "IncrementalScorer", "MatchCascade", "ResumeIndex",
+    "ResumeMatcher", "SemanticIndex", "SharedCorpus",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "CompiledJob": "resumematch.matcher.compiled_job",
+    "HashingEmbedder": "resumematch.matcher.semantic",
+    "IncrementalScorer": "resumematch.matcher.incremental",
+    "MatchCascade": "resumematch.matcher.cascade",
+    "ResumeIndex": "resumematch.matcher.index",
+    "ResumeMatcher": "resumematch.matcher.resume_matcher",
+    "SemanticIndex": "resumematch.matcher.semantic",
+    "SharedCorpus": "resumematch.matcher.shared_corpus",
+})
@@ -0,0 +1,118 @@
+"""ATS (Applicant Tracking System) compatibility checks, computed column-wise."""
+
+import re
+from array import array
+from typing import Any, Dict, Iterable, List
+
+from resumematch.utils.skills import SkillAutomaton
+from resumematch.utils.text_utils import tokenize
+
+# Points awarded per check; each check yields a fraction in [0, 1].
+ATS_WEIGHTS: Dict[str, float] = {
+    "sections": 30.0,
+    "contact": 20.0,
+    "keywords": 20.0,
+    "length": 15.0,
+    "dates": 15.0,
+}
+
+# Word counts scoring full length points.
+MIN_WORDS = 200
+MAX_WORDS = 1000
+
+# Distinct known skills earning full keyword points.
+TARGET_SKILLS = 8
+
+# Heading lines and the section each one opens.
+_SECTIONS = {
+    "summary": "summary", "profile": "summary", "objective": "summary",
+    "experience": "experience", "work experience": "experience",
+    "professional experience": "experience", "employment history": "experience",
+    "education": "education",
+    "skills": "skills", "technical skills": "skills",
+}
+_HEADING_RE = re.compile(
+    r"^[ \t]*(" + "|".join(sorted(map(re.escape, _SECTIONS), key=len, reverse=True))
+    + r")[ \t]*:?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+_REQUIRED_SECTIONS = frozenset(_SECTIONS.values())
+
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_PHONE_RE = re.compile(r"(?:\+\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)|\d{2,4})[\s.-]?\d{3,4}[\s.-]?\d{3,4}")
+
+# Leftmost match wins, so "Mar 2021 - Present" counts once, as month-year.
+_DATE_RE = re.compile(
+    r"\b(?P<month_year>(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+    r"\s+(?:19|20)\d{2})\b"
+    r"|\b(?P<numeric>(?:0?[1-9]|1[0-2])/(?:19|20)\d{2})\b"
+    r"|\b(?P<year_range>(?:19|20)\d{2}\s*[-–]\s*(?:(?:19|20)\d{2}|present))\b",
+    re.IGNORECASE,
+)
+
+
+def ats_features(resumes: Iterable[Any], skills: SkillAutomaton) -> Dict[str, array]:
+    """
+    Extract the ATS checks of many resumes as feature columns.
+
+    Args:
+        resumes: Parsed resume data (dictionaries or ParsedResume).
+        skills: SkillAutomaton recognizing known skills.
+
+    Returns:
+        Mapping of each check in ``ATS_WEIGHTS`` to a column (typecode
+        ``"d"``) holding one fraction in [0, 1] per resume:
+            - sections: share of summary/experience/education/skills
+              headings present
+            - contact: share of email and phone found
+            - keywords: distinct known skills relative to TARGET_SKILLS
+            - length: 1.0 within MIN_WORDS..MAX_WORDS, decreasing outside
+            - dates: 1.0 if dates use one format, 0.5 if mixed, else 0.0
+    """
+    columns = {name: array("d") for name in ATS_WEIGHTS}
+    sections, contact = columns["sections"].append, columns["contact"].append
+    keywords, length, dates = (
+        columns["keywords"].append, columns["length"].append, columns["dates"].append
+    )
+    for resume_data in resumes:
+        text = resume_data.get("raw_text", "")
+        contact_info = resume_data.get("contact_info") or {}
+
+        found = {_SECTIONS[m.lower()] for m in _HEADING_RE.findall(text)}
+        sections(len(found) / len(_REQUIRED_SECTIONS))
+
+        has_email = bool(contact_info.get("email")) or _EMAIL_RE.search(text) is not None
+        has_phone = bool(contact_info.get("phone")) or _PHONE_RE.search(text) is not None
+        contact((has_email + has_phone) / 2)
+
+        names = set(skills.find(text))
+        for skill in resume_data.get("skills", []):
+            names.update(skills.find(str(skill)))
+        keywords(min(1.0, len(names) / TARGET_SKILLS))
+
+        words = len(tokenize(text))
+        if words < MIN_WORDS:
+            length(words / MIN_WORDS)
+        else:
+            length(max(0.0, 1.0 - max(0, words - MAX_WORDS) / MAX_WORDS))
+
+        styles = {m.lastgroup for m in _DATE_RE.finditer(text)}
+        dates(0.0 if not styles else 1.0 if len(styles) == 1 else 0.5)
+    return columns
+
+
+def ats_scores(columns: Dict[str, array]) -> List[float]:
+    """
+    Combine feature columns into ATS scores.
+
+    Args:
+        columns: Feature columns from ``ats_features``.
+
+    Returns:
+        One score (0-100, rounded to 2 decimals) per resume.
+    """
+    totals: Iterable[float] = ()
+    for i, (name, weight) in enumerate(ATS_WEIGHTS.items()):
+        scaled = [weight * value for value in columns[name]]
+        totals = scaled if not i else list(map(float.__add__, totals, scaled))
+    return [round(total, 2) for total in totals]
@@ -0,0 +1,329 @@
+"""Multi-stage pre-filter cascade in front of full resume matching."""
+
+import re
+from datetime import date
+from typing import (
+    TYPE_CHECKING, Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple,
+)
+
+from resumematch.matcher.compiled_job import CompiledJob
+from resumematch.parser.models import ParsedResume, SkillVocabulary, default_vocabulary
+
+if TYPE_CHECKING:
+    from resumematch.matcher.resume_matcher import JobDescription, ResumeData, ResumeMatcher
+
+# Stage names, in evaluation order.
+STAGES = ("skills", "constraints", "match")
+
+# Education level of each degree family, for ``min_education``.
+EDUCATION_LEVELS: Dict[str, int] = {"associate": 1, "bachelor": 2, "master": 3, "doctorate": 4}
+
+_LEVEL_RE = re.compile(
+    r"\b(?:(?P<doctorate>ph\.?\s?d|doctor(?:ate)?)"
+    r"|(?P<master>master|mba|m\.?\s?sc|m\.?\s?eng|m\.\s?[sa]\.?)"
+    r"|(?P<bachelor>bachelor|b\.?\s?sc|b\.?\s?eng|b\.\s?[sa]\.?)"
+    r"|(?P<associate>associate|diploma))(?![a-z])",
+    re.IGNORECASE,
+)
+_MONTHS = {
+    name: i for i, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), 1
+    )
+}
+_DATE_RE = re.compile(
+    r"(?:(?P<name>[a-z]{3})[a-z]*\.?\s+|(?P<month>0?[1-9]|1[0-2])/)?(?P<year>(?:19|20)\d{2})",
+    re.IGNORECASE,
+)
+_CURRENT = ("present", "current", "now")
+
+
+def skill_mask(resume_data: "ResumeData", vocabulary: SkillVocabulary) -> int:
+    """
+    Build the skill bitmap of a resume.
+
+    Args:
+        resume_data: Parsed resume data (dictionary or ParsedResume).
+        vocabulary: Vocabulary assigning bit positions to skill names.
+
+    Returns:
+        Integer with bit i set when the resume lists skill id i. Skills
+        unknown to the vocabulary are ignored.
+    """
+    if isinstance(resume_data, ParsedResume) and resume_data.vocabulary is vocabulary:
+        ids: Iterable[Optional[int]] = resume_data.skill_ids
+    else:
+        ids = map(vocabulary.id_of, resume_data.get("skills", []))
+    mask = 0
+    for skill_id in ids:
+        if skill_id is not None:
+            mask |= 1 << skill_id
+    return mask
+
+
+def experience_years(entries: Sequence[Dict[str, Any]], today: Optional[date] = None) -> float:
+    """
+    Total years covered by work history entries.
+
+    Overlapping positions are counted once. Dates without a month count
+    from January; ``Present`` and similar end dates mean ``today``.
+
+    Args:
+        entries: ``work_experience`` dictionaries with ``start_date``
+                and ``end_date``.
+        today: Date used for open-ended positions (default: today).
+
+    Returns:
+        Years of experience; entries with unreadable dates are skipped.
+    """
+    today = today or date.today()
+    now = today.year + (today.month - 1) / 12
+    spans = []
+    for entry in entries:
+        start = _date_value(entry.get("start_date", ""))
+        end_text = str(entry.get("end_date", "")).strip().lower()
+        end = now if end_text in _CURRENT else _date_value(end_text)
+        if start is not None and end is not None and end >= start:
+            spans.append((start, end))
+    total = 0.0
+    reach = float("-inf")
+    for start, end in sorted(spans):
+        if end > reach:
+            total += end - max(start, reach)
+            reach = end
+    return total
+
+
+def education_level(entries: Sequence[Dict[str, Any]]) -> int:
+    """
+    Highest education level among education entries.
+
+    Args:
+        entries: ``education`` dictionaries with a ``degree``.
+
+    Returns:
+        Value from ``EDUCATION_LEVELS``, or 0 if no degree is recognized.
+    """
+    level = 0
+    for entry in entries:
+        for match in _LEVEL_RE.finditer(str(entry.get("degree", ""))):
+            level = max(level, EDUCATION_LEVELS[match.lastgroup])
+    return level
+
+
+class MatchCascade:
+    """
+    Cheap filters that reject resumes before full matching.
+
+    Stage ``skills`` keeps resumes listing every required skill: required
+    skills and each resume's skills are bitmaps over vocabulary ids, so
+    the test is one integer AND. Stage ``constraints`` applies numeric
+    filters on years of experience and education level. Only survivors
+    reach stage ``match``, the full ``ResumeMatcher`` keyword scoring.
+    Every stage counts the resumes it sees and passes, so thresholds can
+    be tuned from ``snapshot()``.
+
+    Attributes:
+        matcher: ResumeMatcher used for the final stage.
+        job: Compiled job description.
+        required_skills: Skill names every resume must list.
+        min_years: Minimum years of experience.
+        min_education: Minimum education level name, or None.
+        vocabulary: Vocabulary assigning bit positions to skills.
+    """
+
+    def __init__(
+        self,
+        job_description: "JobDescription",
+        matcher: Optional["ResumeMatcher"] = None,
+        required_skills: Optional[Iterable[str]] = None,
+        min_years: float = 0.0,
+        min_education: Optional[str] = None,
+        vocabulary: Optional[SkillVocabulary] = None,
+        today: Optional[date] = None,
+    ):
+        """
+        Initialize the MatchCascade.
+
+        Args:
+            job_description: Job description text or CompiledJob.
+            matcher: Optional ResumeMatcher (a default one is created).
+            required_skills: Skill names every resume must list. Defaults
+                            to the known skills on the job's requirement
+                            lines (``CompiledJob.required_keywords``). A
+                            name missing from the vocabulary rejects
+                            every resume at stage ``skills``.
+            min_years: Minimum years of experience (0 disables the check).
+            min_education: Minimum level from ``EDUCATION_LEVELS``, e.g.
+                          ``"bachelor"``, or None to disable the check.
+            vocabulary: Skill vocabulary (default: ``default_vocabulary()``).
+            today: Date used for open-ended positions (default: today).
+
+        Raises:
+            ValueError: If min_education is not a known level.
+        """
+        if matcher is None:
+            from resumematch.matcher.resume_matcher import ResumeMatcher
+
+            matcher = ResumeMatcher()
+        if min_education is not None and min_education not in EDUCATION_LEVELS:
+            raise ValueError(
+                f"Unknown education level {min_education!r}; "
+                f"expected one of {', '.join(EDUCATION_LEVELS)}"
+            )
+        self.matcher = matcher
+        self.job: CompiledJob = matcher.compile_job(job_description)
+        self.vocabulary = vocabulary if vocabulary is not None else default_vocabulary()
+        if required_skills is None:
+            required = set(self.job.required_keywords)
+            required_skills = [name for name in self.vocabulary.names if name.lower() in required]
+        self.required_skills: List[str] = list(required_skills)
+        self.min_years = min_years
+        self.min_education = min_education
+        self.today = today
+        # A required skill unknown to the vocabulary is in no resume's
+        # bitmap, so no resume can pass; the shared vocabulary is not grown.
+        self._required_mask = 0
+        self._unsatisfiable = False
+        for name in self.required_skills:
+            skill_id = self.vocabulary.id_of(name)
+            if skill_id is None:
+                self._unsatisfiable = True
+            else:
+                self._required_mask |= 1 << skill_id
+        self._min_level = EDUCATION_LEVELS[min_education] if min_education else 0
+        self._seen = dict.fromkeys(STAGES, 0)
+        self._passed = dict.fromkeys(STAGES, 0)
+
+    def accepts(self, resume_data: "ResumeData") -> Optional[str]:
+        """
+        Run the filter stages on one resume.
+
+        Args:
+            resume_data: Parsed resume data.
+
+        Returns:
+            None if the resume passes, otherwise the name of the stage
+            that rejected it.
+        """
+        self._seen["skills"] += 1
+        required = self._required_mask
+        if self._unsatisfiable or (
+            required and skill_mask(resume_data, self.vocabulary) & required != required
+        ):
+            return "skills"
+        self._passed["skills"] += 1
+
+        self._seen["constraints"] += 1
+        if self.min_years and (
+            experience_years(resume_data.get("work_experience", []), self.today)
+            < self.min_years
+        ):
+            return "constraints"
+        if self._min_level and education_level(resume_data.get("education", [])) < self._min_level:
+            return "constraints"
+        self._passed["constraints"] += 1
+        return None
+
+    def filter(
+        self, resumes: Iterable[Tuple[Hashable, "ResumeData"]]
+    ) -> Iterator[Tuple[Hashable, "ResumeData"]]:
+        """
+        Lazily drop resumes rejected by the filter stages.
+
+        Args:
+            resumes: Iterable of ``(resume_id, resume_data)`` pairs.
+
+        Yields:
+            The pairs that pass, in input order.
+        """
+        for resume_id, resume_data in resumes:
+            if self.accepts(resume_data) is None:
+                yield resume_id, resume_data
+
+    def match(
+        self, resumes: Iterable[Tuple[Hashable, "ResumeData"]], min_score: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Filter resumes, then fully match the survivors.
+
+        Args:
+            resumes: Iterable of ``(resume_id, resume_data)`` pairs.
+            min_score: Minimum ``overall_score`` a match result needs to
+                      pass the ``match`` stage.
+
+        Returns:
+            Match result dictionaries (see ``ResumeMatcher.match``) with an
+            added ``resume_id``, for the survivors at or above min_score,
+            in input order.
+        """
+        survivors = list(self.filter(resumes))
+        results = self.matcher.match_many([data for _, data in survivors], self.job)
+        self._seen["match"] += len(results)
+        ranked = []
+        for (resume_id, _), result in zip(survivors, results):
+            if result["overall_score"] >= min_score:
+                ranked.append(dict(resume_id=resume_id, **result))
+        self._passed["match"] += len(ranked)
+        return ranked
+
+    def rank(
+        self,
+        resumes: Iterable[Tuple[Hashable, "ResumeData"]],
+        k: int = 10,
+        threshold: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Filter a stream of resumes and keep the best k survivors.
+
+        Survivors are fed lazily to ``ResumeMatcher.rank``, so memory stays
+        O(k). The ``match`` stage counts the survivors scored and the
+        results returned.
+
+        Args:
+            resumes: Iterable of ``(resume_id, resume_data)`` pairs.
+            k: Number of results kept.
+            threshold: Optional minimum ``overall_score``.
+
+        Returns:
+            Results as documented on ``ResumeMatcher.rank``.
+        """
+        before = self._passed["constraints"]
+        ranked = self.matcher.rank(self.filter(resumes), self.job, k, threshold)
+        self._seen["match"] += self._passed["constraints"] - before
+        self._passed["match"] += len(ranked)
+        return ranked
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize the stage counters.
+
+        Returns:
+            Mapping of stage name to ``seen``, ``passed`` and ``pass_rate``
+            (passed / seen, 0.0 before any resume), in stage order.
+        """
+        return {
+            stage: {
+                "seen": self._seen[stage],
+                "passed": self._passed[stage],
+                "pass_rate": self._passed[stage] / self._seen[stage] if self._seen[stage] else 0.0,
+            }
+            for stage in STAGES
+        }
+
+    def reset(self) -> None:
+        """Zero the stage counters."""
+        self._seen = dict.fromkeys(STAGES, 0)
+        self._passed = dict.fromkeys(STAGES, 0)
+
+
+def _date_value(text: str) -> Optional[float]:
+    """Read "Mar 2019", "03/2019" or "2019" as a fractional year."""
+    match = _DATE_RE.search(str(text))
+    if match is None:
+        return None
+    month = 1
+    if match.group("name"):
+        month = _MONTHS.get(match.group("name").lower(), 1)
+    elif match.group("month"):
+        month = int(match.group("month"))
+    return int(match.group("year")) + (month - 1) / 12
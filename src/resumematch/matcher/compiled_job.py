@@ -0,0 +1,147 @@
+"""Precomputed representation of a job description."""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Lines mentioning any of these words list hard requirements.
+_REQUIRED_LINE_RE = re.compile(r"\b(?:required|requirements?|must|mandatory|need)\b", re.I)
+
+# Headings whose section lists hard requirements, in addition to the markers above.
+_REQUIRED_HEADING_RE = re.compile(r"\b(?:qualifications|what you bring)\b", re.I)
+
+# A short heading line: "Requirements:", "## Qualifications", "**Must have**".
+_HEADING_RE = re.compile(
+    r"\s*(?:#+\s*(?P<title>[^#\n]+?)|[*_]*(?P<label>[^:*_\n]+?):?[*_]*:?)\s*"
+)
+
+# Headings have at most this many words.
+_MAX_HEADING_WORDS = 6
+
+
+class CompiledJob:
+    """
+    A job description reduced once to everything matching needs.
+
+    Build instances with ``ResumeMatcher.compile_job`` rather than
+    directly; the matcher memoizes them by text hash. Required skills
+    and matched keywords are represented as integer bitmaps over keyword
+    positions, so set tests are single integer operations.
+
+    Attributes:
+        text_hash: Hex digest of the source job description.
+        keywords: Job keywords in order of first appearance.
+        positions: Mapping of keyword to its bit position.
+        weights: Relative frequency of each keyword in the posting, with
+                the most frequent keyword weighted 1.0.
+        required_mask: Bitmap of keywords that appear on requirement lines
+                      (lines mentioning "required", "must", ...).
+    """
+
+    __slots__ = ("text_hash", "keywords", "positions", "weights", "required_mask")
+
+    def __init__(
+        self,
+        text_hash: str,
+        keywords: Iterable[str],
+        counts: Dict[str, int],
+        required: Iterable[str] = (),
+    ):
+        """
+        Initialize the CompiledJob.
+
+        Args:
+            text_hash: Hex digest of the source job description.
+            keywords: Job keywords in order of first appearance.
+            counts: Occurrences of each keyword in the posting.
+            required: Keywords that are hard requirements.
+        """
+        self.text_hash = text_hash
+        self.keywords: Tuple[str, ...] = tuple(keywords)
+        self.positions: Dict[str, int] = {term: i for i, term in enumerate(self.keywords)}
+        top = max(counts.values(), default=1)
+        self.weights: Dict[str, float] = {
+            term: counts.get(term, 1) / top for term in self.keywords
+        }
+        self.required_mask = self.mask_of(required)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __repr__(self) -> str:
+        return f"CompiledJob({self.text_hash[:12]}, {len(self.keywords)} keywords)"
+
+    def mask_of(self, terms: Iterable[str]) -> int:
+        """
+        Build the bitmap of job keywords present in terms.
+
+        Args:
+            terms: Resume terms (other terms are ignored).
+
+        Returns:
+            Integer with bit i set when keyword i occurs in terms.
+        """
+        positions = self.positions
+        mask = 0
+        for term in terms:
+            position = positions.get(term)
+            if position is not None:
+                mask |= 1 << position
+        return mask
+
+    def terms_of(self, mask: int) -> List[str]:
+        """
+        Expand a bitmap back into job keywords, in job order.
+
+        Args:
+            mask: Bitmap as returned by ``mask_of``.
+
+        Returns:
+            List of keywords whose bit is set.
+        """
+        return [term for i, term in enumerate(self.keywords) if mask >> i & 1]
+
+    @property
+    def required_keywords(self) -> List[str]:
+        """Keywords flagged as hard requirements."""
+        return self.terms_of(self.required_mask)
+
+
+def requirement_lines(text: str) -> List[str]:
+    """
+    Return the lines of a job description that state requirements.
+
+    Args:
+        text: Job description text.
+
+    Returns:
+        Lines mentioning a requirement marker such as "required" or "must",
+        and every line under a requirements heading ("Requirements:",
+        "## Qualifications", ...) up to the next heading.
+    """
+    lines = []
+    in_section = False
+    for line in text.splitlines():
+        heading = _heading_title(line)
+        if heading is not None:
+            in_section = bool(
+                _REQUIRED_LINE_RE.search(heading) or _REQUIRED_HEADING_RE.search(heading)
+            )
+        if in_section or _REQUIRED_LINE_RE.search(line):
+            lines.append(line)
+    return lines
+
+
+def _heading_title(line: str) -> Optional[str]:
+    """Return the title of a heading line, or None for other lines."""
+    match = _HEADING_RE.fullmatch(line)
+    if match is None:
+        return None
+    title = match.group("title")
+    if title is None:
+        # Without a markdown marker, only "Title:" lines count as headings.
+        if not line.rstrip().rstrip("*_").endswith(":"):
+            return None
+        title = match.group("label")
+    if len(title.split()) > _MAX_HEADING_WORDS:
+        return None
+    return title
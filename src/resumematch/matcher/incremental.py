@@ -0,0 +1,259 @@
+"""Per-term partial scores for fast re-ranking after job description edits."""
+
+import heapq
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from resumematch.matcher.compiled_job import CompiledJob
+from resumematch.matcher.resume_matcher import JobDescription, ResumeData, ResumeMatcher
+
+# Default number of scored job descriptions kept for delta updates.
+DEFAULT_MAX_JOBS = 16
+
+
+class _JobScores:
+    """Per-resume partial scores of one job description."""
+
+    __slots__ = ("keywords", "matched", "skill_hits")
+
+    def __init__(self, keywords: Tuple[str, ...], matched: array, skill_hits: array):
+        self.keywords = keywords
+        self.matched = matched
+        self.skill_hits = skill_hits
+
+
+class IncrementalScorer:
+    """
+    Applicant pool scored against job descriptions, updated per term.
+
+    ``ResumeMatcher.match`` scores a resume by the number of job keywords
+    it contains, so a resume's score is a sum of per-term contributions.
+    The scorer stores, for every term of every resume, which resumes
+    contain it (as a plain keyword or as a listed skill), and keeps the
+    per-resume sums of each scored job. After a posting is edited,
+    ``rescore_delta`` only visits the resumes containing the keywords
+    that were added or removed, instead of re-matching the whole pool.
+
+    Scores are identical to the ``overall_score`` and ``skill_score`` of
+    ``ResumeMatcher.match``.
+
+    Attributes:
+        matcher: ResumeMatcher used for keyword extraction.
+        max_jobs: Number of scored job descriptions kept for delta updates.
+    """
+
+    def __init__(
+        self, matcher: Optional[ResumeMatcher] = None, max_jobs: int = DEFAULT_MAX_JOBS
+    ):
+        """
+        Initialize an empty IncrementalScorer.
+
+        Args:
+            matcher: Optional ResumeMatcher used to extract keywords.
+            max_jobs: Number of scored job descriptions kept (least
+                     recently used ones are dropped).
+        """
+        self.matcher = matcher or ResumeMatcher()
+        self.max_jobs = max_jobs
+        self._resume_ids: List[Hashable] = []
+        self._rows: Dict[Hashable, int] = {}
+        # Term -> ascending rows containing it, as a keyword or as a skill.
+        self._postings: Dict[str, array] = {}
+        self._skill_postings: Dict[str, array] = {}
+        self._jobs: "OrderedDict[str, _JobScores]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._resume_ids)
+
+    def __contains__(self, resume_id: Hashable) -> bool:
+        return resume_id in self._rows
+
+    def add(self, resume_id: Hashable, resume_data: ResumeData) -> None:
+        """
+        Add a parsed resume to the pool.
+
+        Job descriptions scored earlier are updated to include it.
+
+        Args:
+            resume_id: Caller-chosen identifier returned in rankings.
+            resume_data: Parsed resume data from ResumeParser (dictionary
+                        or ParsedResume).
+
+        Raises:
+            ValueError: If resume_id is already in the pool.
+        """
+        if resume_id in self._rows:
+            raise ValueError(f"Resume already added: {resume_id!r}")
+
+        skill_terms = self.matcher._skill_terms(resume_data.get("skills", []))
+        terms = set(self.matcher.extract_keywords(resume_data.get("raw_text", "")))
+        terms |= skill_terms
+
+        row = len(self._resume_ids)
+        self._resume_ids.append(resume_id)
+        self._rows[resume_id] = row
+        _append_postings(self._postings, terms, row)
+        _append_postings(self._skill_postings, skill_terms, row)
+
+        for scores in self._jobs.values():
+            scores.matched.append(sum(1 for term in scores.keywords if term in terms))
+            scores.skill_hits.append(sum(1 for term in scores.keywords if term in skill_terms))
+
+    def add_many(self, resumes: Iterable[Tuple[Hashable, ResumeData]]) -> None:
+        """
+        Add several parsed resumes to the pool.
+
+        Args:
+            resumes: Iterable of ``(resume_id, resume_data)`` pairs.
+        """
+        for resume_id, resume_data in resumes:
+            self.add(resume_id, resume_data)
+
+    def score(
+        self, job_description: JobDescription, k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank the pool against a job description.
+
+        The per-resume partial scores are computed from the postings of
+        the job's keywords and kept for later ``rescore_delta`` calls.
+
+        Args:
+            job_description: Job description text or CompiledJob.
+            k: Optional maximum number of results.
+
+        Returns:
+            Ranking as documented on ``rescore_delta``.
+        """
+        return self._ranking(self._scores_of(self.matcher.compile_job(job_description)), k)
+
+    def rescore_delta(
+        self,
+        old_job: JobDescription,
+        new_job: JobDescription,
+        k: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Re-rank the pool after a job description was edited.
+
+        Starting from the kept partial scores of old_job, only the
+        contributions of keywords added to or removed from the posting
+        are applied, touching only the resumes that contain them. If
+        old_job was never scored (or has been evicted), new_job is
+        scored from scratch.
+
+        Args:
+            old_job: Previous job description text or CompiledJob.
+            new_job: Edited job description text or CompiledJob.
+            k: Optional maximum number of results.
+
+        Returns:
+            List of dictionaries with ``resume_id``, ``overall_score`` and
+            ``skill_score`` (as computed by ``ResumeMatcher.match``), best
+            match first; ties keep the order resumes were added in.
+        """
+        old = self.matcher.compile_job(old_job)
+        new = self.matcher.compile_job(new_job)
+        base = self._jobs.get(old.text_hash)
+        if base is None or new.text_hash in self._jobs:
+            return self.score(new, k)
+
+        old_terms, new_terms = set(base.keywords), set(new.keywords)
+        matched = array("l", base.matched)
+        skill_hits = array("l", base.skill_hits)
+        _apply(matched, self._postings, new_terms - old_terms, 1)
+        _apply(matched, self._postings, old_terms - new_terms, -1)
+        _apply(skill_hits, self._skill_postings, new_terms - old_terms, 1)
+        _apply(skill_hits, self._skill_postings, old_terms - new_terms, -1)
+
+        scores = _JobScores(new.keywords, matched, skill_hits)
+        self._remember(new.text_hash, scores)
+        return self._ranking(scores, k)
+
+    def contributions(
+        self, resume_id: Hashable, job_description: JobDescription
+    ) -> Dict[str, float]:
+        """
+        Break a resume's overall score down by job keyword.
+
+        Args:
+            resume_id: Identifier of a resume in the pool.
+            job_description: Job description text or CompiledJob.
+
+        Returns:
+            Mapping of each job keyword to the points it adds to the
+            resume's ``overall_score`` (0.0 for missing keywords).
+
+        Raises:
+            KeyError: If resume_id is not in the pool.
+        """
+        row = self._rows[resume_id]
+        keywords = self.matcher.compile_job(job_description).keywords
+        points = 100.0 / len(keywords) if keywords else 0.0
+        return {
+            term: points if _contains(self._postings.get(term), row) else 0.0
+            for term in keywords
+        }
+
+    def _scores_of(self, job: CompiledJob) -> _JobScores:
+        """Return the kept partial scores of a job, computing them if needed."""
+        scores = self._jobs.get(job.text_hash)
+        if scores is not None:
+            self._jobs.move_to_end(job.text_hash)
+            return scores
+        n = len(self._resume_ids)
+        matched = array("l", [0]) * n
+        skill_hits = array("l", [0]) * n
+        _apply(matched, self._postings, job.keywords, 1)
+        _apply(skill_hits, self._skill_postings, job.keywords, 1)
+        scores = _JobScores(job.keywords, matched, skill_hits)
+        self._remember(job.text_hash, scores)
+        return scores
+
+    def _remember(self, text_hash: str, scores: _JobScores) -> None:
+        self._jobs[text_hash] = scores
+        self._jobs.move_to_end(text_hash)
+        while len(self._jobs) > self.max_jobs:
+            self._jobs.popitem(last=False)
+
+    def _ranking(self, scores: _JobScores, k: Optional[int]) -> List[Dict[str, Any]]:
+        """Turn partial scores into a ranking."""
+        total = len(scores.keywords)
+        matched, skill_hits = scores.matched, scores.skill_hits
+        rows: Iterable[int] = range(len(matched))
+        if k is None:
+            rows = sorted(rows, key=matched.__getitem__, reverse=True)
+        else:
+            rows = heapq.nlargest(max(k, 0), rows, key=matched.__getitem__)
+        return [
+            {
+                "resume_id": self._resume_ids[row],
+                "overall_score": round(100.0 * matched[row] / total, 2) if total else 0.0,
+                "skill_score": round(100.0 * skill_hits[row] / total, 2) if total else 0.0,
+            }
+            for row in rows
+        ]
+
+
+def _append_postings(postings: Dict[str, array], terms: Set[str], row: int) -> None:
+    for term in terms:
+        rows = postings.get(term)
+        if rows is None:
+            rows = postings[term] = array("l")
+        rows.append(row)
+
+
+def _apply(counts: array, postings: Dict[str, array], terms: Iterable[str], delta: int) -> None:
+    """Add delta to the count of every row containing one of terms."""
+    for term in terms:
+        for row in postings.get(term, ()):
+            counts[row] += delta
+
+
+def _contains(rows: Optional[array], row: int) -> bool:
+    if rows is None:
+        return False
+    pos = bisect_left(rows, row)
+    return pos < len(rows) and rows[pos] == row
@@ -0,0 +1,278 @@
+"""Inverted index for ranking stored resumes against a job description."""
+
+import heapq
+import math
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from resumematch.matcher.resume_matcher import JobDescription, ResumeData, ResumeMatcher
+from resumematch.utils.text_utils import tokenize
+
+
+class _Postings:
+    """Postings list for a single term, kept sorted by document id."""
+
+    __slots__ = ("doc_ids", "freqs", "max_tf", "min_len")
+
+    def __init__(self):
+        self.doc_ids = array("l")
+        self.freqs = array("d")
+        self.max_tf = 0.0
+        self.min_len = math.inf
+
+    def append(self, doc_id: int, tf: float, doc_len: float) -> None:
+        self.doc_ids.append(doc_id)
+        self.freqs.append(tf)
+        if tf > self.max_tf:
+            self.max_tf = tf
+        if doc_len < self.min_len:
+            self.min_len = doc_len
+
+
+class _Cursor:
+    """Iterator over a postings list used during WAND traversal."""
+
+    __slots__ = ("postings", "pos", "weight", "upper_bound")
+
+    def __init__(self, postings: _Postings, weight: float, upper_bound: float):
+        self.postings = postings
+        self.pos = 0
+        self.weight = weight
+        self.upper_bound = upper_bound
+
+    @property
+    def doc(self) -> float:
+        if self.pos < len(self.postings.doc_ids):
+            return self.postings.doc_ids[self.pos]
+        return math.inf
+
+    def seek(self, doc_id: int) -> None:
+        self.pos = bisect_left(self.postings.doc_ids, doc_id, self.pos)
+
+
+class ResumeIndex:
+    """
+    Inverted index over the keywords and skills of parsed resumes.
+
+    Each resume is reduced to term frequencies over the keywords of its
+    ``raw_text`` plus its ``skills`` (which are boosted), and stored in
+    per-term postings lists. Queries are scored with BM25 and evaluated
+    with the WAND algorithm, so documents that cannot enter the current
+    top-k are skipped without being scored.
+
+    Attributes:
+        matcher: ResumeMatcher used for keyword extraction.
+        k1: BM25 term-frequency saturation parameter.
+        b: BM25 length normalization parameter.
+        skill_boost: Term frequency added for each listed skill.
+    """
+
+    def __init__(
+        self,
+        matcher: Optional[ResumeMatcher] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+        skill_boost: float = 2.0,
+    ):
+        """
+        Initialize an empty ResumeIndex.
+
+        Args:
+            matcher: Optional ResumeMatcher used to extract keywords.
+            k1: BM25 term-frequency saturation parameter.
+            b: BM25 length normalization parameter.
+            skill_boost: Term frequency added for each listed skill.
+        """
+        self.matcher = matcher or ResumeMatcher()
+        self.k1 = k1
+        self.b = b
+        self.skill_boost = skill_boost
+        self._postings: Dict[str, _Postings] = {}
+        self._resume_ids: List[Hashable] = []
+        self._doc_ids: Dict[Hashable, int] = {}
+        self._doc_lens = array("d")
+        self._total_len = 0.0
+
+    def __len__(self) -> int:
+        return len(self._resume_ids)
+
+    def __contains__(self, resume_id: Hashable) -> bool:
+        return resume_id in self._doc_ids
+
+    def add(self, resume_id: Hashable, resume_data: ResumeData) -> None:
+        """
+        Add a parsed resume to the index.
+
+        Args:
+            resume_id: Caller-chosen identifier returned by queries.
+            resume_data: Parsed resume data from ResumeParser (dictionary
+                        or ParsedResume).
+
+        Raises:
+            ValueError: If resume_id is already indexed.
+        """
+        if resume_id in self._doc_ids:
+            raise ValueError(f"Resume already indexed: {resume_id!r}")
+
+        freqs = self._term_frequencies(resume_data)
+        doc_id = len(self._resume_ids)
+        doc_len = sum(freqs.values())
+
+        self._resume_ids.append(resume_id)
+        self._doc_ids[resume_id] = doc_id
+        self._doc_lens.append(doc_len)
+        self._total_len += doc_len
+
+        for term, tf in freqs.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = _Postings()
+            postings.append(doc_id, tf, doc_len)
+
+    def add_many(self, resumes: Iterable[Tuple[Hashable, ResumeData]]) -> None:
+        """
+        Add several parsed resumes to the index.
+
+        Args:
+            resumes: Iterable of ``(resume_id, resume_data)`` pairs.
+        """
+        for resume_id, resume_data in resumes:
+            self.add(resume_id, resume_data)
+
+    def score(self, resume_id: Hashable, job_description: JobDescription) -> float:
+        """
+        Score a single indexed resume against a job description.
+
+        Args:
+            resume_id: Identifier of an indexed resume.
+            job_description: Job description text or CompiledJob.
+
+        Returns:
+            BM25 relevance score (higher is better, 0 if nothing matches).
+
+        Raises:
+            KeyError: If resume_id is not indexed.
+        """
+        doc_id = self._doc_ids[resume_id]
+        total = 0.0
+        for term, weight in self._query_weights(job_description).items():
+            postings = self._postings[term]
+            pos = bisect_left(postings.doc_ids, doc_id)
+            if pos < len(postings.doc_ids) and postings.doc_ids[pos] == doc_id:
+                total += weight * self._saturate(postings.freqs[pos], self._doc_lens[doc_id])
+        return total
+
+    def top_k(self, job_description: JobDescription, k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Return the k resumes that best match a job description.
+
+        Args:
+            job_description: Job description text or CompiledJob.
+            k: Maximum number of results.
+
+        Returns:
+            List of dictionaries with ``resume_id`` and ``score`` keys,
+            best match first. Resumes sharing no keyword with the job
+            description are never returned.
+        """
+        if k <= 0:
+            return []
+
+        cursors = [
+            _Cursor(self._postings[term], weight, weight * self._upper_bound(term))
+            for term, weight in self._query_weights(job_description).items()
+        ]
+        heap: List[Tuple[float, int]] = []
+        threshold = 0.0
+
+        while True:
+            cursors.sort(key=lambda c: c.doc)
+            pivot = self._find_pivot(cursors, threshold if len(heap) >= k else -1.0)
+            if pivot is None:
+                break
+
+            pivot_doc = cursors[pivot].doc
+            if cursors[0].doc == pivot_doc:
+                doc_len = self._doc_lens[pivot_doc]
+                total = 0.0
+                for cursor in cursors:
+                    if cursor.doc != pivot_doc:
+                        break
+                    tf = cursor.postings.freqs[cursor.pos]
+                    total += cursor.weight * self._saturate(tf, doc_len)
+                    cursor.pos += 1
+
+                entry = (total, -pivot_doc)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+                if len(heap) >= k:
+                    threshold = heap[0][0]
+            else:
+                for cursor in cursors[:pivot]:
+                    cursor.seek(pivot_doc)
+
+        return [
+            {"resume_id": self._resume_ids[-neg_doc], "score": total}
+            for total, neg_doc in sorted(heap, reverse=True)
+        ]
+
+    @staticmethod
+    def _find_pivot(cursors: List[_Cursor], threshold: float) -> Optional[int]:
+        """Return the first cursor whose cumulative upper bound beats threshold."""
+        bound = 0.0
+        for i, cursor in enumerate(cursors):
+            if cursor.doc == math.inf:
+                return None
+            bound += cursor.upper_bound
+            if bound > threshold:
+                return i
+        return None
+
+    def _term_frequencies(self, resume_data: ResumeData) -> Dict[str, float]:
+        """Count indexed terms of a resume, boosting listed skills."""
+        freqs: Dict[str, float] = {}
+        raw_text = resume_data.get("raw_text", "")
+        keywords = set(self.matcher.extract_keywords(raw_text))
+        for token in tokenize(raw_text):
+            if token in keywords:
+                freqs[token] = freqs.get(token, 0.0) + 1.0
+
+        # Skills named through synonyms or several words are not plain tokens.
+        skills = self.matcher.skills
+        mentions: Dict[str, float] = {}
+        for _, _, skill_id in skills.iter_matches(raw_text):
+            term = skills.names[skill_id].lower()
+            mentions[term] = mentions.get(term, 0.0) + 1.0
+        for term, count in mentions.items():
+            freqs[term] = max(freqs.get(term, 0.0), count)
+
+        for skill in resume_data.get("skills", []):
+            for term in self.matcher.extract_keywords(str(skill)):
+                freqs[term] = freqs.get(term, 0.0) + self.skill_boost
+        return freqs
+
+    def _query_weights(self, job_description: JobDescription) -> Dict[str, float]:
+        """Map each indexed job keyword to its inverse document frequency."""
+        n_docs = len(self._resume_ids)
+        weights = {}
+        for term in self.matcher.compile_job(job_description).keywords:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            df = len(postings.doc_ids)
+            weights[term] = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+        return weights
+
+    def _saturate(self, tf: float, doc_len: float) -> float:
+        """BM25 term-frequency component for one posting."""
+        avg_len = self._total_len / len(self._resume_ids) if self._resume_ids else 0.0
+        norm = 1.0 - self.b + (self.b * doc_len / avg_len if avg_len else 0.0)
+        return tf * (self.k1 + 1.0) / (tf + self.k1 * norm)
+
+    def _upper_bound(self, term: str) -> float:
+        """Largest saturated term frequency any posting of term can reach."""
+        postings = self._postings[term]
+        return self._saturate(postings.max_tf, postings.min_len)
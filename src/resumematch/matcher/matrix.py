@@ -0,0 +1,267 @@
+"""Many-to-many matching of resume sets against job sets."""
+
+import heapq
+import json
+from itertools import islice
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING, Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from resumematch.matcher.resume_matcher import ResumeData, ResumeMatcher
+
+# Default number of resumes scored per task.
+DEFAULT_BLOCK_SIZE = 256
+
+# Default number of jobs per tile within a task.
+DEFAULT_JOB_BLOCK = 256
+
+# Ranked hit: (score, negated index) so ties favour the earlier item.
+_Hit = Tuple[float, int]
+
+try:
+    _popcount = int.bit_count  # type: ignore[attr-defined]
+except AttributeError:  # Python < 3.10
+    def _popcount(value: int) -> int:
+        return bin(value).count("1")
+
+
+class _MatrixState:
+    """Job side of the matrix, shared by every task."""
+
+    def __init__(
+        self,
+        matcher: "ResumeMatcher",
+        job_masks: Sequence[int],
+        job_sizes: Sequence[int],
+        positions: Dict[str, int],
+        k: int,
+        job_block: int,
+    ):
+        self.matcher = matcher
+        self.job_masks = job_masks
+        self.job_sizes = job_sizes
+        self.positions = positions
+        self.k = k
+        self.job_block = job_block
+
+
+# State of a worker process, set by _init_worker.
+_WORKER_STATE: Optional[_MatrixState] = None
+
+
+def match_matrix(
+    resumes: Iterable[Tuple[Hashable, "ResumeData"]],
+    jobs: Union[Dict[Hashable, str], Iterable[Tuple[Hashable, str]]],
+    out_dir: Union[str, Path],
+    k: int = 10,
+    workers: int = 1,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    job_block: int = DEFAULT_JOB_BLOCK,
+    max_in_flight: int = 0,
+    matcher: Optional["ResumeMatcher"] = None,
+) -> Dict[str, Any]:
+    """
+    Score every resume against every job and stream the top matches to disk.
+
+    Jobs are compiled once, and their keywords form one vocabulary, so
+    each job becomes a bitmap over it. Resumes are read lazily in blocks
+    of ``block_size``. Each block is reduced to bitmaps and scored
+    against the jobs one tile of ``job_block`` jobs at a time. A score
+    is a single AND and popcount and equals the ``overall_score`` of
+    ``ResumeMatcher.match``. Only the top-k lists are kept, never the
+    full dense matrix.
+
+    ``resumes.jsonl`` is written in input order, one line per resume,
+    as soon as its block is scored. ``jobs.jsonl`` is written once all
+    resumes are scored.
+
+    Args:
+        resumes: Iterable of ``(resume_id, resume_data)`` pairs (may be a
+                generator); ids must be JSON-serializable.
+        jobs: Mapping or iterable of ``(job_id, job_description)`` pairs.
+        out_dir: Directory receiving ``resumes.jsonl`` and ``jobs.jsonl``.
+        k: Number of matches kept per resume and per job.
+        workers: Number of worker processes. With 1 or fewer, blocks are
+                scored in the calling process.
+        block_size: Number of resumes per task.
+        job_block: Number of jobs per tile.
+        max_in_flight: Maximum number of blocks pending or buffered.
+                      Defaults to twice the number of workers.
+        matcher: Optional ResumeMatcher used for keyword extraction.
+
+    Returns:
+        Dictionary with ``resumes`` and ``jobs`` (counts) and
+        ``resumes_path`` and ``jobs_path`` (written files).
+    """
+    from resumematch.matcher.resume_matcher import ResumeMatcher
+
+    matcher = matcher or ResumeMatcher()
+    job_items = list(jobs.items() if isinstance(jobs, dict) else jobs)
+    job_ids = [job_id for job_id, _ in job_items]
+    compiled = [matcher.compile_job(description) for _, description in job_items]
+    positions: Dict[str, int] = {}
+    for job in compiled:
+        for term in job.keywords:
+            positions.setdefault(term, len(positions))
+    state = _MatrixState(
+        matcher,
+        [_mask(job.keywords, positions) for job in compiled],
+        [len(job) for job in compiled],
+        positions,
+        max(k, 0),
+        max(1, job_block),
+    )
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    resumes_path = out_dir / "resumes.jsonl"
+    jobs_path = out_dir / "jobs.jsonl"
+
+    job_top: List[List[_Hit]] = [[] for _ in job_ids]
+    resume_ids: List[Hashable] = []
+    with open(resumes_path, "w", encoding="utf-8") as out:
+        for start, block, (block_resume_top, block_job_top) in _scored_blocks(
+            state, resumes, max(1, block_size), workers, max_in_flight
+        ):
+            for offset, (resume_id, top) in enumerate(zip(block, block_resume_top)):
+                matches = [
+                    {"job_id": job_ids[-neg], "overall_score": score} for score, neg in top
+                ]
+                out.write(json.dumps({"resume_id": resume_id, "matches": matches}) + "\n")
+                resume_ids.append(resume_id)
+            for j, hits in enumerate(block_job_top):
+                hits = [(score, neg - start) for score, neg in hits]
+                job_top[j] = heapq.nlargest(state.k, job_top[j] + hits)
+
+    with open(jobs_path, "w", encoding="utf-8") as out:
+        for job_id, top in zip(job_ids, job_top):
+            matches = [
+                {"resume_id": resume_ids[-neg], "overall_score": score} for score, neg in top
+            ]
+            out.write(json.dumps({"job_id": job_id, "matches": matches}) + "\n")
+
+    return {
+        "resumes": len(resume_ids),
+        "jobs": len(job_ids),
+        "resumes_path": str(resumes_path),
+        "jobs_path": str(jobs_path),
+    }
+
+
+def _scored_blocks(
+    state: _MatrixState,
+    resumes: Iterable[Tuple[Hashable, "ResumeData"]],
+    block_size: int,
+    workers: int,
+    max_in_flight: int,
+) -> Iterator[Tuple[int, List[Hashable], Tuple[List[List[_Hit]], List[List[_Hit]]]]]:
+    """Yield ``(start row, resume ids, block top-k)`` per block, in input order."""
+    items = iter(resumes)
+
+    def blocks() -> Iterator[Tuple[int, List[Hashable], List["ResumeData"]]]:
+        start = 0
+        while True:
+            block = list(islice(items, block_size))
+            if not block:
+                return
+            yield start, [resume_id for resume_id, _ in block], [data for _, data in block]
+            start += len(block)
+
+    if workers <= 1:
+        for start, ids, data in blocks():
+            yield start, ids, _score_block(state, data)
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    limit = max_in_flight if max_in_flight > 0 else 2 * workers
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(state,)
+    ) as executor:
+        pending: Dict["Future", Tuple[int, List[Hashable]]] = {}
+        finished: Dict[int, Tuple[List[Hashable], Any]] = {}
+        order: List[int] = []
+        source = blocks()
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) + len(finished) < limit:
+                block = next(source, None)
+                if block is None:
+                    exhausted = True
+                    break
+                start, ids, data = block
+                pending[executor.submit(_score_block_in_worker, data)] = (start, ids)
+                order.append(start)
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                start, ids = pending.pop(future)
+                finished[start] = (ids, future.result())
+            while order and order[0] in finished:
+                start = order.pop(0)
+                ids, result = finished.pop(start)
+                yield start, ids, result
+
+
+def _init_worker(state: _MatrixState) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = state
+
+
+def _score_block_in_worker(
+    resumes: List["ResumeData"],
+) -> Tuple[List[List[_Hit]], List[List[_Hit]]]:
+    assert _WORKER_STATE is not None
+    return _score_block(_WORKER_STATE, resumes)
+
+
+def _score_block(
+    state: _MatrixState, resumes: List["ResumeData"]
+) -> Tuple[List[List[_Hit]], List[List[_Hit]]]:
+    """
+    Score a block of resumes against every job, tile by tile.
+
+    Returns:
+        Top-k ``(score, -job)`` hits per resume, and top-k
+        ``(score, -row)`` hits per job with rows relative to the block.
+    """
+    matcher, positions, k = state.matcher, state.positions, state.k
+    masks = []
+    for resume_data in resumes:
+        terms = set(matcher.extract_keywords(resume_data.get("raw_text", "")))
+        terms |= matcher._skill_terms(resume_data.get("skills", []))
+        masks.append(_mask(terms, positions))
+
+    resume_top: List[List[_Hit]] = [[] for _ in masks]
+    job_top: List[List[_Hit]] = []
+    n_jobs = len(state.job_masks)
+    for tile_start in range(0, n_jobs, state.job_block):
+        tile = range(tile_start, min(n_jobs, tile_start + state.job_block))
+        tile_scores = []
+        for j in tile:
+            job_mask, total = state.job_masks[j], state.job_sizes[j]
+            scores = [
+                round(100.0 * _popcount(mask & job_mask) / total, 2) if total else 0.0
+                for mask in masks
+            ]
+            tile_scores.append(scores)
+            job_top.append(heapq.nlargest(k, zip(scores, range(0, -len(scores), -1))))
+        for row, top in enumerate(resume_top):
+            hits = [(scores[row], -j) for j, scores in zip(tile, tile_scores)]
+            resume_top[row] = heapq.nlargest(k, top + hits)
+    return resume_top, job_top
+
+
+def _mask(terms: Iterable[str], positions: Dict[str, int]) -> int:
+    mask = 0
+    for term in terms:
+        position = positions.get(term)
+        if position is not None:
+            mask |= 1 << position
+    return mask
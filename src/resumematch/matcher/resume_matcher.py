@@ -1,6 +1,27 @@
 """Resume matching implementation using semantic analysis."""
 
-from typing import Dict, Any, List
+import hashlib
+import heapq
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Hashable, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from resumematch.matcher.compiled_job import CompiledJob, requirement_lines
+from resumematch.parser.models import ParsedResume
+from resumematch.utils.profiling import NULL_TIMER, StageTimer
+from resumematch.utils.skills import SkillAutomaton, default_skill_automaton
+from resumematch.utils.text_utils import STOP_WORDS, tokenize
+
+# Number of missing keywords turned into recommendations.
+MAX_RECOMMENDATIONS = 5
+
+# Default number of compiled job descriptions memoized per matcher.
+DEFAULT_JOB_CACHE_SIZE = 256
+
+JobDescription = Union[str, CompiledJob]
+ResumeData = Union[Dict[str, Any], ParsedResume]
 
 
 class ResumeMatcher:
@@ -9,19 +30,95 @@ class ResumeMatcher:
     
     Uses semantic analysis and keyword matching to determine how well
     a resume aligns with a given job description.
+    
+    Attributes:
+        skills: SkillAutomaton used to recognize known skills and synonyms.
+        job_cache_size: Number of compiled job descriptions memoized.
     """
     
-    def __init__(self):
-        """Initialize the ResumeMatcher."""
-        pass
+    def __init__(
+        self,
+        job_cache_size: int = DEFAULT_JOB_CACHE_SIZE,
+        skills: Optional[SkillAutomaton] = None,
+    ):
+        """
+        Initialize the ResumeMatcher.
+        
+        Args:
+            job_cache_size: Number of compiled job descriptions kept in
+                           the LRU memo used by ``compile_job``.
+            skills: Optional SkillAutomaton. Defaults to the shared
+                   automaton built from the default skill taxonomy.
+        """
+        self.job_cache_size = job_cache_size
+        self.skills = skills if skills is not None else default_skill_automaton()
+        self._job_cache: "OrderedDict[bytes, CompiledJob]" = OrderedDict()
+        self._job_cache_lock = threading.Lock()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"job_cache_size": self.job_cache_size, "skills": self.skills}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
     
-    def match(self, resume_data: Dict[str, Any], job_description: str) -> Dict[str, Any]:
+    def compile_job(self, job_description: JobDescription) -> CompiledJob:
+        """
+        Preprocess a job description once for repeated matching.
+        
+        Raw strings are memoized in an LRU keyed by a hash of the text, so
+        passing the same posting to ``match`` in a loop only extracts its
+        keywords the first time.
+        
+        Args:
+            job_description: Job description text, or an already
+                            compiled job (returned unchanged).
+        
+        Returns:
+            CompiledJob holding the keywords, weights and required-skill
+            bitmap of the posting.
+        """
+        if isinstance(job_description, CompiledJob):
+            return job_description
+        
+        digest = hashlib.blake2b(job_description.encode("utf-8"), digest_size=16)
+        key = digest.digest()
+        with self._job_cache_lock:
+            compiled = self._job_cache.get(key)
+            if compiled is not None:
+                self._job_cache.move_to_end(key)
+                return compiled
+        
+        keywords = self.extract_keywords(job_description)
+        keyword_set = set(keywords)
+        counts: Dict[str, int] = {}
+        for token in tokenize(job_description):
+            if token in keyword_set:
+                counts[token] = counts.get(token, 0) + 1
+        required = self.extract_keywords("\n".join(requirement_lines(job_description)))
+        compiled = CompiledJob(digest.hexdigest(), keywords, counts, required)
+        
+        with self._job_cache_lock:
+            self._job_cache[key] = compiled
+            while len(self._job_cache) > self.job_cache_size:
+                self._job_cache.popitem(last=False)
+        return compiled
+    
+    def match(
+        self,
+        resume_data: ResumeData,
+        job_description: JobDescription,
+        timer: Optional[StageTimer] = None,
+    ) -> Dict[str, Any]:
         """
         Match a parsed resume against a job description.
         
         Args:
-            resume_data: Parsed resume data from ResumeParser.
-            job_description: Job description text to match against.
+            resume_data: Parsed resume data from ResumeParser, as a
+                        dictionary or a ParsedResume.
+            job_description: Job description text to match against, or a
+                            CompiledJob from ``compile_job``.
+            timer: Optional StageTimer recording the ``compile_job`` and
+                  ``match`` stages.
         
         Returns:
             Dictionary containing match results:
@@ -32,28 +129,177 @@ class ResumeMatcher:
                 - experience_score: Experience match score
                 - recommendations: List of improvement suggestions
         """
-        # Placeholder implementation
-        return {
-            "overall_score": 0.0,
-            "keyword_matches": [],
-            "missing_keywords": [],
-            "skill_score": 0.0,
-            "experience_score": 0.0,
-            "recommendations": [],
-        }
+        timer = timer if timer is not None else NULL_TIMER
+        with timer.stage("compile_job"):
+            job_keywords = self.compile_job(job_description).keywords
+        
+        with timer.stage("match"):
+            skill_terms = self._skill_terms(resume_data.get("skills", []))
+            resume_terms = set(self.extract_keywords(resume_data.get("raw_text", "")))
+            resume_terms |= skill_terms
+            
+            matched = [i for i, term in enumerate(job_keywords) if term in resume_terms]
+            skill_hits = sum(1 for term in job_keywords if term in skill_terms)
+            return self._build_result(job_keywords, matched, skill_hits)
+    
+    def match_many(
+        self, resumes: Iterable[ResumeData], job_description: JobDescription
+    ) -> List[Dict[str, Any]]:
+        """
+        Match a batch of parsed resumes against one job description.
+        
+        The job description is processed once. Each resume is tokenized
+        once and projected onto the job's keywords, giving a CSR
+        incidence matrix (resumes x job keywords) whose row sums are the
+        match counts and whose column indices are the matched keywords in
+        job order. Results are identical to calling ``match`` per resume.
+        
+        Args:
+            resumes: Iterable of parsed resume data from ResumeParser
+                    (dictionaries or ParsedResume records).
+            job_description: Job description text to match against, or a
+                            CompiledJob from ``compile_job``.
+        
+        Returns:
+            List of match result dictionaries (see ``match``), one per
+            resume, in input order.
+        """
+        job = self.compile_job(job_description)
+        job_keywords = job.keywords
+        
+        indptr = array("l", [0])
+        indices = array("l")
+        skill_hits = array("l")
+        for resume_data in resumes:
+            matched, hits = self._project(resume_data, job)
+            indices.extend(matched)
+            indptr.append(len(indices))
+            skill_hits.append(hits)
+        
+        return [
+            self._build_result(job_keywords, indices[indptr[row]:indptr[row + 1]], skill_hits[row])
+            for row in range(len(skill_hits))
+        ]
     
-    def calculate_ats_score(self, resume_data: Dict[str, Any]) -> float:
+    def rank(
+        self,
+        resumes: Iterable[Tuple[Hashable, ResumeData]],
+        job_description: JobDescription,
+        k: int = 10,
+        threshold: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Stream resumes against one job description, keeping the best k.
+        
+        Resumes are consumed one at a time and scored as in
+        ``match_many``. A min-heap holds the k best results so far: a
+        resume scoring below ``threshold`` or not beating the heap's
+        minimum is rejected before its result dictionary is built, so
+        memory stays O(k) however long the stream is.
+        
+        Args:
+            resumes: Iterable of ``(resume_id, resume_data)`` pairs (may be
+                    a generator).
+            job_description: Job description text to match against, or a
+                            CompiledJob from ``compile_job``.
+            k: Number of results kept.
+            threshold: Optional minimum ``overall_score`` for a resume to
+                      be ranked.
+        
+        Returns:
+            Up to k match result dictionaries (see ``match``) with an
+            added ``resume_id``, by descending ``overall_score``; ties
+            keep input order.
+        """
+        if k <= 0:
+            return []
+        job = self.compile_job(job_description)
+        job_keywords = job.keywords
+        total = len(job_keywords)
+        heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        for seq, (resume_id, resume_data) in enumerate(resumes):
+            matched, skill_hits = self._project(resume_data, job)
+            score = round(100.0 * len(matched) / total, 2) if total else 0.0
+            if threshold is not None and score < threshold:
+                continue
+            # Later resumes lose ties, so the sequence number is negated.
+            if len(heap) == k and (score, -seq) <= heap[0][:2]:
+                continue
+            result = {"resume_id": resume_id}
+            result.update(self._build_result(job_keywords, matched, skill_hits))
+            entry = (score, -seq, result)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heapreplace(heap, entry)
+        return [entry[2] for entry in sorted(heap, key=lambda e: e[:2], reverse=True)]
+    
+    def match_matrix(
+        self,
+        resumes: Iterable[Tuple[Hashable, ResumeData]],
+        jobs: Union[Dict[Hashable, str], Iterable[Tuple[Hashable, str]]],
+        out_dir: Union[str, Path],
+        k: int = 10,
+        workers: int = 1,
+        **options: Any,
+    ) -> Dict[str, Any]:
+        """
+        Score every resume against every job, streaming top-k lists to disk.
+        
+        Replaces a nested loop of ``match`` calls: resumes and jobs are
+        turned into keyword bitmaps once and scored in blocked tiles
+        across ``workers`` processes. See
+        ``resumematch.matcher.matrix.match_matrix`` for the output files
+        and tuning options.
+        
+        Args:
+            resumes: Iterable of ``(resume_id, resume_data)`` pairs.
+            jobs: Mapping or iterable of ``(job_id, job_description)`` pairs.
+            out_dir: Directory receiving ``resumes.jsonl`` and ``jobs.jsonl``.
+            k: Number of matches kept per resume and per job.
+            workers: Number of worker processes.
+            **options: ``block_size``, ``job_block`` or ``max_in_flight``.
+        
+        Returns:
+            Summary with the resume and job counts and the written paths.
+        """
+        from resumematch.matcher.matrix import match_matrix
+        
+        return match_matrix(resumes, jobs, out_dir, k, workers, matcher=self, **options)
+    
+    def calculate_ats_score(self, resume_data: ResumeData) -> float:
         """
         Calculate ATS (Applicant Tracking System) compatibility score.
         
+        The score is the weighted sum of the checks in
+        ``resumematch.matcher.ats.ATS_WEIGHTS``: section headings, contact
+        details, known-skill coverage, length and consistent date formats.
+        
         Args:
             resume_data: Parsed resume data.
         
         Returns:
             ATS compatibility score (0-100).
         """
-        # Placeholder implementation
-        return 0.0
+        return self.calculate_ats_scores([resume_data])[0]
+    
+    def calculate_ats_scores(self, resumes: Iterable[ResumeData]) -> List[float]:
+        """
+        Calculate ATS compatibility scores for a batch of resumes.
+        
+        Each check is extracted once per resume into a feature column,
+        and the weights are applied column by column. Scores are
+        identical to calling ``calculate_ats_score`` per resume.
+        
+        Args:
+            resumes: Iterable of parsed resume data.
+        
+        Returns:
+            List of ATS compatibility scores (0-100), in input order.
+        """
+        from resumematch.matcher.ats import ats_features, ats_scores
+        
+        return ats_scores(ats_features(resumes, self.skills))
     
     def extract_keywords(self, text: str) -> List[str]:
         """
@@ -63,7 +309,92 @@ class ResumeMatcher:
             text: Input text (resume or job description).
         
         Returns:
-            List of extracted keywords.
+            List of extracted keywords, lowercased and de-duplicated in
+            order of first appearance. Stop words and bare numbers are
+            dropped. The canonical names of known skills mentioned in the
+            text (including through synonyms, e.g. "k8s") follow the
+            plain tokens.
+        """
+        keywords = []
+        seen = set()
+        for token in tokenize(text):
+            if token in seen or token in STOP_WORDS or len(token) < 2 or token.isdigit():
+                continue
+            seen.add(token)
+            keywords.append(token)
+        for term in self.skill_keywords(text):
+            if term not in seen:
+                seen.add(term)
+                keywords.append(term)
+        return keywords
+    
+    def skill_keywords(self, text: str) -> List[str]:
+        """
+        Find known skills in text, as lowercase canonical keywords.
+        
+        Args:
+            text: Input text.
+        
+        Returns:
+            Unique canonical skill keywords in order of first mention.
+        """
+        return [name.lower() for name in self.skills.find(text)]
+    
+    def _project(self, resume_data: ResumeData, job: CompiledJob) -> Tuple[List[int], int]:
+        """
+        Find the job keywords a resume contains.
+        
+        Args:
+            resume_data: Parsed resume data.
+            job: Compiled job description.
+        
+        Returns:
+            Ascending matched positions in ``job.keywords`` and the number
+            of job keywords found among the resume's skills.
         """
-        # Placeholder implementation
-        return []
+        job_terms = job.positions.keys()
+        skills = "\n".join(map(str, resume_data.get("skills", [])))
+        skill_terms = job_terms & set(tokenize(skills))
+        skill_terms.update(job_terms & set(self.skill_keywords(skills)))
+        raw_text = resume_data.get("raw_text", "")
+        hits = job_terms & set(tokenize(raw_text))
+        hits.update(job_terms & set(self.skill_keywords(raw_text)))
+        hits |= skill_terms
+        return sorted(job.positions[term] for term in hits), len(skill_terms)
+    
+    def _skill_terms(self, skills: Iterable[Any]) -> Set[str]:
+        """Collect the keywords of every listed skill."""
+        terms: Set[str] = set()
+        for skill in skills:
+            terms.update(self.extract_keywords(str(skill)))
+        return terms
+    
+    @staticmethod
+    def _build_result(
+        job_keywords: Sequence[str], matched: Sequence[int], skill_hits: int
+    ) -> Dict[str, Any]:
+        """
+        Assemble a match result from matched job keyword positions.
+        
+        Args:
+            job_keywords: Keywords extracted from the job description.
+            matched: Ascending positions in job_keywords found in the resume.
+            skill_hits: Number of job keywords found among the resume's skills.
+        
+        Returns:
+            Match result dictionary as documented on ``match``.
+        """
+        total = len(job_keywords)
+        matched_set = set(matched)
+        missing = [term for i, term in enumerate(job_keywords) if i not in matched_set]
+        return {
+            "overall_score": round(100.0 * len(matched) / total, 2) if total else 0.0,
+            "keyword_matches": [job_keywords[i] for i in matched],
+            "missing_keywords": missing,
+            "skill_score": round(100.0 * skill_hits / total, 2) if total else 0.0,
+            "experience_score": 0.0,
+            "recommendations": [
+                f"Consider adding '{term}' if it reflects your experience."
+                for term in missing[:MAX_RECOMMENDATIONS]
+            ],
+        }
@@ -0,0 +1,640 @@
+"""Embedding-based similarity search between resumes and job descriptions."""
+
+import heapq
+import json
+import marshal
+import math
+import mmap
+import os
+import random
+import struct
+import zlib
+from array import array
+from operator import mul
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+
+from resumematch.utils.skills import SkillAutomaton, default_skill_automaton
+from resumematch.utils.text_utils import STOP_WORDS, tokenize
+
+Vector = Sequence[float]
+
+# Default embedding dimensionality.
+DEFAULT_DIM = 128
+
+# Bumped whenever a file layout below changes.
+_FORMAT_VERSION = 1
+_STORE_MAGIC = b"RMF16VEC"
+_STORE_HEADER = struct.Struct("<8sII")
+
+
+class HashingEmbedder:
+    """
+    Dense text embeddings from hashed features, with no model download.
+
+    Three feature families are hashed (signed) into ``dim`` buckets:
+    keywords, known skills in canonical form (so "ML" and "machine
+    learning" share features), and character trigrams of keywords (so
+    "developer" and "development" are close). Term counts are damped
+    logarithmically and vectors are L2-normalized, so the dot product of
+    two embeddings is their cosine similarity.
+
+    Attributes:
+        dim: Embedding dimensionality.
+        skills: SkillAutomaton used to canonicalize skill mentions.
+        skill_weight: Weight of a canonical skill feature.
+        trigram_weight: Weight of a character trigram feature.
+    """
+
+    def __init__(
+        self,
+        dim: int = DEFAULT_DIM,
+        skills: Optional[SkillAutomaton] = None,
+        skill_weight: float = 2.0,
+        trigram_weight: float = 0.3,
+    ):
+        """
+        Initialize the HashingEmbedder.
+
+        Args:
+            dim: Embedding dimensionality.
+            skills: Optional SkillAutomaton. Defaults to the shared
+                   automaton built from the default skill taxonomy.
+            skill_weight: Weight of a canonical skill feature.
+            trigram_weight: Weight of a character trigram feature.
+        """
+        self.dim = dim
+        self.skills = skills if skills is not None else default_skill_automaton()
+        self.skill_weight = skill_weight
+        self.trigram_weight = trigram_weight
+
+    def embed(self, text: str, skills: Iterable[Any] = ()) -> array:
+        """
+        Embed a text.
+
+        Args:
+            text: Resume or job description text.
+            skills: Additional skill names (e.g. a resume's skills list).
+
+        Returns:
+            Unit-length vector (typecode ``"f"``), or a zero vector for
+            text without features.
+        """
+        counts: Dict[str, float] = {}
+        for token in tokenize(text):
+            if token in STOP_WORDS or len(token) < 2 or token.isdigit():
+                continue
+            counts[token] = counts.get(token, 0.0) + 1.0
+        features: Dict[str, float] = {}
+        for token, count in counts.items():
+            weight = 1.0 + math.log(count)
+            features[token] = weight
+            padded = f"<{token}>"
+            for i in range(len(padded) - 2):
+                gram = "#" + padded[i:i + 3]
+                features[gram] = features.get(gram, 0.0) + self.trigram_weight * weight
+
+        names = self.skills.find(text)
+        names.extend(name for skill in skills for name in self.skills.find(str(skill)))
+        for name in set(names):
+            features["@" + name] = self.skill_weight
+            for token in tokenize(name):
+                features[token] = max(features.get(token, 0.0), 1.0)
+
+        vector = array("f", bytes(4 * self.dim))
+        dim = self.dim
+        for feature, weight in features.items():
+            h = zlib.crc32(feature.encode("utf-8"))
+            vector[h % dim] += weight if h & 0x80000000 else -weight
+        norm = math.sqrt(sum(map(mul, vector, vector)))
+        if norm:
+            for i in range(dim):
+                vector[i] /= norm
+        return vector
+
+    def embed_resume(self, resume_data: Any) -> array:
+        """
+        Embed a parsed resume (dictionary or ParsedResume).
+
+        Args:
+            resume_data: Parsed resume data from ResumeParser.
+
+        Returns:
+            Unit-length embedding of its text and listed skills.
+        """
+        return self.embed(resume_data.get("raw_text", ""), resume_data.get("skills", []))
+
+
+class VectorStore:
+    """
+    Append-only on-disk matrix of float16 vectors, read through mmap.
+
+    The file holds a small header followed by fixed-size rows of
+    little-endian half-precision floats, so a million 128-dimensional
+    vectors take 256 MB on disk and are paged in only as they are read.
+
+    Attributes:
+        path: Location of the matrix file.
+        dim: Vector dimensionality.
+    """
+
+    def __init__(self, path: Union[str, Path], dim: int = DEFAULT_DIM):
+        """
+        Open or create a vector store.
+
+        Args:
+            path: Matrix file (created if missing).
+            dim: Vector dimensionality of a new store; an existing file
+                keeps its own.
+
+        Raises:
+            ValueError: If the file is not a vector store.
+        """
+        self.path = Path(path)
+        if self.path.exists() and self.path.stat().st_size:
+            with open(self.path, "rb") as f:
+                magic, version, dim = _STORE_HEADER.unpack(f.read(_STORE_HEADER.size))
+            if magic != _STORE_MAGIC or version != _FORMAT_VERSION:
+                raise ValueError(f"Not a vector store: {self.path}")
+        else:
+            self.path.write_bytes(_STORE_HEADER.pack(_STORE_MAGIC, _FORMAT_VERSION, dim))
+        self.dim = dim
+        self._row = struct.Struct(f"<{dim}e")
+        size = self.path.stat().st_size - _STORE_HEADER.size
+        self._count = size // self._row.size
+        self._writer = open(self.path, "ab")
+        self._map: Optional[mmap.mmap] = None
+        self._mapped = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, vector: Vector) -> int:
+        """
+        Append a vector.
+
+        Args:
+            vector: Vector of length ``dim``.
+
+        Returns:
+            Row number of the vector.
+        """
+        self._writer.write(self._row.pack(*vector))
+        self._count += 1
+        return self._count - 1
+
+    def row(self, i: int) -> Tuple[float, ...]:
+        """
+        Read a vector.
+
+        Args:
+            i: Row number.
+
+        Returns:
+            The vector's components.
+
+        Raises:
+            IndexError: If the row does not exist.
+        """
+        if not 0 <= i < self._count:
+            raise IndexError(f"Row out of range: {i}")
+        if i >= self._mapped:
+            self._remap()
+        return self._row.unpack_from(self._map, _STORE_HEADER.size + i * self._row.size)
+
+    def flush(self) -> None:
+        """Write buffered vectors to disk."""
+        self._writer.flush()
+
+    def truncate(self, rows: int) -> None:
+        """
+        Drop every vector from row ``rows`` on.
+
+        Args:
+            rows: Number of vectors kept.
+        """
+        if rows >= self._count:
+            return
+        self._writer.flush()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            self._mapped = 0
+        os.truncate(self.path, _STORE_HEADER.size + rows * self._row.size)
+        self._count = rows
+
+    def close(self) -> None:
+        """Flush and release the file."""
+        self._writer.close()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            self._mapped = 0
+
+    def _remap(self) -> None:
+        self._writer.flush()
+        if self._map is not None:
+            self._map.close()
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mapped = self._count
+
+
+class IVFIndex:
+    """
+    Inverted-file approximate nearest neighbour index over a VectorStore.
+
+    Vectors are clustered with spherical k-means, and each cluster keeps
+    the rows assigned to it. A query is compared with the centroids and
+    only the rows of the ``nprobe`` closest clusters are scored exactly,
+    which trades a little recall for scanning roughly ``nprobe / n_lists``
+    of the store.
+
+    Attributes:
+        store: VectorStore holding the indexed vectors.
+        nprobe: Number of clusters scanned per query.
+    """
+
+    def __init__(self, store: VectorStore, nprobe: int = 8):
+        """
+        Initialize an untrained IVFIndex.
+
+        Args:
+            store: VectorStore holding the vectors.
+            nprobe: Number of clusters scanned per query.
+        """
+        self.store = store
+        self.nprobe = nprobe
+        self.centroids: List[Tuple[float, ...]] = []
+        self.lists: List[array] = []
+        self.indexed = 0
+
+    @property
+    def trained(self) -> bool:
+        """Whether centroids have been computed."""
+        return bool(self.centroids)
+
+    def train(
+        self,
+        n_lists: Optional[int] = None,
+        iterations: int = 5,
+        sample_size: Optional[int] = None,
+        seed: int = 0,
+    ) -> None:
+        """
+        Cluster the stored vectors and assign every row to a cluster.
+
+        Args:
+            n_lists: Number of clusters (default: about sqrt of the rows).
+            iterations: k-means iterations.
+            sample_size: Rows used for clustering (default: 32 per cluster;
+                        raised to n_lists if smaller).
+            seed: Random seed for sampling and initialization.
+        """
+        count = len(self.store)
+        if not count:
+            return
+        n_lists = n_lists or max(1, min(1024, int(math.sqrt(count))))
+        n_lists = min(n_lists, count)
+        sample_size = max(sample_size or 32 * n_lists, n_lists)
+        rng = random.Random(seed)
+        sample_rows = rng.sample(range(count), min(count, sample_size))
+        sample = [self.store.row(i) for i in sample_rows]
+        centroids = [sample[i] for i in rng.sample(range(len(sample)), n_lists)]
+
+        for _ in range(iterations):
+            sums = [[0.0] * self.store.dim for _ in centroids]
+            for vector in sample:
+                acc = sums[_nearest(centroids, vector)]
+                for j, value in enumerate(vector):
+                    acc[j] += value
+            centroids = [
+                _normalized(acc) if any(acc) else centroid
+                for acc, centroid in zip(sums, centroids)
+            ]
+
+        self.centroids = centroids
+        self.lists = [array("l") for _ in centroids]
+        self.indexed = 0
+        self.update()
+
+    def update(self) -> None:
+        """Assign rows appended to the store since the last update."""
+        for i in range(self.indexed, len(self.store)):
+            self.lists[_nearest(self.centroids, self.store.row(i))].append(i)
+        self.indexed = len(self.store)
+
+    def search(
+        self, query: Vector, k: int = 10, nprobe: Optional[int] = None
+    ) -> List[Tuple[float, int]]:
+        """
+        Find the stored vectors most similar to a query.
+
+        Args:
+            query: Query vector (unit length for cosine scores).
+            k: Maximum number of results.
+            nprobe: Clusters to scan (default: ``self.nprobe``).
+
+        Returns:
+            ``(score, row)`` pairs, highest dot product first.
+        """
+        if self.indexed < len(self.store):
+            self.update()
+        nprobe = nprobe or self.nprobe
+        closest = heapq.nlargest(
+            nprobe, range(len(self.centroids)),
+            key=lambda c: sum(map(mul, query, self.centroids[c])),
+        )
+        rows = (row for c in closest for row in self.lists[c])
+        return _top_k(self.store, query, rows, k)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write the trained index (not the vectors) to disk.
+
+        Args:
+            path: Destination file.
+        """
+        state = (
+            _FORMAT_VERSION, self.nprobe, self.indexed, self.centroids,
+            [rows.tobytes() for rows in self.lists],
+        )
+        Path(path).write_bytes(marshal.dumps(state))
+
+    @classmethod
+    def load(cls, path: Union[str, Path], store: VectorStore) -> "IVFIndex":
+        """
+        Load an index written by ``save``.
+
+        Args:
+            path: File written by ``save``.
+            store: VectorStore the index was built over.
+
+        Returns:
+            The loaded IVFIndex.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version.
+        """
+        version, nprobe, indexed, centroids, lists = marshal.loads(Path(path).read_bytes())
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported IVF index format: {version}")
+        index = cls(store, nprobe)
+        index.centroids = [tuple(c) for c in centroids]
+        index.lists = []
+        for data in lists:
+            rows = array("l")
+            rows.frombytes(data)
+            index.lists.append(rows)
+        index.indexed = indexed
+        return index
+
+
+class _Collection:
+    """Identifiers, vectors and optional IVF index of one side of the search."""
+
+    def __init__(self, directory: Path, name: str, dim: int, nprobe: int):
+        self.store = VectorStore(directory / f"{name}.f16", dim)
+        if self.store.dim != dim:
+            self.store.close()
+            raise ValueError(
+                f"{name} vectors have dimension {self.store.dim}, but the embedder produces {dim}"
+            )
+        self.ids_path = directory / f"{name}.ids.jsonl"
+        self.index_path = directory / f"{name}.ivf"
+        self.ids: List[Hashable] = []
+        if self.ids_path.exists():
+            with open(self.ids_path, encoding="utf-8") as f:
+                self.ids = [_hashable(json.loads(line)) for line in f]
+        # A crash between writing vectors and ids leaves one file longer
+        # than the other; keep only the rows present in both.
+        count = min(len(self.ids), len(self.store))
+        if len(self.ids) > count:
+            del self.ids[count:]
+            self._rewrite_ids()
+        self.store.truncate(count)
+        self.index: Optional[IVFIndex] = None
+        if self.index_path.exists():
+            self.index = IVFIndex.load(self.index_path, self.store)
+            self.index.nprobe = nprobe
+            if self.index.indexed > count:
+                self.index.lists = [
+                    array("l", (row for row in rows if row < count)) for rows in self.index.lists
+                ]
+                self.index.indexed = count
+        self._saved_ids = len(self.ids)
+
+    def _rewrite_ids(self) -> None:
+        """Atomically replace the ids file with exactly the ids held."""
+        tmp = self.ids_path.with_name(self.ids_path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for item_id in self.ids:
+                f.write(json.dumps(item_id) + "\n")
+        os.replace(tmp, self.ids_path)
+
+    def add(self, item_id: Hashable, vector: Vector) -> None:
+        self.store.append(vector)
+        self.ids.append(item_id)
+
+    def search(self, query: Vector, k: int, nprobe: Optional[int]) -> List[Tuple[float, int]]:
+        if self.index is not None:
+            return self.index.search(query, k, nprobe)
+        return _top_k(self.store, query, range(len(self.store)), k)
+
+    def save(self) -> None:
+        self.store.flush()
+        with open(self.ids_path, "a", encoding="utf-8") as f:
+            for item_id in self.ids[self._saved_ids:]:
+                f.write(json.dumps(item_id) + "\n")
+        self._saved_ids = len(self.ids)
+        if self.index is not None:
+            self.index.update()
+            self.index.save(self.index_path)
+
+    def close(self) -> None:
+        self.save()
+        self.store.close()
+
+
+class SemanticIndex:
+    """
+    Persistent two-way similarity search between resumes and jobs.
+
+    Resumes and job descriptions are embedded with a HashingEmbedder and
+    kept in two float16 VectorStores under one directory, each with an
+    optional IVF index. ``top_resumes`` finds the candidates closest to a
+    posting and ``top_jobs`` the postings closest to a candidate. Until
+    ``build`` is called, searches scan every vector exactly.
+
+    Attributes:
+        directory: Directory holding the stores, ids and indexes.
+        embedder: HashingEmbedder producing the vectors.
+        nprobe: Default number of IVF clusters scanned per query.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        embedder: Optional[HashingEmbedder] = None,
+        nprobe: int = 8,
+    ):
+        """
+        Open or create a SemanticIndex.
+
+        Args:
+            directory: Directory for the index files (created if missing).
+            embedder: Optional HashingEmbedder; its dimensionality must
+                     match an existing index.
+            nprobe: Default number of IVF clusters scanned per query.
+
+        Raises:
+            ValueError: If stored vectors have a different dimensionality
+                       than the embedder.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.embedder = embedder or HashingEmbedder()
+        self.nprobe = nprobe
+        dim = self.embedder.dim
+        self._resumes = _Collection(self.directory, "resumes", dim, nprobe)
+        try:
+            self._jobs = _Collection(self.directory, "jobs", dim, nprobe)
+        except ValueError:
+            self._resumes.store.close()
+            raise
+
+    def __enter__(self) -> "SemanticIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def add_resume(self, resume_id: Hashable, resume_data: Any) -> None:
+        """
+        Embed and store a parsed resume.
+
+        Args:
+            resume_id: Identifier returned by searches (JSON-serializable).
+            resume_data: Parsed resume data (dictionary or ParsedResume).
+        """
+        self._resumes.add(resume_id, self.embedder.embed_resume(resume_data))
+
+    def add_job(self, job_id: Hashable, job_description: str) -> None:
+        """
+        Embed and store a job description.
+
+        Args:
+            job_id: Identifier returned by searches (JSON-serializable).
+            job_description: Job description text.
+        """
+        self._jobs.add(job_id, self.embedder.embed(job_description))
+
+    def build(self, n_lists: Optional[int] = None, iterations: int = 5, seed: int = 0) -> None:
+        """
+        Train the IVF indexes over the stored vectors and save everything.
+
+        Vectors added afterwards are assigned to the existing clusters;
+        rebuild after the collection has grown severalfold.
+
+        Args:
+            n_lists: Clusters per index (default: about sqrt of the count).
+            iterations: k-means iterations.
+            seed: Random seed.
+        """
+        for collection in (self._resumes, self._jobs):
+            collection.store.flush()
+            if len(collection.store):
+                collection.index = IVFIndex(collection.store, self.nprobe)
+                collection.index.train(n_lists, iterations, seed=seed)
+        self.save()
+
+    def top_resumes(
+        self, job_description: str, k: int = 10, nprobe: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the stored resumes most similar to a job description.
+
+        Args:
+            job_description: Job description text.
+            k: Maximum number of results.
+            nprobe: IVF clusters to scan (default: ``self.nprobe``).
+
+        Returns:
+            List of dictionaries with ``resume_id`` and ``score`` (cosine
+            similarity), best match first.
+        """
+        hits = self._resumes.search(self.embedder.embed(job_description), k, nprobe)
+        return [{"resume_id": self._resumes.ids[row], "score": score} for score, row in hits]
+
+    def top_jobs(
+        self, resume_data: Any, k: int = 10, nprobe: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the stored job descriptions most similar to a resume.
+
+        Args:
+            resume_data: Parsed resume data (dictionary or ParsedResume).
+            k: Maximum number of results.
+            nprobe: IVF clusters to scan (default: ``self.nprobe``).
+
+        Returns:
+            List of dictionaries with ``job_id`` and ``score`` (cosine
+            similarity), best match first.
+        """
+        hits = self._jobs.search(self.embedder.embed_resume(resume_data), k, nprobe)
+        return [{"job_id": self._jobs.ids[row], "score": score} for score, row in hits]
+
+    def save(self) -> None:
+        """Persist vectors added since the last save, ids and indexes."""
+        self._resumes.save()
+        self._jobs.save()
+
+    def close(self) -> None:
+        """Save and release the files."""
+        self._resumes.close()
+        self._jobs.close()
+
+
+def cosine(a: Vector, b: Vector) -> float:
+    """
+    Dot product of two unit-length vectors.
+
+    Args:
+        a: First vector.
+        b: Second vector.
+
+    Returns:
+        Cosine similarity in [-1, 1].
+    """
+    return sum(map(mul, a, b))
+
+
+def _nearest(centroids: List[Tuple[float, ...]], vector: Vector) -> int:
+    best, best_score = 0, -math.inf
+    for i, centroid in enumerate(centroids):
+        score = sum(map(mul, vector, centroid))
+        if score > best_score:
+            best, best_score = i, score
+    return best
+
+
+def _normalized(values: List[float]) -> Tuple[float, ...]:
+    norm = math.sqrt(sum(map(mul, values, values))) or 1.0
+    return tuple(value / norm for value in values)
+
+
+def _top_k(
+    store: VectorStore, query: Vector, rows: Iterable[int], k: int
+) -> List[Tuple[float, int]]:
+    """Score rows exactly and keep the k best (ties favour lower rows)."""
+    if k <= 0:
+        return []
+    store.flush()
+    row = store.row
+    best = heapq.nlargest(k, ((sum(map(mul, query, row(i))), -i) for i in rows))
+    return [(score, -neg) for score, neg in best]
+
+
+def _hashable(value: Any) -> Hashable:
+    """JSON round-trips tuples as lists; restore them so ids stay hashable."""
+    return tuple(_hashable(v) for v in value) if isinstance(value, list) else value
@@ -0,0 +1,378 @@
+"""Resume corpus shared between processes through one memory-mapped file."""
+
+import heapq
+import json
+import mmap
+import os
+import struct
+import tempfile
+import uuid
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from resumematch.matcher.resume_matcher import JobDescription, ResumeData, ResumeMatcher
+
+_MAGIC = b"RMCORPUS"
+_FORMAT_VERSION = 1
+# Magic, then the length of the JSON table of contents that follows.
+_HEADER = struct.Struct("<8sQ")
+_ALIGN = 8
+
+
+def default_directory() -> str:
+    """Directory for corpus files: RAM-backed ``/dev/shm`` where available."""
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+class SharedCorpus:
+    """
+    Parsed resumes laid out as flat arrays in one file, mapped by every worker.
+
+    The corpus holds a CSR term matrix (resume -> sorted term ids), the
+    same matrix transposed (term -> ascending resumes) for scoring, the
+    term ids of each resume's listed skills, the vocabulary and the
+    resume ids. Workers attach by path and read through memoryviews, so
+    they share the creator's page-cache pages; scaling out adds no
+    per-worker copy of the corpus. Pickling a SharedCorpus sends only its
+    path, so it can be passed straight to a process pool.
+
+    Scores are identical to ``ResumeMatcher.match``.
+
+    Attributes:
+        path: Location of the corpus file.
+        owner: Whether this instance created the file (and deletes it in
+              ``unlink``).
+    """
+
+    def __init__(self, path: Union[str, Path], owner: bool = False):
+        """
+        Attach to an existing corpus file; prefer ``create`` or ``attach``.
+
+        Args:
+            path: Corpus file.
+            owner: Whether this instance is responsible for deleting it.
+
+        Raises:
+            ValueError: If the file is not a corpus.
+        """
+        self.path = Path(path)
+        self.owner = owner
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, toc_len = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            self._map.close()
+            raise ValueError(f"Not a resume corpus: {self.path}")
+        toc = json.loads(self._map[_HEADER.size:_HEADER.size + toc_len])
+        if toc["version"] != _FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"Unsupported corpus format: {toc['version']}")
+        base = memoryview(self._map)
+        self._views: Dict[str, memoryview] = {
+            name: base[offset:offset + size].cast(typecode)
+            for name, (typecode, offset, size) in toc["arrays"].items()
+        }
+        self._base = base
+        self._vocabulary: Optional[Dict[str, int]] = None
+        self._matcher: Optional[ResumeMatcher] = None
+
+    @classmethod
+    def create(
+        cls,
+        resumes: Iterable[Tuple[Hashable, ResumeData]],
+        matcher: Optional[ResumeMatcher] = None,
+        directory: Optional[Union[str, Path]] = None,
+    ) -> "SharedCorpus":
+        """
+        Extract the terms of parsed resumes and write them as a corpus.
+
+        Args:
+            resumes: Iterable of ``(resume_id, resume_data)`` pairs; ids
+                    must be JSON-serializable.
+            matcher: Optional ResumeMatcher used to extract keywords.
+            directory: Where to create the file (default:
+                      ``default_directory()``).
+
+        Returns:
+            The owning SharedCorpus; call ``unlink`` (or use it as a
+            context manager) to delete the file when done.
+        """
+        matcher = matcher or ResumeMatcher()
+        vocabulary: Dict[str, int] = {}
+        indptr, indices = array("q", [0]), array("i")
+        skill_indptr, skill_indices = array("q", [0]), array("i")
+        ids, id_offsets = bytearray(), array("q", [0])
+        postings: List[array] = []
+
+        def term_ids(terms: Iterable[str]) -> List[int]:
+            result = []
+            for term in terms:
+                term_id = vocabulary.get(term)
+                if term_id is None:
+                    term_id = vocabulary[term] = len(vocabulary)
+                    postings.append(array("i"))
+                result.append(term_id)
+            return sorted(result)
+
+        for row, (resume_id, resume_data) in enumerate(resumes):
+            skill_terms = matcher._skill_terms(resume_data.get("skills", []))
+            terms = set(matcher.extract_keywords(resume_data.get("raw_text", ""))) | skill_terms
+            row_terms = term_ids(terms)
+            for term_id in row_terms:
+                postings[term_id].append(row)
+            indices.extend(row_terms)
+            indptr.append(len(indices))
+            skill_indices.extend(term_ids(skill_terms))
+            skill_indptr.append(len(skill_indices))
+            ids += json.dumps(resume_id).encode("utf-8")
+            id_offsets.append(len(ids))
+
+        posting_indptr, posting_rows = array("q", [0]), array("i")
+        for rows in postings:
+            posting_rows.extend(rows)
+            posting_indptr.append(len(posting_rows))
+        terms_blob, term_offsets = bytearray(), array("q", [0])
+        for term in vocabulary:
+            terms_blob += term.encode("utf-8")
+            term_offsets.append(len(terms_blob))
+
+        arrays: Dict[str, Tuple[str, bytes]] = {
+            "indptr": ("q", indptr.tobytes()),
+            "indices": ("i", indices.tobytes()),
+            "skill_indptr": ("q", skill_indptr.tobytes()),
+            "skill_indices": ("i", skill_indices.tobytes()),
+            "posting_indptr": ("q", posting_indptr.tobytes()),
+            "posting_rows": ("i", posting_rows.tobytes()),
+            "term_offsets": ("q", term_offsets.tobytes()),
+            "terms": ("B", bytes(terms_blob)),
+            "id_offsets": ("q", id_offsets.tobytes()),
+            "ids": ("B", bytes(ids)),
+        }
+        directory = Path(directory) if directory is not None else Path(default_directory())
+        path = directory / f"resumematch-corpus-{uuid.uuid4().hex}.bin"
+        _write(path, arrays)
+        return cls(path, owner=True)
+
+    @classmethod
+    def attach(cls, path: Union[str, Path]) -> "SharedCorpus":
+        """
+        Map a corpus created by another process.
+
+        Args:
+            path: Corpus file (``SharedCorpus.path`` of the creator).
+
+        Returns:
+            A non-owning SharedCorpus.
+        """
+        return cls(path)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"path": str(self.path)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["path"])
+
+    def __enter__(self) -> "SharedCorpus":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def __len__(self) -> int:
+        return len(self._views["indptr"]) - 1
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the mapped file."""
+        return len(self._map)
+
+    def resume_id(self, row: int) -> Hashable:
+        """
+        Return the id of a resume.
+
+        Args:
+            row: Row number (input order of ``create``).
+
+        Returns:
+            The resume id.
+        """
+        offsets = self._views["id_offsets"]
+        value = json.loads(bytes(self._views["ids"][offsets[row]:offsets[row + 1]]))
+        return tuple(value) if isinstance(value, list) else value
+
+    def term_ids(self, row: int) -> memoryview:
+        """Return the sorted term ids of a resume (zero-copy)."""
+        indptr = self._views["indptr"]
+        return self._views["indices"][indptr[row]:indptr[row + 1]]
+
+    def skill_term_ids(self, row: int) -> memoryview:
+        """Return the sorted term ids of a resume's listed skills (zero-copy)."""
+        indptr = self._views["skill_indptr"]
+        return self._views["skill_indices"][indptr[row]:indptr[row + 1]]
+
+    def term(self, term_id: int) -> str:
+        """Return the keyword with a term id."""
+        offsets = self._views["term_offsets"]
+        return bytes(self._views["terms"][offsets[term_id]:offsets[term_id + 1]]).decode("utf-8")
+
+    def match(
+        self, row: int, job_description: JobDescription, matcher: Optional[ResumeMatcher] = None
+    ) -> Dict[str, Any]:
+        """
+        Match one resume of the corpus against a job description.
+
+        Args:
+            row: Row number.
+            job_description: Job description text or CompiledJob.
+            matcher: Optional ResumeMatcher used to compile the job.
+
+        Returns:
+            Match result dictionary, identical to ``ResumeMatcher.match``.
+        """
+        matcher = matcher or self._default_matcher()
+        job_keywords = matcher.compile_job(job_description).keywords
+        row_terms, skill_terms = self.term_ids(row), self.skill_term_ids(row)
+        vocabulary = self._vocab()
+        matched, skill_hits = [], 0
+        for i, term in enumerate(job_keywords):
+            term_id = vocabulary.get(term)
+            if term_id is None:
+                continue
+            if _contains(row_terms, term_id):
+                matched.append(i)
+            skill_hits += _contains(skill_terms, term_id)
+        return ResumeMatcher._build_result(job_keywords, matched, skill_hits)
+
+    def top_k(
+        self,
+        job_description: JobDescription,
+        k: int = 10,
+        start: int = 0,
+        stop: Optional[int] = None,
+        matcher: Optional[ResumeMatcher] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank a slice of the corpus against a job description.
+
+        Only the postings of the job's keywords are read, so the cost is
+        proportional to the matching entries, not to the corpus size.
+        Split the rows into slices to spread the work over processes.
+
+        Args:
+            job_description: Job description text or CompiledJob.
+            k: Maximum number of results.
+            start: First row of the slice.
+            stop: End of the slice (default: all rows).
+            matcher: Optional ResumeMatcher used to compile the job.
+
+        Returns:
+            List of dictionaries with ``resume_id``, ``row``,
+            ``overall_score`` and ``skill_score`` (as computed by
+            ``ResumeMatcher.match``), best match first; ties keep row order.
+        """
+        matcher = matcher or self._default_matcher()
+        job_keywords = matcher.compile_job(job_description).keywords
+        stop = len(self) if stop is None else min(stop, len(self))
+        if stop <= start:
+            return []
+        matched = array("l", [0]) * (stop - start)
+        vocabulary = self._vocab()
+        posting_indptr, posting_rows = self._views["posting_indptr"], self._views["posting_rows"]
+        job_term_ids = set()
+        for term in job_keywords:
+            term_id = vocabulary.get(term)
+            if term_id is None:
+                continue
+            job_term_ids.add(term_id)
+            rows = posting_rows[posting_indptr[term_id]:posting_indptr[term_id + 1]]
+            for position in range(bisect_left(rows, start), bisect_left(rows, stop)):
+                matched[rows[position] - start] += 1
+
+        total = len(job_keywords)
+        best = heapq.nlargest(max(k, 0), range(len(matched)), key=matched.__getitem__)
+        results = []
+        for offset in best:
+            row = start + offset
+            skill_hits = sum(1 for term_id in self.skill_term_ids(row) if term_id in job_term_ids)
+            results.append({
+                "resume_id": self.resume_id(row),
+                "row": row,
+                "overall_score": round(100.0 * matched[offset] / total, 2) if total else 0.0,
+                "skill_score": round(100.0 * skill_hits / total, 2) if total else 0.0,
+            })
+        return results
+
+    def close(self) -> None:
+        """
+        Unmap the file.
+
+        Views handed out earlier keep the file mapped until they are
+        garbage collected.
+        """
+        for view in self._views.values():
+            view.release()
+        self._views.clear()
+        self._base.release()
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+
+    def unlink(self) -> None:
+        """Delete the corpus file; attached processes keep their mapping."""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _vocab(self) -> Dict[str, int]:
+        """Term -> id dictionary, built once per process from the mapped terms."""
+        if self._vocabulary is None:
+            offsets, data = self._views["term_offsets"], bytes(self._views["terms"])
+            self._vocabulary = {
+                data[offsets[i]:offsets[i + 1]].decode("utf-8"): i
+                for i in range(len(offsets) - 1)
+            }
+        return self._vocabulary
+
+    def _default_matcher(self) -> ResumeMatcher:
+        if self._matcher is None:
+            self._matcher = ResumeMatcher()
+        return self._matcher
+
+
+def _write(path: Path, arrays: Dict[str, Tuple[str, bytes]]) -> None:
+    """Write arrays after a table of contents, each aligned for its typecode."""
+    toc: Dict[str, Any] = {"version": _FORMAT_VERSION, "arrays": {}}
+    # Offsets depend on the TOC length, so lay out after sizing it generously.
+    layout = {name: [typecode, 0, len(data)] for name, (typecode, data) in arrays.items()}
+    toc["arrays"] = layout
+    toc_len = len(json.dumps(toc)) + 32 * len(arrays)
+    offset = _aligned(_HEADER.size + toc_len)
+    for name, (_, data) in arrays.items():
+        layout[name][1] = offset
+        offset = _aligned(offset + len(data))
+    toc_bytes = json.dumps(toc).encode("utf-8").ljust(toc_len)
+
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, toc_len))
+        f.write(toc_bytes)
+        for name, (_, data) in arrays.items():
+            f.seek(layout[name][1])
+            f.write(data)
+        f.truncate(max(offset, _aligned(_HEADER.size + toc_len)))
+    os.replace(tmp, path)
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _contains(sorted_ids: memoryview, term_id: int) -> bool:
+    position = bisect_left(sorted_ids, term_id)
+    return position < len(sorted_ids) and sorted_ids[position] == term_id
@@ -1,5 +1,45 @@
 """Resume parsing functionality."""
 
-from resumematch.parser.resume_parser import ResumeParser
+from typing import TYPE_CHECKING
 
-__all__ = ["ResumeParser"]
+from resumematch._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from resumematch.parser.cache import ParseCache
+    from resumematch.parser.dedup import ResumeDeduplicator
+    from resumematch.parser.models import (
+        ContactInfo,
+        Education,
+        ParsedResume,
+        SkillVocabulary,
+        WorkExperience,
+        default_vocabulary,
+    )
+    from resumematch.parser.resume_parser import ResumeParser
+    from resumematch.parser.sections import SectionSegmenter
+
+__all__ = [
+    "ContactInfo",
+    "Education",
+    "ParseCache",
+    "ParsedResume",
+    "ResumeDeduplicator",
+    "ResumeParser",
+    "SectionSegmenter",
+    "SkillVocabulary",
+    "WorkExperience",
+    "default_vocabulary",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ContactInfo": "resumematch.parser.models",
+    "Education": "resumematch.parser.models",
+    "ParseCache": "resumematch.parser.cache",
+    "ParsedResume": "resumematch.parser.models",
+    "ResumeDeduplicator": "resumematch.parser.dedup",
+    "ResumeParser": "resumematch.parser.resume_parser",
+    "SectionSegmenter": "resumematch.parser.sections",
+    "SkillVocabulary": "resumematch.parser.models",
+    "WorkExperience": "resumematch.parser.models",
+    "default_vocabulary": "resumematch.parser.models",
+})
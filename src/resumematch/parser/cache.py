@@ -0,0 +1,176 @@
+"""Persistent, content-addressed cache of parsed resumes."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from resumematch import __version__
+
+# Bytes read per hashing step, so large files are never loaded whole.
+HASH_CHUNK_SIZE = 1 << 20
+
+# Default cap on the total size of cached payloads (256 MiB).
+DEFAULT_MAX_BYTES = 256 << 20
+
+
+class ParseCache:
+    """
+    On-disk cache of ``ResumeParser.parse`` output keyed by file content.
+
+    Keys are a streaming BLAKE2b hash of the file bytes combined with the
+    package version, so an edited file or an upgraded parser never hits a
+    stale entry, while a renamed or copied file still does. Entries live
+    in a single SQLite database and are evicted least-recently-used first
+    once their total size exceeds ``max_bytes``.
+
+    Instances are safe to share between threads and can be pickled into
+    worker processes (each process opens its own connection).
+
+    Attributes:
+        path: Location of the SQLite database file.
+        max_bytes: Maximum total size of stored payloads in bytes.
+    """
+
+    def __init__(self, path: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the ParseCache.
+
+        Args:
+            path: Location of the SQLite database file. Parent directories
+                 are created if needed.
+            max_bytes: Maximum total size of stored payloads in bytes.
+
+        Raises:
+            ValueError: If max_bytes is not positive.
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"path": self.path, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["path"], state["max_bytes"])
+
+    def key_for(self, file_path: Union[str, Path], variant: str = "") -> str:
+        """
+        Compute the cache key of a file.
+
+        Args:
+            file_path: Path to the file to hash.
+            variant: Extra text mixed into the key, for parse options that
+                    change the output.
+
+        Returns:
+            Hex digest identifying the file content, parser version and
+            variant.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{__version__}\0{variant}\0".encode("utf-8"))
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached parse result.
+
+        Args:
+            key: Key returned by ``key_for``.
+
+        Returns:
+            The cached parse result, or None on a miss.
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT payload FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+        return json.loads(row[0])
+
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        """
+        Store a parse result, evicting old entries if over capacity.
+
+        Args:
+            key: Key returned by ``key_for``.
+            data: Parse result to store. Must be JSON-serializable.
+        """
+        payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, payload, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time()),
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM entries")
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection (it is reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of stored payloads in bytes."""
+        with self._lock:
+            return self._total_bytes(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and create the schema."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, payload BLOB NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _total_bytes(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least-recently-used entries until under max_bytes."""
+        excess = self._total_bytes(conn) - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
@@ -0,0 +1,323 @@
+"""Exact and near-duplicate detection of resumes with MinHash and LSH."""
+
+import hashlib
+import random
+import zlib
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from resumematch.utils.text_utils import clean_text
+
+if TYPE_CHECKING:
+    from resumematch.matcher.resume_matcher import JobDescription, ResumeMatcher
+
+# Mersenne prime modulus of the universal hash permutations.
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Default estimated Jaccard similarity above which resumes are grouped.
+DEFAULT_THRESHOLD = 0.85
+
+# Default MinHash signature length.
+DEFAULT_NUM_PERM = 128
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize resume text for fingerprinting.
+
+    Args:
+        text: Raw resume text.
+
+    Returns:
+        ``clean_text`` output, lowercased.
+    """
+    return clean_text(text).lower()
+
+
+class MinHasher:
+    """
+    MinHash signatures over word shingles.
+
+    Each of ``num_perm`` universal hash functions ``(a * x + b) mod p`` is
+    applied to the CRC32 of every shingle; the signature keeps the minimum
+    of each. Two signatures agree in each position with probability equal
+    to the Jaccard similarity of the shingle sets.
+
+    Attributes:
+        num_perm: Signature length.
+        shingle_size: Words per shingle.
+    """
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, shingle_size: int = 3, seed: int = 1):
+        """
+        Initialize the MinHasher.
+
+        Args:
+            num_perm: Signature length.
+            shingle_size: Words per shingle.
+            seed: Seed of the hash functions; signatures are only
+                 comparable between hashers with equal parameters.
+        """
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._params = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)
+        ]
+
+    def shingles(self, text: str) -> Set[int]:
+        """
+        Hash the word shingles of normalized text.
+
+        Args:
+            text: Normalized text.
+
+        Returns:
+            Set of 32-bit shingle hashes (a single shingle for short text).
+        """
+        words = text.split()
+        size = self.shingle_size
+        if len(words) <= size:
+            return {zlib.crc32(" ".join(words).encode("utf-8"))}
+        return {
+            zlib.crc32(" ".join(words[i:i + size]).encode("utf-8"))
+            for i in range(len(words) - size + 1)
+        }
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """
+        Compute the MinHash signature of normalized text.
+
+        Args:
+            text: Normalized text.
+
+        Returns:
+            Tuple of ``num_perm`` minimum hash values.
+        """
+        hashes = self.shingles(text)
+        return tuple(
+            min((a * x + b) % _PRIME for x in hashes) & _MAX_HASH for a, b in self._params
+        )
+
+
+def similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    """
+    Estimate the Jaccard similarity of two MinHash signatures.
+
+    Args:
+        a: First signature.
+        b: Second signature of the same length.
+
+    Returns:
+        Fraction of positions where the signatures agree.
+    """
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def lsh_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Choose LSH bands and rows per band for a similarity threshold.
+
+    Two signatures share a bucket with probability ``1 - (1 - s**r)**b``,
+    an S-curve whose midpoint ``(1 / b) ** (1 / r)`` is placed as close to
+    the threshold as the signature length allows.
+
+    Args:
+        threshold: Target Jaccard similarity.
+        num_perm: Signature length.
+
+    Returns:
+        ``(bands, rows)`` with ``bands * rows <= num_perm``.
+    """
+    return min(
+        ((bands, num_perm // bands) for bands in range(1, num_perm + 1)),
+        key=lambda br: abs((1 / br[0]) ** (1 / br[1]) - threshold),
+    )
+
+
+class ResumeDeduplicator:
+    """
+    Groups resumes into clusters of exact and near duplicates.
+
+    Exact duplicates (same normalized text) are found with a content
+    hash. Other resumes are fingerprinted with MinHash and bucketed with
+    LSH. Candidates sharing a bucket join the same cluster when their
+    estimated similarity reaches the threshold. The first resume added
+    to a cluster is its representative, so ``match`` scores one resume
+    per cluster and reports that result for every member. Resumes with no
+    text (e.g. scanned PDFs) carry no evidence of being duplicates, so
+    each one gets a cluster of its own.
+
+    Attributes:
+        threshold: Estimated Jaccard similarity for near duplicates.
+        hasher: MinHasher producing the signatures.
+        bands: Number of LSH bands.
+        rows: Signature positions per band.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        shingle_size: int = 3,
+        seed: int = 1,
+    ):
+        """
+        Initialize an empty ResumeDeduplicator.
+
+        Args:
+            threshold: Estimated Jaccard similarity for near duplicates.
+            num_perm: MinHash signature length.
+            shingle_size: Words per shingle.
+            seed: Seed of the MinHash functions.
+        """
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm, shingle_size, seed)
+        self.bands, self.rows = lsh_bands(threshold, num_perm)
+        self._ids: List[Hashable] = []
+        self._index: Dict[Hashable, int] = {}
+        self._parent: List[int] = []
+        self._signatures: List[Optional[Tuple[int, ...]]] = []
+        self._by_digest: Dict[bytes, int] = {}
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(self.bands)]
+        self._data: Dict[int, Any] = {}
+        self.exact_duplicates = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, resume_id: Hashable) -> bool:
+        return resume_id in self._index
+
+    @property
+    def n_clusters(self) -> int:
+        """Number of clusters (distinct resumes)."""
+        return sum(1 for i, parent in enumerate(self._parent) if parent == i)
+
+    def add(self, resume_id: Hashable, resume_data: Any) -> Hashable:
+        """
+        Add a parsed resume and assign it to a cluster.
+
+        Args:
+            resume_id: Caller-chosen identifier.
+            resume_data: Parsed resume data (dictionary or ParsedResume).
+
+        Returns:
+            Id of the cluster's representative (resume_id itself if the
+            resume is new).
+
+        Raises:
+            ValueError: If resume_id was already added.
+        """
+        if resume_id in self._index:
+            raise ValueError(f"Resume already added: {resume_id!r}")
+        row = len(self._ids)
+        self._ids.append(resume_id)
+        self._index[resume_id] = row
+        self._parent.append(row)
+
+        text = normalize(resume_data.get("raw_text", ""))
+        if not text:
+            self._signatures.append(None)
+            self._data[row] = resume_data
+            return resume_id
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        original = self._by_digest.get(digest)
+        if original is not None:
+            self._signatures.append(None)
+            self.exact_duplicates += 1
+            self._union(original, row)
+            return self._ids[self._find(row)]
+        self._by_digest[digest] = row
+
+        signature = self.hasher.signature(text)
+        self._signatures.append(signature)
+        candidates = set()
+        for band, buckets in enumerate(self._buckets):
+            key = signature[band * self.rows:(band + 1) * self.rows]
+            bucket = buckets.setdefault(key, [])
+            candidates.update(bucket)
+            bucket.append(row)
+        for other in sorted(candidates):
+            if similarity(signature, self._signatures[other]) >= self.threshold:
+                self._union(other, row)
+
+        root = self._find(row)
+        if root == row:
+            self._data[row] = resume_data
+        return self._ids[root]
+
+    def add_many(self, resumes: Iterable[Tuple[Hashable, Any]]) -> None:
+        """
+        Add several parsed resumes.
+
+        Args:
+            resumes: Iterable of ``(resume_id, resume_data)`` pairs.
+        """
+        for resume_id, resume_data in resumes:
+            self.add(resume_id, resume_data)
+
+    def representative(self, resume_id: Hashable) -> Hashable:
+        """
+        Return the representative of a resume's cluster.
+
+        Args:
+            resume_id: Id of an added resume.
+
+        Returns:
+            Id of the first resume added to the cluster.
+
+        Raises:
+            KeyError: If resume_id was not added.
+        """
+        return self._ids[self._find(self._index[resume_id])]
+
+    def clusters(self) -> List[List[Hashable]]:
+        """
+        List the clusters.
+
+        Returns:
+            One list of resume ids per cluster, representative first, in
+            the order the clusters were created.
+        """
+        groups: Dict[int, List[Hashable]] = {}
+        for row, resume_id in enumerate(self._ids):
+            groups.setdefault(self._find(row), []).append(resume_id)
+        return [groups[root] for root in sorted(groups)]
+
+    def match(
+        self, matcher: "ResumeMatcher", job_description: "JobDescription"
+    ) -> Dict[Hashable, Dict[str, Any]]:
+        """
+        Match one resume per cluster and fan the results out.
+
+        Args:
+            matcher: ResumeMatcher used for matching.
+            job_description: Job description text or CompiledJob.
+
+        Returns:
+            Mapping of every added resume id to the match result of its
+            cluster's representative. Members share the representative's
+            result dictionary.
+        """
+        roots = sorted(self._data)
+        results = matcher.match_many([self._data[root] for root in roots], job_description)
+        by_root = dict(zip(roots, results))
+        return {resume_id: by_root[self._find(row)] for row, resume_id in enumerate(self._ids)}
+
+    def _find(self, row: int) -> int:
+        parent = self._parent
+        while parent[row] != row:
+            parent[row] = parent[parent[row]]
+            row = parent[row]
+        return row
+
+    def _union(self, a: int, b: int) -> None:
+        """Merge two clusters; the earlier root stays the representative."""
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a == root_b:
+            return
+        if root_b < root_a:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._data.pop(root_b, None)
@@ -0,0 +1,333 @@
+"""
+Streaming text extraction for supported resume formats.
+
+Every extractor is a generator that yields the text of a document one
+page at a time and reads its input incrementally, so the memory used by
+a parse is bounded by the largest page (or the caller's budget) rather
+than by the size of the file. The per-format backends live in
+``resumematch.parser.formats`` and are imported on the first parse of
+their format:
+
+- TXT is read in fixed-size chunks. Pages are delimited by form feeds,
+  and very long runs without one are split every ``TEXT_PAGE_CHARS``.
+- RTF is tokenized chunk by chunk. ``\\page`` starts a new page.
+- DOCX streams ``word/document.xml`` out of the zip archive through an
+  incremental XML parser. Page breaks and Word's rendered page-break
+  markers start a new page.
+- PDF is memory-mapped. Pages are located through the page tree, and
+  only the content streams of pages actually requested are inflated.
+  Only the text layer is read, so scanned images yield no text.
+"""
+
+import importlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+PathLike = Union[str, Path]
+PageExtractor = Callable[[Path], Iterator[str]]
+FormatProbe = Callable[[Path], bool]
+
+# Extraction modes: "fast" reads text in content order with no layout
+# analysis; "layout" reconstructs the visual reading order where the
+# format needs it (PDF) and falls back to "fast" elsewhere.
+MODES = ("fast", "layout")
+
+# Bytes read from the start of a file when sniffing its format.
+SNIFF_BYTES = 64
+
+
+class FormatBackend:
+    """
+    Registry entry mapping a file format to its page extractors.
+
+    Extractors are given either directly or as the name of a module
+    defining ``iter_pages(path)`` and, optionally, a layout-aware
+    ``iter_layout_pages(path)``. A module is imported the first time one
+    of its extractors is needed.
+
+    Attributes:
+        suffix: Lower-case file suffix including the dot.
+        module: Backend module name, or None for directly given extractors.
+        magic: Byte signatures identifying the format at the file start.
+        probe: Optional check confirming a file whose magic matched, for
+              container formats sharing a signature (e.g. zip).
+    """
+
+    __slots__ = ("suffix", "module", "magic", "probe", "_extractors")
+
+    def __init__(
+        self,
+        suffix: str,
+        module: Optional[str] = None,
+        fast: Optional[PageExtractor] = None,
+        layout: Optional[PageExtractor] = None,
+        magic: Iterable[bytes] = (),
+        probe: Optional[FormatProbe] = None,
+    ):
+        """
+        Initialize the FormatBackend.
+
+        Args:
+            suffix: File suffix including the dot, e.g. ``".pdf"``.
+            module: Name of the module providing the extractors.
+            fast: Fast extractor, used instead of the module's.
+            layout: Layout-aware extractor (defaults to the fast one).
+            magic: Byte signatures identifying the format.
+            probe: Check confirming a file whose magic matched.
+
+        Raises:
+            ValueError: If neither module nor fast is given.
+        """
+        if module is None and fast is None:
+            raise ValueError(f"Backend for {suffix} needs a module or an extractor")
+        self.suffix = suffix.lower()
+        self.module = module
+        self.magic = tuple(magic)
+        self.probe = probe
+        self._extractors: Dict[str, PageExtractor] = {}
+        if fast is not None:
+            self._extractors["fast"] = fast
+            self._extractors["layout"] = layout or fast
+
+    def extractor(self, mode: str = "fast") -> PageExtractor:
+        """
+        Return the page extractor for a mode, importing the backend if needed.
+
+        Args:
+            mode: One of ``MODES``.
+
+        Returns:
+            Callable yielding the pages of a file.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        extractor = self._extractors.get(mode)
+        if extractor is None:
+            if mode not in MODES:
+                raise ValueError(f"Unknown extraction mode: {mode!r} (expected one of {MODES})")
+            module = importlib.import_module(self.module)  # type: ignore[arg-type]
+            self._extractors["fast"] = module.iter_pages
+            self._extractors["layout"] = getattr(module, "iter_layout_pages", module.iter_pages)
+            extractor = self._extractors[mode]
+        return extractor
+
+
+_REGISTRY: Dict[str, FormatBackend] = {}
+
+
+def register_backend(
+    suffix: str,
+    module: Optional[str] = None,
+    fast: Optional[PageExtractor] = None,
+    layout: Optional[PageExtractor] = None,
+    magic: Iterable[bytes] = (),
+    probe: Optional[FormatProbe] = None,
+) -> FormatBackend:
+    """
+    Register (or replace) the extraction backend of a file format.
+
+    Args:
+        suffix: File suffix including the dot, e.g. ``".odt"``.
+        module: Name of a module defining ``iter_pages(path)`` and
+               optionally ``iter_layout_pages(path)``, imported lazily.
+        fast: Fast page extractor, used instead of a module.
+        layout: Layout-aware page extractor (defaults to fast).
+        magic: Byte signatures identifying the format at the start of a
+              file, used when the suffix is missing or unknown.
+        probe: Called with the path of a file whose magic matched; the
+              file is only assigned to this backend if it returns True.
+
+    Returns:
+        The registered FormatBackend.
+    """
+    backend = FormatBackend(
+        suffix, module=module, fast=fast, layout=layout, magic=magic, probe=probe
+    )
+    _REGISTRY[backend.suffix] = backend
+    return backend
+
+
+def _is_docx(path: Path) -> bool:
+    """Tell a DOCX document from other zip archives (ODT, XLSX, plain zip)."""
+    import zipfile
+
+    try:
+        with zipfile.ZipFile(path) as archive:
+            archive.getinfo("word/document.xml")
+    except (zipfile.BadZipFile, KeyError):
+        return False
+    return True
+
+
+register_backend(".txt", "resumematch.parser.formats.txt")
+register_backend(".rtf", "resumematch.parser.formats.rtf", magic=[b"{\\rtf"])
+register_backend(
+    ".docx", "resumematch.parser.formats.docx", magic=[b"PK\x03\x04"], probe=_is_docx
+)
+register_backend(".pdf", "resumematch.parser.formats.pdf", magic=[b"%PDF-"])
+
+
+def supported_formats() -> List[str]:
+    """
+    Return the registered file suffixes.
+
+    Returns:
+        Suffixes including the dot, in registration order.
+    """
+    return list(_REGISTRY)
+
+
+def sniff_format(file_path: PathLike) -> Optional[str]:
+    """
+    Identify a file's format from its leading bytes.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        The suffix of the matching backend, or None if no signature
+        matches (or no backend's probe confirms the match).
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(SNIFF_BYTES).lstrip()
+    for backend in _REGISTRY.values():
+        if backend.magic and head.startswith(backend.magic):
+            if backend.probe is None or backend.probe(Path(file_path)):
+                return backend.suffix
+    return None
+
+
+def detect_format(file_path: PathLike) -> Optional[str]:
+    """
+    Resolve the backend suffix of a file.
+
+    A registered suffix is trusted without reading the file. Otherwise
+    the leading bytes are sniffed, so files with a missing or wrong
+    extension are still handled.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        The backend suffix, or None if the format is not recognized.
+    """
+    suffix = Path(file_path).suffix.lower()
+    if suffix in _REGISTRY:
+        return suffix
+    try:
+        return sniff_format(file_path)
+    except OSError:
+        return None
+
+
+# Names formerly defined in this module, now provided by a backend.
+_MOVED = {
+    "iter_txt_pages": (".txt", "iter_pages"),
+    "iter_rtf_pages": (".rtf", "iter_pages"),
+    "iter_docx_pages": (".docx", "iter_pages"),
+    "iter_pdf_pages": (".pdf", "iter_pages"),
+    "content_stream_text": (".pdf", "content_stream_text"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _MOVED:
+        suffix, attribute = _MOVED[name]
+        return getattr(importlib.import_module(_REGISTRY[suffix].module), attribute)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_extractor(suffix: str, mode: str = "fast") -> Optional[PageExtractor]:
+    """
+    Return the page extractor for a file suffix, importing its backend.
+
+    Args:
+        suffix: Lower-case file suffix including the dot, e.g. ``".pdf"``.
+        mode: Extraction mode, one of ``MODES``.
+
+    Returns:
+        The backend's extractor for the mode, or None if the suffix is
+        not supported.
+
+    Raises:
+        ValueError: If the mode is unknown.
+    """
+    backend = _REGISTRY.get(suffix)
+    return backend.extractor(mode) if backend is not None else None
+
+
+def iter_pages(
+    file_path: PathLike,
+    max_pages: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    mode: str = "fast",
+) -> Iterator[str]:
+    """
+    Stream the text of a resume file page by page.
+
+    Extraction stops as soon as a budget is reached, so pages beyond it
+    are never read or decoded.
+
+    Args:
+        file_path: Path to a PDF, DOCX, RTF or TXT file (or a file of a
+                  registered format; see ``detect_format``).
+        max_pages: Maximum number of pages to yield.
+        max_bytes: Maximum total size of the yielded text, in UTF-8
+                  bytes. The last page is truncated to fit.
+        mode: ``"fast"`` or ``"layout"`` (see ``MODES``).
+
+    Yields:
+        Text of each page.
+
+    Raises:
+        ValueError: If the file format or the mode is not supported.
+    """
+    path = Path(file_path)
+    suffix = detect_format(path)
+    if suffix is None:
+        raise ValueError(f"Unsupported file format: {path.suffix}")
+    extractor = _REGISTRY[suffix].extractor(mode)
+
+    if max_pages is not None and max_pages <= 0:
+        return
+    remaining = max_bytes
+    pages = iter(extractor(path))
+    try:
+        for count, page in enumerate(pages, start=1):
+            if remaining is not None:
+                encoded = page.encode("utf-8")
+                if len(encoded) >= remaining:
+                    yield encoded[:remaining].decode("utf-8", errors="ignore")
+                    return
+                remaining -= len(encoded)
+            yield page
+            if max_pages is not None and count >= max_pages:
+                return
+    finally:
+        close = getattr(pages, "close", None)
+        if close is not None:
+            close()
+
+
+def extract_text(
+    file_path: PathLike,
+    max_pages: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    mode: str = "fast",
+) -> str:
+    """
+    Extract the text of a resume file within an optional budget.
+
+    Args:
+        file_path: Path to a PDF, DOCX, RTF or TXT file.
+        max_pages: Maximum number of pages to read.
+        max_bytes: Maximum size of the returned text, in UTF-8 bytes.
+        mode: ``"fast"`` or ``"layout"`` (see ``MODES``).
+
+    Returns:
+        Text of the extracted pages, separated by newlines.
+    """
+    return "\n".join(
+        iter_pages(file_path, max_pages=max_pages, max_bytes=max_bytes, mode=mode)
+    )
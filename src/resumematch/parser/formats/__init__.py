@@ -0,0 +1,8 @@
+"""
+Per-format text extraction backends.
+
+Each module exposes ``iter_pages(path)``, a generator yielding the text of
+a document page by page. Backends are imported by
+``resumematch.parser.extractors`` on the first parse of their format, so
+processes that only handle plain text never load the others.
+"""
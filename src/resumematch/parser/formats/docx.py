@@ -0,0 +1,49 @@
+"""
+DOCX backend.
+
+``word/document.xml`` is streamed out of the zip archive through an
+incremental XML parser. Page breaks and Word's rendered page-break markers
+start a new page.
+"""
+
+import zipfile
+from pathlib import Path
+from typing import Iterator, List
+from xml.etree.ElementTree import iterparse
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def iter_pages(path: Path) -> Iterator[str]:
+    """Yield the pages of a DOCX document."""
+    page: List[str] = []
+    with zipfile.ZipFile(path) as archive:
+        try:
+            archive.getinfo("word/document.xml")
+        except KeyError:
+            raise ValueError(f"Unsupported file format: {path.name} is not a DOCX document")
+        with archive.open("word/document.xml") as xml:
+            for event, elem in iterparse(xml, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    if tag == _W + "lastRenderedPageBreak" and page:
+                        yield "".join(page)
+                        page = []
+                    continue
+                if tag == _W + "t":
+                    page.append(elem.text or "")
+                elif tag == _W + "tab":
+                    page.append("\t")
+                elif tag in (_W + "br", _W + "cr"):
+                    if elem.get(_W + "type") == "page":
+                        yield "".join(page)
+                        page = []
+                    else:
+                        page.append("\n")
+                elif tag == _W + "p":
+                    page.append("\n")
+                    elem.clear()
+                elif tag == _W + "body":
+                    elem.clear()
+    if page:
+        yield "".join(page)
@@ -0,0 +1,523 @@
+"""
+PDF backend.
+
+The file is memory-mapped. Pages are located through the page tree, and
+only the content streams of pages actually requested are inflated. Only
+the text layer is read, so scanned images yield no text.
+
+Two extractors are provided. ``iter_pages`` emits text in the order the
+content stream draws it, which is fast and right for most generated
+resumes. ``iter_layout_pages`` tracks the text and graphics matrices to
+place every text run on the page and rebuilds lines in visual reading
+order, which handles multi-column layouts and out-of-order drawing at
+several times the cost.
+
+Strings are decoded as single-byte Latin-1 and font encodings are not
+applied. Pages drawn with composite (Type0/CID) fonts, as exported by
+many word processors for non-Latin scripts, store glyph ids that only
+the font's ToUnicode CMap maps back to text; both extractors raise
+ValueError for such pages instead of returning garbage.
+"""
+
+import mmap
+import re
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+_PDF_OBJ_RE = re.compile(rb"(\d+)\s+\d+\s+obj\b")
+_PDF_REF_RE = re.compile(rb"(\d+)\s+\d+\s+R")
+_PDF_ROOT_RE = re.compile(rb"/Root\s+(\d+)\s+\d+\s+R")
+_PDF_TYPE_RE = re.compile(rb"/Type\s*/(\w+)")
+_PDF_RESOURCES_RE = re.compile(rb"/Resources\s*(\d+)\s+\d+\s+R")
+_PDF_FONT_REF_RE = re.compile(rb"/Font\s*(\d+)\s+\d+\s+R")
+_PDF_FONT_DICT_RE = re.compile(rb"/Font\s*<<(.*?)>>", re.S)
+_PDF_PARENT_RE = re.compile(rb"/Parent\s+(\d+)\s+\d+\s+R")
+_PDF_COMPOSITE_FONT_RE = re.compile(rb"/Subtype\s*/Type0\b")
+_PDF_TOKEN_RE = re.compile(
+    rb"\((?:[^()\\]|\\.|\((?:[^()\\]|\\.)*\))*\)"  # literal string
+    rb"|<[0-9A-Fa-f\s]*>"  # hex string
+    rb"|\[|\]"  # array delimiters
+    rb"|/[^\s/\[\]()<>{}%]*"  # name
+    rb"|[+-]?(?:\d+\.?\d*|\.\d+)"  # number
+    rb"|[A-Za-z'\"*]+"  # operator
+    rb"|%[^\r\n]*",  # comment
+    re.S,
+)
+_PDF_ESCAPES = {
+    ord("n"): b"\n", ord("r"): b"\r", ord("t"): b"\t", ord("b"): b"\b",
+    ord("f"): b"\f", ord("("): b"(", ord(")"): b")", ord("\\"): b"\\",
+}
+
+# TJ displacement (thousandths of an em) treated as a word gap.
+_PDF_TJ_SPACE = -200
+
+# Layout analysis: glyph width assumed without font metrics, and the
+# baseline distance (both as fractions of the font size) within which
+# runs share a line.
+_LAYOUT_GLYPH_WIDTH = 0.5
+_LAYOUT_LINE_TOLERANCE = 0.5
+
+Matrix = Tuple[float, float, float, float, float, float]
+_IDENTITY: Matrix = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+class _PdfDocument:
+    """Minimal random-access reader over a memory-mapped PDF."""
+
+    def __init__(self, data: mmap.mmap):
+        self.data = data
+        self.offsets: Dict[int, int] = {}
+        for match in _PDF_OBJ_RE.finditer(data):
+            self.offsets[int(match.group(1))] = match.end()
+        self._embedded: Optional[Dict[int, bytes]] = None
+
+    def object_head(self, num: int) -> bytes:
+        """Return an object's body up to its stream data (dictionary part)."""
+        offset = self.offsets.get(num)
+        if offset is None:
+            return self._embedded_objects().get(num, b"")
+        end = self.data.find(b"endobj", offset)
+        stream = self.data.find(b"stream", offset, end if end != -1 else len(self.data))
+        stop = stream if stream != -1 else end
+        return self.data[offset:stop if stop != -1 else len(self.data)]
+
+    def stream(self, num: int) -> bytes:
+        """Return the decoded stream data of an object (empty if unsupported)."""
+        offset = self.offsets.get(num)
+        if offset is None:
+            return b""
+        head = self.object_head(num)
+        start = offset + len(head) + len(b"stream")
+        if self.data[start:start + 2] == b"\r\n":
+            start += 2
+        elif self.data[start:start + 1] in (b"\n", b"\r"):
+            start += 1
+        end = self.data.find(b"endstream", start)
+        raw = self.data[start:end if end != -1 else len(self.data)]
+        return _decode_stream(head, raw)
+
+    def pages(self) -> List[int]:
+        """Return page object numbers in document order."""
+        roots = _PDF_ROOT_RE.findall(self.data)
+        if roots:
+            catalog = self.object_head(int(roots[-1]))
+            match = re.search(rb"/Pages\s+(\d+)\s+\d+\s+R", catalog)
+            if match:
+                pages: List[int] = []
+                self._walk(int(match.group(1)), pages, set())
+                if pages:
+                    return pages
+        return [
+            num for num in sorted(self.offsets, key=self.offsets.get)
+            if _object_type(self.object_head(num)) == b"Page"
+        ]
+
+    def page_contents(self, page: int) -> List[int]:
+        """Return the content stream object numbers of a page."""
+        head = self.object_head(page)
+        match = re.search(rb"/Contents\s*(\[[^\]]*\]|\d+\s+\d+\s+R)", head)
+        if not match:
+            return []
+        return [int(num) for num in _PDF_REF_RE.findall(match.group(1))]
+
+    def uses_composite_fonts(self, page: int) -> bool:
+        """Tell whether a page's font resources include a Type0 (CID) font."""
+        fonts = self._font_dict(page)
+        return any(
+            _PDF_COMPOSITE_FONT_RE.search(self.object_head(int(num)))
+            for num in _PDF_REF_RE.findall(fonts)
+        )
+
+    def _font_dict(self, page: int) -> bytes:
+        """Return the font dictionary of a page, following inherited resources."""
+        seen = set()
+        num: Optional[int] = page
+        while num is not None and num not in seen:
+            seen.add(num)
+            head = self.object_head(num)
+            resources = _PDF_RESOURCES_RE.search(head)
+            if resources:
+                head = self.object_head(int(resources.group(1)))
+            ref = _PDF_FONT_REF_RE.search(head)
+            if ref:
+                return self.object_head(int(ref.group(1)))
+            inline = _PDF_FONT_DICT_RE.search(head)
+            if inline:
+                return inline.group(1)
+            parent = _PDF_PARENT_RE.search(self.object_head(num))
+            num = int(parent.group(1)) if parent else None
+        return b""
+
+    def _walk(self, num: int, pages: List[int], seen: set) -> None:
+        if num in seen:
+            return
+        seen.add(num)
+        head = self.object_head(num)
+        kind = _object_type(head)
+        if kind == b"Page":
+            pages.append(num)
+        elif kind == b"Pages":
+            kids = re.search(rb"/Kids\s*\[([^\]]*)\]", head)
+            if kids:
+                for kid in _PDF_REF_RE.findall(kids.group(1)):
+                    self._walk(int(kid), pages, seen)
+
+    def _embedded_objects(self) -> Dict[int, bytes]:
+        """Index objects stored inside compressed object streams."""
+        if self._embedded is None:
+            self._embedded = {}
+            for num in list(self.offsets):
+                head = self.object_head(num)
+                if _object_type(head) != b"ObjStm":
+                    continue
+                first = re.search(rb"/First\s+(\d+)", head)
+                body = self.stream(num)
+                if not first or not body:
+                    continue
+                base = int(first.group(1))
+                header = body[:base].split()
+                entries = [
+                    (int(header[i]), int(header[i + 1])) for i in range(0, len(header) - 1, 2)
+                ]
+                for i, (obj_num, obj_offset) in enumerate(entries):
+                    end = entries[i + 1][1] if i + 1 < len(entries) else len(body) - base
+                    self._embedded[obj_num] = body[base + obj_offset:base + end]
+        return self._embedded
+
+
+def _object_type(head: bytes) -> Optional[bytes]:
+    match = _PDF_TYPE_RE.search(head)
+    return match.group(1) if match else None
+
+
+def _decode_stream(head: bytes, raw: bytes) -> bytes:
+    """Apply the stream's filters; only FlateDecode is supported."""
+    filters = re.findall(rb"/(\w+Decode)", head.split(b"/DecodeParms")[0])
+    for name in filters:
+        if name != b"FlateDecode":
+            return b""
+        try:
+            raw = zlib.decompressobj().decompress(raw)
+        except zlib.error:
+            return b""
+    return raw
+
+
+def _pdf_literal(token: bytes) -> bytes:
+    """Decode a PDF literal string token, including escapes."""
+    body = token[1:-1]
+    if b"\\" not in body:
+        return body
+    out = bytearray()
+    i = 0
+    while i < len(body):
+        c = body[i]
+        if c != 0x5C or i + 1 == len(body):
+            out.append(c)
+            i += 1
+            continue
+        nxt = body[i + 1]
+        if nxt in _PDF_ESCAPES:
+            out += _PDF_ESCAPES[nxt]
+            i += 2
+        elif 0x30 <= nxt <= 0x37:
+            j = i + 1
+            while j < min(i + 4, len(body)) and 0x30 <= body[j] <= 0x37:
+                j += 1
+            out.append(int(body[i + 1:j], 8) & 0xFF)
+            i = j
+        elif nxt in (0x0A, 0x0D):
+            i += 2
+            if nxt == 0x0D and i < len(body) and body[i] == 0x0A:
+                i += 1
+        else:
+            out.append(nxt)
+            i += 2
+    return bytes(out)
+
+
+def _pdf_string(token: bytes) -> str:
+    if token.startswith(b"("):
+        data = _pdf_literal(token)
+    else:
+        digits = re.sub(rb"\s", b"", token[1:-1])
+        data = bytes.fromhex((digits + b"0" * (len(digits) % 2)).decode("ascii"))
+    return data.decode("latin-1")
+
+
+def content_stream_text(content: bytes) -> str:
+    """
+    Extract the text drawn by a PDF content stream.
+
+    Args:
+        content: Decoded content stream bytes.
+
+    Returns:
+        Text shown by the text operators, with line moves as newlines.
+    """
+    out: List[str] = []
+    operands: List[object] = []
+    array_stack: List[List[object]] = []
+
+    def newline() -> None:
+        if out and not out[-1].endswith("\n"):
+            out.append("\n")
+
+    for match in _PDF_TOKEN_RE.finditer(content):
+        token = match.group()
+        first = token[:1]
+        if first in (b"(", b"<"):
+            value: object = _pdf_string(token)
+        elif first == b"[":
+            array_stack.append([])
+            continue
+        elif first == b"]":
+            if array_stack:
+                value = array_stack.pop()
+            else:
+                continue
+        elif first in (b"/", b"%"):
+            continue
+        elif first.isdigit() or first in (b"+", b"-", b"."):
+            value = float(token)
+        else:
+            op = token
+            if op == b"Tj" and operands and isinstance(operands[-1], str):
+                out.append(operands[-1])
+            elif op in (b"'", b'"') and operands and isinstance(operands[-1], str):
+                newline()
+                out.append(operands[-1])
+            elif op == b"TJ" and operands and isinstance(operands[-1], list):
+                for item in operands[-1]:
+                    if isinstance(item, str):
+                        out.append(item)
+                    elif item < _PDF_TJ_SPACE:
+                        out.append(" ")
+            elif op in (b"Td", b"TD") and len(operands) >= 2:
+                if operands[-1] != 0:
+                    newline()
+                elif out and not out[-1].endswith((" ", "\n")):
+                    out.append(" ")
+            elif op in (b"T*", b"ET", b"Tm"):
+                newline()
+            operands = []
+            continue
+        if array_stack:
+            array_stack[-1].append(value)
+        else:
+            operands.append(value)
+    return "".join(out).strip("\n")
+
+
+def _check_fonts(doc: _PdfDocument, page: int, path: Path, number: int) -> None:
+    """Raise ValueError if a page needs font encodings this backend lacks."""
+    if doc.uses_composite_fonts(page):
+        raise ValueError(
+            f"{path.name}: page {number} uses composite (CID) fonts, whose text "
+            f"cannot be decoded without their ToUnicode maps"
+        )
+
+
+def iter_pages(path: Path) -> Iterator[str]:
+    """
+    Yield the text layer of each page of a PDF document.
+
+    Raises:
+        ValueError: If a page uses composite (CID) fonts.
+    """
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return
+    try:
+        doc = _PdfDocument(data)
+        for number, page in enumerate(doc.pages(), start=1):
+            _check_fonts(doc, page, path, number)
+            yield "\n".join(
+                content_stream_text(doc.stream(num)) for num in doc.page_contents(page)
+            )
+    finally:
+        data.close()
+
+
+def _operations(content: bytes) -> Iterator[Tuple[bytes, List[object]]]:
+    """Yield ``(operator, operands)`` pairs of a content stream."""
+    operands: List[object] = []
+    array_stack: List[List[object]] = []
+    for match in _PDF_TOKEN_RE.finditer(content):
+        token = match.group()
+        first = token[:1]
+        if first in (b"(", b"<"):
+            value: object = _pdf_string(token)
+        elif first == b"[":
+            array_stack.append([])
+            continue
+        elif first == b"]":
+            if not array_stack:
+                continue
+            value = array_stack.pop()
+        elif first in (b"/", b"%"):
+            continue
+        elif first.isdigit() or first in (b"+", b"-", b"."):
+            value = float(token)
+        else:
+            yield token, operands
+            operands = []
+            continue
+        if array_stack:
+            array_stack[-1].append(value)
+        else:
+            operands.append(value)
+
+
+def _multiply(m: Matrix, n: Matrix) -> Matrix:
+    """Return the matrix product m x n (PDF row-vector convention)."""
+    a, b, c, d, e, f = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (
+        a * a2 + b * c2, a * b2 + b * d2,
+        c * a2 + d * c2, c * b2 + d * d2,
+        e * a2 + f * c2 + e2, e * b2 + f * d2 + f2,
+    )
+
+
+def _numbers(operands: List[object], count: int) -> Optional[List[float]]:
+    values = operands[-count:]
+    if len(values) == count and all(isinstance(value, float) for value in values):
+        return values  # type: ignore[return-value]
+    return None
+
+
+def _positioned_runs(content: bytes) -> List[Tuple[float, float, float, float, str]]:
+    """Place the text runs of a content stream as ``(y, x, x_end, size, text)``."""
+    runs: List[Tuple[float, float, float, float, str]] = []
+    ctm = _IDENTITY
+    stack: List[Matrix] = []
+    tm = tlm = _IDENTITY
+    font_size = 12.0
+    leading = 0.0
+
+    def show(pieces: List[object]) -> None:
+        nonlocal tm
+        trm = _multiply(tm, ctm)
+        scale = abs(trm[0] * trm[3] - trm[1] * trm[2]) ** 0.5
+        size = font_size * scale or font_size
+        parts: List[str] = []
+        advance = 0.0
+        for piece in pieces:
+            if isinstance(piece, str):
+                parts.append(piece)
+                advance += len(piece) * font_size * _LAYOUT_GLYPH_WIDTH
+            elif isinstance(piece, float):
+                advance -= piece / 1000 * font_size
+                if piece < _PDF_TJ_SPACE:
+                    parts.append(" ")
+        text = "".join(parts)
+        if text.strip():
+            runs.append((trm[5], trm[4], trm[4] + advance * scale, size, text))
+        tm = _multiply((1.0, 0.0, 0.0, 1.0, advance, 0.0), tm)
+
+    def move(tx: float, ty: float) -> None:
+        nonlocal tm, tlm
+        tm = tlm = _multiply((1.0, 0.0, 0.0, 1.0, tx, ty), tlm)
+
+    for op, operands in _operations(content):
+        if op == b"BT":
+            tm = tlm = _IDENTITY
+        elif op == b"Tj" and operands and isinstance(operands[-1], str):
+            show([operands[-1]])
+        elif op == b"TJ" and operands and isinstance(operands[-1], list):
+            show(operands[-1])
+        elif op in (b"'", b'"') and operands and isinstance(operands[-1], str):
+            move(0.0, -leading)
+            show([operands[-1]])
+        elif op in (b"Td", b"TD"):
+            values = _numbers(operands, 2)
+            if values:
+                if op == b"TD":
+                    leading = -values[1]
+                move(values[0], values[1])
+        elif op == b"T*":
+            move(0.0, -leading)
+        elif op == b"TL" and _numbers(operands, 1):
+            leading = operands[-1]  # type: ignore[assignment]
+        elif op == b"Tf" and _numbers(operands, 1):
+            font_size = operands[-1]  # type: ignore[assignment]
+        elif op == b"Tm":
+            values = _numbers(operands, 6)
+            if values:
+                tm = tlm = tuple(values)  # type: ignore[assignment]
+        elif op == b"cm":
+            values = _numbers(operands, 6)
+            if values:
+                ctm = _multiply(tuple(values), ctm)  # type: ignore[arg-type]
+        elif op == b"q":
+            stack.append(ctm)
+        elif op == b"Q" and stack:
+            ctm = stack.pop()
+    return runs
+
+
+def layout_stream_text(content: bytes) -> str:
+    """
+    Extract the text of a PDF content stream in visual reading order.
+
+    Text runs are placed with the text and graphics matrices, grouped
+    into lines by baseline (top to bottom) and ordered left to right.
+    Wide horizontal gaps, such as between columns, are kept as runs of
+    spaces.
+
+    Args:
+        content: Decoded content stream bytes (all streams of a page).
+
+    Returns:
+        Page text with one output line per visual line.
+    """
+    runs = sorted(_positioned_runs(content), key=lambda run: (-run[0], run[1]))
+    lines: List[List[Tuple[float, float, float, float, str]]] = []
+    for run in runs:
+        if lines and abs(lines[-1][0][0] - run[0]) <= _LAYOUT_LINE_TOLERANCE * run[3]:
+            lines[-1].append(run)
+        else:
+            lines.append([run])
+
+    out: List[str] = []
+    for line in lines:
+        line.sort(key=lambda run: run[1])
+        parts: List[str] = []
+        end = None
+        for _, x, x_end, size, text in line:
+            if end is not None:
+                gap = (x - end) / (size * _LAYOUT_GLYPH_WIDTH)
+                if gap >= 4:
+                    parts.append(" " * int(gap))
+                elif gap > 0.4 and not parts[-1].endswith(" ") and not text.startswith(" "):
+                    parts.append(" ")
+            parts.append(text)
+            end = max(x_end, end) if end is not None else x_end
+        out.append("".join(parts).rstrip())
+    return "\n".join(out)
+
+
+def iter_layout_pages(path: Path) -> Iterator[str]:
+    """
+    Yield the text of each page of a PDF document in visual reading order.
+
+    Raises:
+        ValueError: If a page uses composite (CID) fonts.
+    """
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return
+    try:
+        doc = _PdfDocument(data)
+        for number, page in enumerate(doc.pages(), start=1):
+            _check_fonts(doc, page, path, number)
+            content = b"\n".join(doc.stream(num) for num in doc.page_contents(page))
+            yield layout_stream_text(content)
+    finally:
+        data.close()
@@ -0,0 +1,108 @@
+"""
+RTF backend.
+
+RTF is tokenized chunk by chunk, so only one chunk of the file is held in
+memory. ``\\page`` starts a new page.
+"""
+
+import re
+from pathlib import Path
+from typing import Iterator, List
+
+# Characters read from disk per step.
+READ_CHUNK_SIZE = 64 * 1024
+
+_RTF_TOKEN_RE = re.compile(
+    r"\\([a-zA-Z]{1,32})(-?\d{1,10})? ?"  # control word
+    r"|\\'([0-9a-fA-F]{2})"  # hex-escaped byte
+    r"|\\(.)"  # control symbol
+    r"|([{}])"  # group delimiter
+    r"|([^\\{}\r\n]+)"  # plain text
+    r"|[\r\n]+",  # source line breaks (ignored)
+    re.S,
+)
+
+# Destination groups whose content is not document text.
+_RTF_SKIP_DESTINATIONS = frozenset(
+    "fonttbl colortbl stylesheet info pict object header footer headerl headerr "
+    "footerl footerr footnote themedata datastore listtable listoverridetable "
+    "generator rsidtbl latentstyles xmlnstbl".split()
+)
+
+_RTF_NEWLINE_WORDS = frozenset(["par", "line", "sect", "row"])
+_RTF_SYMBOLS = {"~": "\u00a0", "_": "-", "-": "", "\\": "\\", "{": "{", "}": "}"}
+
+
+def iter_pages(path: Path) -> Iterator[str]:
+    """Yield the pages of an RTF document."""
+    page: List[str] = []
+    stack: List[bool] = []
+    skip = False
+    group_start = False
+    pending_unicode_skip = 0
+    carry = ""
+
+    with open(path, "r", encoding="latin-1") as f:
+        while True:
+            chunk = f.read(READ_CHUNK_SIZE)
+            data = carry + chunk
+            at_eof = not chunk
+            processed = 0
+            for match in _RTF_TOKEN_RE.finditer(data):
+                # A token touching the end of the buffer may be cut short.
+                if not at_eof and match.end() == len(data):
+                    break
+                processed = match.end()
+                word, arg, hex_byte, symbol, brace, text = match.groups()
+
+                if brace == "{":
+                    stack.append(skip)
+                    group_start = True
+                    continue
+                if brace == "}":
+                    skip = stack.pop() if stack else False
+                    group_start = False
+                    continue
+                if word is not None:
+                    if group_start and word in _RTF_SKIP_DESTINATIONS:
+                        skip = True
+                    group_start = False
+                    if skip:
+                        continue
+                    if word == "page":
+                        yield "".join(page)
+                        page = []
+                    elif word in _RTF_NEWLINE_WORDS:
+                        page.append("\n")
+                    elif word in ("tab", "cell"):
+                        page.append("\t")
+                    elif word == "u" and arg is not None:
+                        page.append(chr(int(arg) % 0x10000))
+                        pending_unicode_skip = 1
+                    continue
+                if symbol is not None:
+                    if group_start and symbol == "*":
+                        skip = True
+                    group_start = False
+                    if not skip:
+                        page.append(_RTF_SYMBOLS.get(symbol, ""))
+                    continue
+                group_start = False
+                if skip:
+                    continue
+                if hex_byte is not None:
+                    if pending_unicode_skip:
+                        pending_unicode_skip = 0
+                    else:
+                        page.append(bytes([int(hex_byte, 16)]).decode("cp1252", errors="replace"))
+                elif text is not None:
+                    if pending_unicode_skip:
+                        text = text[pending_unicode_skip:]
+                        pending_unicode_skip = 0
+                    page.append(text)
+            if at_eof:
+                break
+            carry = data[processed:]
+
+    if page:
+        yield "".join(page)
@@ -0,0 +1,38 @@
+"""
+Plain text backend.
+
+TXT is read in fixed-size chunks. Pages are delimited by form feeds, and
+very long runs without one are split every ``TEXT_PAGE_CHARS``.
+"""
+
+from pathlib import Path
+from typing import Iterator, List
+
+# Characters read from disk per step.
+READ_CHUNK_SIZE = 64 * 1024
+
+# Maximum characters of unbroken plain text emitted as one page.
+TEXT_PAGE_CHARS = 64 * 1024
+
+
+def iter_pages(path: Path) -> Iterator[str]:
+    """Yield the pages of a plain text file."""
+    buffer: List[str] = []
+    size = 0
+    with open(path, "r", encoding="utf-8", errors="replace", newline=None) as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), ""):
+            *complete, chunk = chunk.split("\f")
+            for piece in complete:
+                buffer.append(piece)
+                yield "".join(buffer)
+                buffer, size = [], 0
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= TEXT_PAGE_CHARS:
+                text = "".join(buffer)
+                cut = text.rfind("\n", 0, TEXT_PAGE_CHARS) + 1 or TEXT_PAGE_CHARS
+                yield text[:cut]
+                buffer, size = [text[cut:]], len(text) - cut
+    text = "".join(buffer)
+    if text:
+        yield text
@@ -0,0 +1,373 @@
+"""Compact in-memory records for parsed resumes."""
+
+import threading
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from resumematch.utils.skills import default_skill_automaton
+
+
+class SkillVocabulary:
+    """
+    Shared table interning skill names as small integer ids.
+
+    Every ParsedResume stores its skills as an array of ids into a
+    vocabulary, so a skill name is held once per process instead of once
+    per resume.
+
+    Attributes:
+        names: Interned names; an id is an index into this list.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        """
+        Initialize the SkillVocabulary.
+
+        Args:
+            names: Names to intern up front, in id order.
+        """
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        for name in names:
+            self.intern(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"names": self.names}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["names"])
+
+    def intern(self, name: str) -> int:
+        """
+        Return the id of a name, adding it if it is new.
+
+        Args:
+            name: Skill name.
+
+        Returns:
+            Integer id of the name.
+        """
+        skill_id = self._ids.get(name)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(name)
+                if skill_id is None:
+                    skill_id = len(self.names)
+                    self.names.append(name)
+                    self._ids[name] = skill_id
+        return skill_id
+
+    def id_of(self, name: str) -> Optional[int]:
+        """
+        Look up the id of a name without interning it.
+
+        Args:
+            name: Skill name.
+
+        Returns:
+            The id, or None if the name is unknown.
+        """
+        return self._ids.get(name)
+
+    def encode(self, names: Iterable[str]) -> array:
+        """
+        Intern several names.
+
+        Args:
+            names: Skill names.
+
+        Returns:
+            Array of ids (typecode ``"I"``), in input order.
+        """
+        return array("I", [self.intern(name) for name in names])
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        """
+        Map ids back to names.
+
+        Args:
+            ids: Skill ids.
+
+        Returns:
+            List of names, in input order.
+        """
+        names = self.names
+        return [names[skill_id] for skill_id in ids]
+
+
+@lru_cache(maxsize=1)
+def default_vocabulary() -> SkillVocabulary:
+    """
+    Return the process-wide vocabulary shared by ParsedResume records.
+
+    It is seeded with the default skill taxonomy, so skill ids of known
+    skills equal their ids in ``default_skill_automaton()``.
+
+    Returns:
+        Shared SkillVocabulary instance.
+    """
+    return SkillVocabulary(default_skill_automaton().names)
+
+
+@dataclass
+class ContactInfo:
+    """Contact details of a candidate."""
+
+    __slots__ = ("name", "email", "phone")
+
+    name: Optional[str]
+    email: Optional[str]
+    phone: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ContactInfo":
+        return cls(data.get("name"), data.get("email"), data.get("phone"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.__slots__ if getattr(self, key)}
+
+
+@dataclass
+class WorkExperience:
+    """One position in a candidate's work history."""
+
+    __slots__ = ("title", "company", "start_date", "end_date", "description")
+
+    title: str
+    company: str
+    start_date: str
+    end_date: str
+    description: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkExperience":
+        return cls(*(data.get(key, "") for key in cls.__slots__))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+@dataclass
+class Education:
+    """One degree or course of study."""
+
+    __slots__ = ("degree", "institution", "year")
+
+    degree: str
+    institution: str
+    year: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Education":
+        return cls(*(data.get(key, "") for key in cls.__slots__))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+class ParsedResume:
+    """
+    Compact, ``__slots__``-based form of ``ResumeParser.parse`` output.
+
+    Skills are held as an array of ids into a shared SkillVocabulary and
+    the nested records as slotted objects in tuples, which removes most
+    of the per-resume dict overhead when hundreds of thousands of parsed
+    resumes are kept in memory. ``raw_text`` can be kept, dropped, or
+    produced on demand by a loader callable.
+
+    ``ResumeMatcher`` accepts ParsedResume wherever it accepts a parsed
+    resume dict, and ``to_dict`` restores the dict form.
+
+    The shared ``default_vocabulary()`` only ever holds the default skill
+    taxonomy: records built on it keep skills outside the taxonomy by
+    name in ``extra_skills`` instead of interning them, so the shared
+    ids (and the cascade's skill bitmaps) never shift.
+
+    Attributes:
+        contact_info: Candidate contact details.
+        work_experience: Work history entries.
+        education: Education entries.
+        skill_ids: Skill ids in ``vocabulary``.
+        extra_skills: Skill names not in ``vocabulary``.
+        certifications: Certification names.
+        vocabulary: SkillVocabulary the skill ids refer to.
+    """
+
+    __slots__ = (
+        "contact_info",
+        "work_experience",
+        "education",
+        "skill_ids",
+        "extra_skills",
+        "certifications",
+        "vocabulary",
+        "_raw_text",
+        "_text_loader",
+    )
+
+    def __init__(
+        self,
+        contact_info: ContactInfo,
+        work_experience: Sequence[WorkExperience] = (),
+        education: Sequence[Education] = (),
+        skill_ids: Iterable[int] = (),
+        certifications: Sequence[str] = (),
+        raw_text: Optional[str] = None,
+        text_loader: Optional[Callable[[], str]] = None,
+        vocabulary: Optional[SkillVocabulary] = None,
+        extra_skills: Sequence[str] = (),
+    ):
+        """
+        Initialize the ParsedResume.
+
+        Args:
+            contact_info: Candidate contact details.
+            work_experience: Work history entries.
+            education: Education entries.
+            skill_ids: Skill ids in vocabulary.
+            certifications: Certification names.
+            raw_text: Resume text, or None to not hold it.
+            text_loader: Optional callable producing the text on demand
+                        when raw_text is not held.
+            vocabulary: SkillVocabulary of skill_ids (default: the shared
+                       ``default_vocabulary()``).
+            extra_skills: Skill names not in vocabulary.
+        """
+        self.contact_info = contact_info
+        self.work_experience: Tuple[WorkExperience, ...] = tuple(work_experience)
+        self.education: Tuple[Education, ...] = tuple(education)
+        self.skill_ids = array("I", skill_ids)
+        self.extra_skills: Tuple[str, ...] = tuple(extra_skills)
+        self.certifications: Tuple[str, ...] = tuple(certifications)
+        self.vocabulary = vocabulary if vocabulary is not None else default_vocabulary()
+        self._raw_text = raw_text
+        self._text_loader = text_loader
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        vocabulary: Optional[SkillVocabulary] = None,
+        keep_text: bool = True,
+        text_loader: Optional[Callable[[], str]] = None,
+    ) -> "ParsedResume":
+        """
+        Build a ParsedResume from ``ResumeParser.parse`` output.
+
+        Args:
+            data: Parsed resume dictionary.
+            vocabulary: SkillVocabulary to intern skills into. By default
+                       the shared ``default_vocabulary()`` is used without
+                       growing it; unknown skills go to ``extra_skills``.
+            keep_text: Whether to hold ``raw_text`` in memory.
+            text_loader: Optional callable producing the text on demand
+                        when it is not kept.
+
+        Returns:
+            The compact record.
+        """
+        skills = data.get("skills", [])
+        extra_skills: List[str] = []
+        if vocabulary is not None:
+            skill_ids = vocabulary.encode(skills)
+        else:
+            vocabulary = default_vocabulary()
+            skill_ids = array("I")
+            for name in skills:
+                skill_id = vocabulary.id_of(name)
+                if skill_id is None:
+                    extra_skills.append(name)
+                else:
+                    skill_ids.append(skill_id)
+        return cls(
+            contact_info=ContactInfo.from_dict(data.get("contact_info") or {}),
+            work_experience=[WorkExperience.from_dict(e) for e in data.get("work_experience", [])],
+            education=[Education.from_dict(e) for e in data.get("education", [])],
+            skill_ids=skill_ids,
+            certifications=data.get("certifications", []),
+            raw_text=data.get("raw_text", "") if keep_text else None,
+            text_loader=text_loader,
+            vocabulary=vocabulary,
+            extra_skills=extra_skills,
+        )
+
+    @property
+    def skills(self) -> List[str]:
+        """Skill names resolved through the vocabulary, then the extra ones."""
+        return self.vocabulary.decode(self.skill_ids) + list(self.extra_skills)
+
+    @property
+    def raw_text(self) -> str:
+        """Resume text; loaded on each access if it is not held."""
+        if self._raw_text is not None:
+            return self._raw_text
+        if self._text_loader is not None:
+            return self._text_loader()
+        return ""
+
+    @property
+    def has_text(self) -> bool:
+        """Whether the text is held in memory."""
+        return self._raw_text is not None
+
+    def drop_text(self) -> None:
+        """Release the held text (a text loader, if any, is kept)."""
+        self._raw_text = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Read a field by its ``parse()`` dictionary key.
+
+        Args:
+            key: Field name as used in the parse dictionary.
+            default: Value returned for unknown keys.
+
+        Returns:
+            Field value in its dictionary form.
+        """
+        if key == "raw_text":
+            return self.raw_text
+        if key == "skills":
+            return self.skills
+        if key == "contact_info":
+            return self.contact_info.to_dict()
+        if key in ("work_experience", "education"):
+            return [entry.to_dict() for entry in getattr(self, key)]
+        if key == "certifications":
+            return list(self.certifications)
+        return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert back to the ``ResumeParser.parse`` dictionary format.
+
+        Returns:
+            Parsed resume dictionary.
+        """
+        return {
+            "contact_info": self.contact_info.to_dict(),
+            "work_experience": [entry.to_dict() for entry in self.work_experience],
+            "education": [entry.to_dict() for entry in self.education],
+            "skills": self.skills,
+            "certifications": list(self.certifications),
+            "raw_text": self.raw_text,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ParsedResume):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        name = self.contact_info.name or "?"
+        count = len(self.skill_ids) + len(self.extra_skills)
+        return f"ParsedResume({name!r}, {count} skills)"
@@ -1,8 +1,21 @@
 """Resume parsing implementation for multiple file formats."""
 
-from typing import Dict, Any
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, List, Optional
 from pathlib import Path
 
+from resumematch.parser.extractors import detect_format, extract_text, supported_formats
+from resumematch.parser.models import ParsedResume, SkillVocabulary
+from resumematch.parser.sections import SEGMENTER_VERSION, extract_sections
+from resumematch.utils.profiling import NULL_TIMER, StageTimer
+from resumematch.utils.skills import SkillAutomaton, default_skill_automaton
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    
+    from resumematch.parser.cache import ParseCache
+
 
 class ResumeParser:
     """
@@ -11,20 +24,70 @@ class ResumeParser:
     Supports multiple file formats including PDF, DOCX, and TXT.
     Extracts key information such as contact details, work experience,
     education, and skills.
+    
+    Formats are resolved through the backend registry in
+    ``resumematch.parser.extractors``: by suffix, or by sniffing the
+    file's leading bytes when the suffix is missing or unknown. More
+    formats can be added with ``extractors.register_backend``.
+    
+    Attributes:
+        cache: Optional ParseCache consulted before parsing a file.
+        max_pages: Optional limit on the number of pages read per file.
+        max_bytes: Optional limit on the extracted text size per file.
+        skills: SkillAutomaton used to fill the ``skills`` field.
+        mode: Default extraction mode, ``"fast"`` or ``"layout"``.
     """
     
+    # Built-in formats; registered backends extend is_supported_format.
     SUPPORTED_FORMATS = ['.pdf', '.docx', '.txt', '.rtf']
     
-    def __init__(self):
-        """Initialize the ResumeParser."""
-        pass
+    def __init__(
+        self,
+        cache: Optional["ParseCache"] = None,
+        max_pages: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        skills: Optional[SkillAutomaton] = None,
+        mode: str = "fast",
+    ):
+        """
+        Initialize the ResumeParser.
+        
+        Args:
+            cache: Optional ParseCache. When given, files whose content was
+                  parsed before are served from the cache after a single
+                  hashing pass.
+            max_pages: Optional limit on the number of pages read per file.
+                      Text extraction streams page by page and stops here.
+            max_bytes: Optional limit on the size of ``raw_text`` in UTF-8
+                      bytes, bounding memory per parse for huge uploads.
+            skills: Optional SkillAutomaton. Defaults to the shared
+                   automaton built from the default skill taxonomy.
+            mode: Default extraction mode. ``"fast"`` reads text in the
+                 order it is stored; ``"layout"`` rebuilds the visual
+                 reading order of PDFs (multi-column layouts, text drawn
+                 out of order) at several times the cost.
+        """
+        self.cache = cache
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.skills = skills if skills is not None else default_skill_automaton()
+        self.mode = mode
     
-    def parse(self, file_path: str) -> Dict[str, Any]:
+    def parse(
+        self,
+        file_path: str,
+        timer: Optional[StageTimer] = None,
+        mode: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Parse a resume file and extract structured information.
         
         Args:
             file_path: Path to the resume file.
+            timer: Optional StageTimer recording the ``file_io``,
+                  ``parse_cache``, ``extract``, ``sections`` and ``skills``
+                  stages.
+            mode: Extraction mode for this call, overriding ``self.mode``.
         
         Returns:
             Dictionary containing parsed resume data:
@@ -37,37 +100,252 @@ class ResumeParser:
         
         Raises:
             FileNotFoundError: If the file doesn't exist.
-            ValueError: If the file format is not supported.
+            ValueError: If the file format or the mode is not supported.
         """
+        timer = timer if timer is not None else NULL_TIMER
+        mode = mode or self.mode
         path = Path(file_path)
         
-        if not path.exists():
-            raise FileNotFoundError(f"Resume file not found: {file_path}")
+        with timer.stage("file_io"):
+            if not path.exists():
+                raise FileNotFoundError(f"Resume file not found: {file_path}")
+            file_format = detect_format(path)
         
-        if path.suffix.lower() not in self.SUPPORTED_FORMATS:
+        if file_format is None:
             raise ValueError(
                 f"Unsupported file format: {path.suffix}. "
-                f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
+                f"Supported formats: {', '.join(supported_formats())}"
             )
         
-        # Placeholder implementation
+        if self.cache is None:
+            return self._parse_file(path, timer, mode)
+        
+        with timer.stage("parse_cache"):
+            variant = f"{self.max_pages}:{self.max_bytes}:{mode}:{SEGMENTER_VERSION}"
+            key = self.cache.key_for(path, variant=variant)
+            data = self.cache.get(key)
+        if data is None:
+            data = self._parse_file(path, timer, mode)
+            with timer.stage("parse_cache"):
+                self.cache.put(key, data)
+        return data
+    
+    def parse_record(
+        self,
+        file_path: str,
+        keep_text: bool = True,
+        vocabulary: Optional[SkillVocabulary] = None,
+    ) -> ParsedResume:
+        """
+        Parse a resume file into a compact ParsedResume record.
+        
+        Args:
+            file_path: Path to the resume file.
+            keep_text: Whether the record holds ``raw_text`` in memory.
+                      When False, the text is re-extracted from the file
+                      on access instead.
+            vocabulary: SkillVocabulary to intern skills into (default:
+                       the shared vocabulary, which is never grown; see
+                       ``ParsedResume.from_dict``).
+        
+        Returns:
+            ParsedResume record of the file.
+        
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            ValueError: If the file format is not supported.
+        """
+        data = self.parse(file_path)
+        loader = None if keep_text else partial(
+            extract_text,
+            Path(file_path),
+            max_pages=self.max_pages,
+            max_bytes=self.max_bytes,
+            mode=self.mode,
+        )
+        return ParsedResume.from_dict(
+            data, vocabulary=vocabulary, keep_text=keep_text, text_loader=loader
+        )
+    
+    def _parse_file(
+        self, path: Path, timer: StageTimer = NULL_TIMER, mode: str = "fast"
+    ) -> Dict[str, Any]:
+        """
+        Extract structured information from a validated resume file.
+        
+        Args:
+            path: Path to an existing file in a supported format.
+            timer: StageTimer recording the extraction stages.
+            mode: Extraction mode.
+        
+        Returns:
+            Parsed resume data as documented on ``parse``.
+        """
+        with timer.stage("extract"):
+            raw_text = extract_text(
+                path, max_pages=self.max_pages, max_bytes=self.max_bytes, mode=mode
+            )
+        with timer.stage("sections"):
+            sections = extract_sections(raw_text)
+        with timer.stage("skills"):
+            skills = self.skills.find(raw_text)
+        
         return {
-            "contact_info": {},
-            "work_experience": [],
-            "education": [],
-            "skills": [],
-            "certifications": [],
-            "raw_text": "",
+            "contact_info": sections["contact_info"],
+            "work_experience": sections["work_experience"],
+            "education": sections["education"],
+            "skills": skills,
+            "certifications": sections["certifications"],
+            "raw_text": raw_text,
         }
     
     def is_supported_format(self, file_path: str) -> bool:
         """
         Check if a file format is supported.
         
+        A registered suffix is enough; other existing files are sniffed
+        the same way ``parse`` detects their format.
+        
         Args:
             file_path: Path to check.
         
         Returns:
             True if the format is supported, False otherwise.
         """
-        return Path(file_path).suffix.lower() in self.SUPPORTED_FORMATS
+        return detect_format(file_path) is not None
+    
+    def iter_parse(
+        self,
+        paths: Iterable[str],
+        workers: int = 1,
+        chunksize: int = 16,
+        max_in_flight: int = 0,
+        ordered: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Parse many resume files, yielding results as they become available.
+        
+        Paths are consumed lazily and sent to a process pool in chunks. At
+        most ``max_in_flight`` chunks are submitted or buffered at any
+        time, so memory stays bounded however many paths are supplied.
+        A file that fails to parse does not stop the run; its error is
+        reported inline.
+        
+        Args:
+            paths: Iterable of resume file paths (may be a generator).
+            workers: Number of worker processes. With 1 or fewer, files are
+                    parsed in the calling process.
+            chunksize: Number of files sent to a worker per task.
+            max_in_flight: Maximum number of chunks pending or buffered.
+                          Defaults to twice the number of workers.
+            ordered: If True, yield results in input order; otherwise
+                    yield chunks as soon as they finish.
+        
+        Yields:
+            One dictionary per path, containing ``resume_path`` and either
+            ``data`` (the ``parse`` result) or ``error`` (the message of
+            the exception raised while parsing).
+        """
+        chunks = _chunked(paths, max(1, chunksize))
+        
+        if workers <= 1:
+            for chunk in chunks:
+                yield from _parse_chunk(self, chunk)
+            return
+        
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        
+        limit = max_in_flight if max_in_flight > 0 else 2 * workers
+        # The parser (and its skill automaton) is sent to each worker once,
+        # so tasks only carry their paths.
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            pending: Dict["Future", int] = {}
+            finished: Dict[int, List[Dict[str, Any]]] = {}
+            submitted = 0
+            next_index = 0
+            exhausted = False
+            
+            while True:
+                while not exhausted and len(pending) + len(finished) < limit:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    pending[executor.submit(_parse_chunk_in_worker, chunk)] = submitted
+                    submitted += 1
+                
+                if not pending:
+                    break
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    if ordered:
+                        finished[index] = future.result()
+                    else:
+                        yield from future.result()
+                
+                while next_index in finished:
+                    yield from finished.pop(next_index)
+                    next_index += 1
+    
+    def parse_many(
+        self,
+        paths: Iterable[str],
+        workers: int = 1,
+        chunksize: int = 16,
+        ordered: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse many resume files and collect the results.
+        
+        Convenience wrapper around ``iter_parse`` for inputs small enough
+        to hold every result in memory.
+        
+        Args:
+            paths: Iterable of resume file paths.
+            workers: Number of worker processes.
+            chunksize: Number of files sent to a worker per task.
+            ordered: If True, results follow input order.
+        
+        Returns:
+            List of result dictionaries as yielded by ``iter_parse``.
+        """
+        return list(self.iter_parse(paths, workers=workers, chunksize=chunksize, ordered=ordered))
+
+
+def _chunked(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Split an iterable into lists of at most size items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# Parser of a worker process, set by _init_worker.
+_WORKER_PARSER: Optional[ResumeParser] = None
+
+
+def _init_worker(parser: ResumeParser) -> None:
+    global _WORKER_PARSER
+    _WORKER_PARSER = parser
+
+
+def _parse_chunk_in_worker(paths: List[str]) -> List[Dict[str, Any]]:
+    assert _WORKER_PARSER is not None
+    return _parse_chunk(_WORKER_PARSER, paths)
+
+
+def _parse_chunk(parser: ResumeParser, paths: List[str]) -> List[Dict[str, Any]]:
+    """Parse a chunk of files, capturing per-file errors."""
+    results = []
+    for path in paths:
+        try:
+            results.append({"resume_path": path, "data": parser.parse(path)})
+        except Exception as e:
+            results.append({"resume_path": path, "error": str(e)})
+    return results
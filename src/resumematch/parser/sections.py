@@ -0,0 +1,290 @@
+"""Single-pass segmentation of resume text into sections and fields."""
+
+import re
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+# Bumped whenever segmentation output changes, to invalidate parse caches.
+SEGMENTER_VERSION = 2
+
+# Section name -> heading phrases opening it.
+DEFAULT_HEADINGS: Dict[str, Tuple[str, ...]] = {
+    "contact": ("contact", "contact info", "contact information", "contact details"),
+    "summary": (
+        "summary", "professional summary", "profile", "objective", "about me", "career objective",
+    ),
+    "experience": (
+        "experience", "work experience", "professional experience", "employment",
+        "employment history", "work history", "career history", "relevant experience",
+    ),
+    "education": ("education", "academic background", "education and training", "qualifications"),
+    "skills": ("skills", "technical skills", "core competencies", "key skills", "technologies"),
+    "certifications": (
+        "certifications", "certification", "certificates", "licenses and certifications",
+        "licenses & certifications", "courses and certifications",
+    ),
+    "projects": ("projects", "personal projects", "selected projects"),
+    "other": ("interests", "hobbies", "languages", "references", "awards", "publications"),
+}
+
+# Lines longer than this are never headings, so they skip the regex.
+MAX_HEADING_LENGTH = 48
+
+# Section of the lines above the first heading.
+PREAMBLE = "contact"
+
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_PHONE_RE = re.compile(r"(?:\+\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)|\d{2,4})[\s.-]?\d{3,4}[\s.-]?\d{3,4}")
+_DATE = (
+    r"(?:(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?\s+(?:19|20)\d{2}"
+    r"|(?:0?[1-9]|1[0-2])/(?:19|20)\d{2}|(?:19|20)\d{2})"
+)
+_DATE_RANGE_RE = re.compile(
+    rf"(?P<start>{_DATE})\s*(?:-|–|—|to)\s*(?P<end>{_DATE}|present|current|now)\b",
+    re.IGNORECASE,
+)
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+_BULLET_RE = re.compile(r"^\s*(?:[-*•▪◦·]|\d+[.)])\s+")
+_DEGREE_RE = re.compile(
+    r"\b(?:bachelor|master|ph\.?\s?d|doctor|mba|b\.?\s?sc|m\.?\s?sc|b\.?\s?s\.?|m\.?\s?s\.?|"
+    r"b\.?\s?a\.?|m\.?\s?a\.?|b\.?\s?eng|m\.?\s?eng|associate|diploma|degree|certificate)\b",
+    re.IGNORECASE,
+)
+_INSTITUTION_RE = re.compile(
+    r"\b(?:university|college|institute|school|academy|polytechnic)\b", re.IGNORECASE
+)
+_SPLIT_RE = re.compile(r"\s*(?:,|\||\s+at\s+|\s+[-–—]\s+)\s*", re.IGNORECASE)
+
+Span = Tuple[int, int]
+
+
+class SectionSegmenter:
+    """
+    Splits resume text into sections with one linear pass over its lines.
+
+    All heading phrases are compiled into a single case-insensitive
+    alternation with one named group per section. Each line is
+    classified once: short lines are tested against the alternation and
+    either open a new section or continue the current one (a two-state
+    machine per line: heading or body). Field extractors then run only on
+    the lines of their own section, so the total cost is linear in the
+    document length regardless of the number of sections or fields.
+
+    Attributes:
+        headings: Section name -> heading phrases.
+    """
+
+    def __init__(self, headings: Optional[Mapping[str, Sequence[str]]] = None):
+        """
+        Compile the heading alternation.
+
+        Args:
+            headings: Optional section name -> heading phrases mapping
+                     (default: ``DEFAULT_HEADINGS``). Names must be valid
+                     identifiers.
+        """
+        self.headings = dict(headings if headings is not None else DEFAULT_HEADINGS)
+        alternatives = []
+        for section, phrases in self.headings.items():
+            # Longest phrases first, so "work experience" wins over "work".
+            ordered = sorted(phrases, key=len, reverse=True)
+            pattern = "|".join(r"\s+".join(map(re.escape, p.split())) for p in ordered)
+            alternatives.append(f"(?P<{section}>{pattern})")
+        self._heading_re = re.compile(
+            r"[\s#*_=-]*(?:" + "|".join(alternatives) + r")[\s:_=*-]*", re.IGNORECASE
+        )
+
+    def classify(self, line: str) -> Optional[str]:
+        """
+        Return the section a line opens, or None for a body line.
+
+        Args:
+            line: One line of text.
+
+        Returns:
+            Section name if the line is a heading.
+        """
+        if len(line) > MAX_HEADING_LENGTH:
+            return None
+        match = self._heading_re.fullmatch(line)
+        return match.lastgroup if match else None
+
+    def segment(self, lines: Sequence[str]) -> Dict[str, List[Span]]:
+        """
+        Find the line spans of every section.
+
+        Args:
+            lines: Text lines.
+
+        Returns:
+            Section name -> ``(start, end)`` line ranges (heading lines
+            excluded), in document order. Lines above the first heading
+            belong to ``PREAMBLE``. A section may have several spans.
+        """
+        spans: Dict[str, List[Span]] = {}
+        section, start = PREAMBLE, 0
+        classify = self.classify
+        for i, line in enumerate(lines):
+            opened = classify(line)
+            if opened is None:
+                continue
+            if i > start:
+                spans.setdefault(section, []).append((start, i))
+            section, start = opened, i + 1
+        if len(lines) > start:
+            spans.setdefault(section, []).append((start, len(lines)))
+        return spans
+
+    def extract(self, text: str) -> Dict[str, Any]:
+        """
+        Extract the structured fields of a resume.
+
+        Args:
+            text: Resume text.
+
+        Returns:
+            Dictionary with ``contact_info`` (name, email, phone),
+            ``work_experience`` (title, company, start_date, end_date,
+            description), ``education`` (degree, institution, year) and
+            ``certifications`` (names), in the ``ResumeParser.parse``
+            format.
+        """
+        lines = text.splitlines()
+        spans = self.segment(lines)
+
+        def section_lines(name: str) -> List[str]:
+            return [line for start, end in spans.get(name, ()) for line in lines[start:end]]
+
+        return {
+            "contact_info": _contact(section_lines("contact")),
+            "work_experience": _experience(section_lines("experience")),
+            "education": _education(section_lines("education")),
+            "certifications": _certifications(section_lines("certifications")),
+        }
+
+
+_DEFAULT_SEGMENTER: Optional[SectionSegmenter] = None
+
+
+def extract_sections(text: str) -> Dict[str, Any]:
+    """
+    Extract structured fields with the default SectionSegmenter.
+
+    Args:
+        text: Resume text.
+
+    Returns:
+        Fields as documented on ``SectionSegmenter.extract``.
+    """
+    global _DEFAULT_SEGMENTER
+    if _DEFAULT_SEGMENTER is None:
+        _DEFAULT_SEGMENTER = SectionSegmenter()
+    return _DEFAULT_SEGMENTER.extract(text)
+
+
+def _contact(lines: List[str]) -> Dict[str, str]:
+    contact: Dict[str, str] = {}
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if "email" not in contact:
+            email = _EMAIL_RE.search(stripped)
+            if email:
+                contact["email"] = email.group()
+        if "phone" not in contact:
+            phone = _PHONE_RE.search(_EMAIL_RE.sub(" ", stripped))
+            if phone:
+                contact["phone"] = phone.group().strip()
+        if (
+            "name" not in contact
+            and not any(ch.isdigit() or ch in "@:/|" for ch in stripped)
+            and len(stripped.split()) <= 5
+        ):
+            contact["name"] = stripped
+    return contact
+
+
+def _experience(lines: List[str]) -> List[Dict[str, str]]:
+    """Group lines into positions: a header, a date range, then description lines."""
+    entries: List[Dict[str, str]] = []
+    description: List[str] = []
+    pending: Optional[str] = None
+
+    def close() -> None:
+        if entries:
+            entries[-1]["description"] = "\n".join(description)
+        description.clear()
+
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        bullet = _BULLET_RE.match(stripped)
+        # Bullets are always description; only other lines pay for the date search.
+        dates = None if bullet else _DATE_RANGE_RE.search(stripped)
+        if dates is None:
+            if pending is not None:
+                description.append(pending)
+                pending = None
+            if bullet:
+                description.append(stripped[bullet.end():])
+            else:
+                pending = stripped
+            continue
+        close()
+        header = (stripped[:dates.start()] + stripped[dates.end():]).strip(" ,|()-–—")
+        if not header and pending is not None:
+            header = pending
+        pending = None
+        title, company = _split_pair(header)
+        entries.append({
+            "title": title,
+            "company": company,
+            "start_date": dates.group("start"),
+            "end_date": dates.group("end"),
+            "description": "",
+        })
+    if pending is not None:
+        description.append(pending)
+    close()
+    return entries
+
+
+def _education(lines: List[str]) -> List[Dict[str, str]]:
+    entries = []
+    for line in lines:
+        stripped = _BULLET_RE.sub("", line).strip()
+        if not stripped or not (_DEGREE_RE.search(stripped) or _INSTITUTION_RE.search(stripped)):
+            continue
+        years = _YEAR_RE.findall(stripped)
+        parts = [
+            part for part in map(str.strip, _SPLIT_RE.split(_DATE_RANGE_RE.sub("", stripped)))
+            if part and not _YEAR_RE.fullmatch(part)
+        ]
+        degree = next((p for p in parts if _DEGREE_RE.search(p)), "")
+        institution = next((p for p in parts if _INSTITUTION_RE.search(p) and p != degree), "")
+        if not institution:
+            institution = next((p for p in parts if p != degree), "")
+        entries.append({
+            "degree": degree,
+            "institution": institution,
+            "year": years[-1] if years else "",
+        })
+    return entries
+
+
+def _certifications(lines: List[str]) -> List[str]:
+    names = []
+    for line in lines:
+        stripped = _BULLET_RE.sub("", line).strip()
+        if stripped:
+            names.append(stripped)
+    return names
+
+
+def _split_pair(header: str) -> Tuple[str, str]:
+    """Split "Title, Company" (or "Title at Company", "Title | Company")."""
+    parts = [part for part in _SPLIT_RE.split(header, maxsplit=1) if part]
+    if len(parts) == 2:
+        return parts[0], parts[1]
+    return header, ""
@@ -0,0 +1,20 @@
+"""Long-running service keeping models and indexes warm behind a local RPC API."""
+
+from typing import TYPE_CHECKING
+
+from resumematch._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from resumematch.server.rpc import LocalClient, RPCClient, make_server, serve
+    from resumematch.server.service import ResumeService, RPCError
+
+__all__ = ["LocalClient", "RPCClient", "RPCError", "ResumeService", "make_server", "serve"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "LocalClient": "resumematch.server.rpc",
+    "RPCClient": "resumematch.server.rpc",
+    "RPCError": "resumematch.server.service",
+    "ResumeService": "resumematch.server.service",
+    "make_server": "resumematch.server.rpc",
+    "serve": "resumematch.server.rpc",
+})
@@ -0,0 +1,317 @@
+"""JSON-RPC over local HTTP or a Unix socket, and matching clients."""
+
+import http.client
+import itertools
+import json
+import os
+import socket
+import socketserver
+import threading
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Union
+
+from resumematch.server.service import ResumeService, RPCError
+
+# Default TCP address of ``resumematch serve``.
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Path requests are posted to.
+RPC_PATH = "/rpc"
+
+_PARSE_ERROR = -32700
+_INVALID_REQUEST = -32600
+
+
+def handle_request(service: ResumeService, body: bytes) -> Dict[str, Any]:
+    """
+    Execute one JSON-RPC 2.0 request.
+
+    Args:
+        service: ResumeService executing the call.
+        body: Request body, ``{"method": ..., "params": {...}, "id": ...}``.
+
+    Returns:
+        JSON-RPC response object with ``result`` or ``error``.
+    """
+    try:
+        request = json.loads(body)
+    except ValueError as error:
+        return _error(None, _PARSE_ERROR, f"Parse error: {error}")
+    if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+        return _error(None, _INVALID_REQUEST, "Invalid request")
+    request_id = request.get("id")
+    try:
+        result = service.call(request["method"], request.get("params"))
+    except RPCError as error:
+        return _error(request_id, error.code, str(error))
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802
+        if self.path != RPC_PATH:
+            self.send_error(404)
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        response = handle_request(self.server.service, body)  # type: ignore[attr-defined]
+        self._send_json(response)
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path != "/health":
+            self.send_error(404)
+            return
+        self._send_json({"status": "ok"})
+
+    def _send_json(self, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(
+    service: ResumeService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[str] = None,
+) -> socketserver.BaseServer:
+    """
+    Create (but do not start) an RPC server for a service.
+
+    Args:
+        service: ResumeService executing the calls.
+        host: TCP host to bind.
+        port: TCP port to bind (0 picks a free port).
+        socket_path: Unix socket path; when given, host and port are
+                    ignored. A stale socket file is replaced.
+
+    Returns:
+        Server whose ``serve_forever`` handles requests, one thread per
+        connection, all feeding the service's batching queue.
+    """
+    server: socketserver.BaseServer
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = _UnixServer(socket_path, _RequestHandler)
+    else:
+        server = _TCPServer((host, port), _RequestHandler)
+    server.service = service  # type: ignore[attr-defined]
+    return server
+
+
+def serve(
+    service: Optional[ResumeService] = None,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[str] = None,
+) -> None:
+    """
+    Serve a ResumeService until interrupted.
+
+    Args:
+        service: Optional ResumeService (a default one is created).
+        host: TCP host to bind.
+        port: TCP port to bind.
+        socket_path: Unix socket path to listen on instead of TCP.
+    """
+    service = service or ResumeService()
+    server = make_server(service, host, port, socket_path)
+    with service:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if socket_path is not None and os.path.exists(socket_path):
+                os.unlink(socket_path)
+
+
+class _ClientMethods(ABC):
+    """Typed wrappers shared by the clients; subclasses implement ``call``."""
+
+    @abstractmethod
+    def call(self, method: str, **params: Any) -> Any:
+        """
+        Execute a method.
+
+        Args:
+            method: Service method name.
+            **params: Method parameters.
+
+        Returns:
+            The method's JSON-compatible result.
+
+        Raises:
+            RPCError: If the method is unknown, invalid or fails.
+        """
+
+    def analyze(self, resume_path: str, job_description: Optional[str] = None) -> Dict[str, Any]:
+        """Analyze a resume file (see ``ResumeAnalyzer.analyze``)."""
+        return self.call("analyze", resume_path=resume_path, job_description=job_description)
+
+    def match(self, resume_data: Dict[str, Any], job_description: str) -> Dict[str, Any]:
+        """Match parsed resume data (see ``ResumeMatcher.match``)."""
+        return self.call("match", resume_data=resume_data, job_description=job_description)
+
+    def ats_score(self, resume_data: Dict[str, Any]) -> float:
+        """Score ATS compatibility (see ``ResumeMatcher.calculate_ats_score``)."""
+        return self.call("ats_score", resume_data=resume_data)
+
+    def add_resume(
+        self,
+        resume_id: Any,
+        resume_data: Optional[Dict[str, Any]] = None,
+        resume_path: Optional[str] = None,
+    ) -> int:
+        """Index a resume for ``top_k``; returns the number indexed."""
+        params: Dict[str, Any] = {"resume_id": resume_id}
+        if resume_data is not None:
+            params["resume_data"] = resume_data
+        if resume_path is not None:
+            params["resume_path"] = resume_path
+        return self.call("add_resume", **params)
+
+    def top_k(self, job_description: str, k: int = 10) -> Any:
+        """Rank indexed resumes (see ``ResumeIndex.top_k``)."""
+        return self.call("top_k", job_description=job_description, k=k)
+
+
+class LocalClient(_ClientMethods):
+    """
+    In-process stand-in for RPCClient, for tests and embedding.
+
+    Calls go through the service's batching queue, and parameters and
+    results are round-tripped through JSON, exactly as over the wire.
+
+    Attributes:
+        service: ResumeService executing the calls.
+    """
+
+    def __init__(self, service: Optional[ResumeService] = None):
+        """
+        Initialize the LocalClient.
+
+        Args:
+            service: Optional ResumeService. A default one is created and
+                    owned (stopped by ``close``) if not given.
+        """
+        self._owned = service is None
+        self.service = service or ResumeService()
+        self.service.start()
+
+    def __enter__(self) -> "LocalClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def call(self, method: str, **params: Any) -> Any:
+        """
+        Execute a method.
+
+        Raises:
+            RPCError: If the method is unknown, invalid or fails.
+        """
+        result = self.service.call(method, json.loads(json.dumps(params)))
+        return json.loads(json.dumps(result))
+
+    def close(self) -> None:
+        """Stop the service if this client created it."""
+        if self._owned:
+            self.service.stop()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self._socket_path)
+
+
+class RPCClient(_ClientMethods):
+    """
+    Client of a running ``resumematch serve`` process.
+
+    One keep-alive connection is reused; calls from several threads are
+    serialized (use one client per thread for concurrency).
+    """
+
+    def __init__(
+        self,
+        address: Union[str, tuple] = (DEFAULT_HOST, DEFAULT_PORT),
+        timeout: Optional[float] = None,
+    ):
+        """
+        Initialize the RPCClient.
+
+        Args:
+            address: ``(host, port)``, ``"host:port"`` or a Unix socket path.
+            timeout: Optional socket timeout in seconds.
+        """
+        if isinstance(address, str) and ":" in address and "/" not in address:
+            host, _, port = address.rpartition(":")
+            address = (host, int(port))
+        if isinstance(address, str):
+            self._connection: http.client.HTTPConnection = _UnixHTTPConnection(address, timeout)
+        else:
+            self._connection = http.client.HTTPConnection(*address, timeout=timeout)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def __enter__(self) -> "RPCClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def call(self, method: str, **params: Any) -> Any:
+        """
+        Execute a method on the server.
+
+        Raises:
+            RPCError: If the server reports an error.
+        """
+        body = json.dumps(
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": next(self._ids)}
+        )
+        with self._lock:
+            self._connection.request(
+                "POST", RPC_PATH, body, {"Content-Type": "application/json"}
+            )
+            response = json.loads(self._connection.getresponse().read())
+        error = response.get("error")
+        if error is not None:
+            raise RPCError(error["code"], error["message"])
+        return response["result"]
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._connection.close()
+
+
+def _error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
@@ -0,0 +1,295 @@
+"""Warm, batching request dispatcher behind the RPC server."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from resumematch.core.analyzer import ResumeAnalyzer
+from resumematch.matcher.index import ResumeIndex
+
+# Default maximum number of requests executed as one batch.
+DEFAULT_MAX_BATCH = 64
+
+# Default time the dispatcher waits for more requests to join a batch.
+DEFAULT_MAX_WAIT = 0.002
+
+Params = Dict[str, Any]
+
+
+class RPCError(Exception):
+    """
+    Error reported to an RPC caller.
+
+    Codes follow JSON-RPC 2.0: -32601 unknown method, -32602 invalid
+    parameters, -32000 failure while handling the request.
+
+    Attributes:
+        code: Numeric error code.
+    """
+
+    METHOD_NOT_FOUND = -32601
+    INVALID_PARAMS = -32602
+    SERVER_ERROR = -32000
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+class ResumeService:
+    """
+    Long-lived owner of the parser, matcher and index, with dynamic batching.
+
+    Requests from any number of threads are queued. A single dispatcher
+    thread takes the first waiting request, keeps collecting requests for
+    up to ``max_wait`` seconds (or until ``max_batch`` are waiting), and
+    executes them grouped by method. For example, ``match`` requests for
+    the same job description run as one ``ResumeMatcher.match_many`` call.
+    All state is touched only by the dispatcher thread, so handlers need
+    no locking.
+
+    Methods (all parameters are JSON values):
+        - analyze(resume_path, job_description=None): ``ResumeAnalyzer.analyze``
+        - match(resume_data, job_description): ``ResumeMatcher.match``
+        - ats_score(resume_data): ``ResumeMatcher.calculate_ats_score``
+        - add_resume(resume_id, resume_data=None, resume_path=None): index
+          a resume for ``top_k`` (parsed from resume_path if no data given)
+        - top_k(job_description, k=10): ``ResumeIndex.top_k``
+        - stats(): number of indexed resumes and batches served
+
+    Attributes:
+        analyzer: ResumeAnalyzer holding the warm parser and matcher.
+        index: ResumeIndex searched by ``top_k``.
+        max_batch: Maximum number of requests executed as one batch.
+        max_wait: Seconds the dispatcher waits for a batch to fill.
+    """
+
+    def __init__(
+        self,
+        analyzer: Optional[ResumeAnalyzer] = None,
+        index: Optional[ResumeIndex] = None,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ):
+        """
+        Initialize the ResumeService.
+
+        Args:
+            analyzer: Optional ResumeAnalyzer (a default one is created).
+            index: Optional ResumeIndex (an empty one sharing the
+                  analyzer's matcher is created).
+            max_batch: Maximum number of requests executed as one batch.
+            max_wait: Seconds the dispatcher waits for a batch to fill.
+        """
+        self.analyzer = analyzer or ResumeAnalyzer()
+        self.index = index if index is not None else ResumeIndex(self.analyzer.matcher)
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait
+        self.batches = 0
+        self._handlers: Dict[str, Callable[[List[Params]], List[Any]]] = {
+            "analyze": self._analyze,
+            "match": self._match,
+            "ats_score": self._ats_score,
+            "add_resume": self._add_resume,
+            "top_k": self._top_k,
+            "stats": self._stats,
+        }
+        self._queue: "queue.Queue[Optional[Tuple[str, Params, Future]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def methods(self) -> List[str]:
+        """Names of the callable methods."""
+        return sorted(self._handlers)
+
+    def __enter__(self) -> "ResumeService":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start the dispatcher thread (idempotent)."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="resumematch-dispatcher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Finish queued requests and stop the dispatcher thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, method: str, params: Optional[Params] = None) -> "Future[Any]":
+        """
+        Queue a request.
+
+        Args:
+            method: Method name (see the class docstring).
+            params: Keyword parameters of the method.
+
+        Returns:
+            Future resolving to the result, or failing with RPCError.
+        """
+        future: "Future[Any]" = Future()
+        if method not in self._handlers:
+            future.set_exception(RPCError(RPCError.METHOD_NOT_FOUND, f"Unknown method: {method}"))
+        elif not isinstance(params or {}, dict):
+            future.set_exception(RPCError(RPCError.INVALID_PARAMS, "params must be an object"))
+        else:
+            self.start()
+            self._queue.put((method, dict(params or {}), future))
+        return future
+
+    def call(self, method: str, params: Optional[Params] = None) -> Any:
+        """
+        Execute a request and wait for its result.
+
+        Args:
+            method: Method name.
+            params: Keyword parameters of the method.
+
+        Returns:
+            The method's result.
+
+        Raises:
+            RPCError: If the method is unknown, its parameters are
+                     invalid or it fails.
+        """
+        return self.submit(method, params).result()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._execute(batch)
+            if stopping:
+                return
+
+    def _execute(self, batch: List[Tuple[str, Params, Future]]) -> None:
+        """
+        Run a batch grouped by method; failures only affect their own request.
+
+        Handlers return one result per request, or an exception instance
+        for a request that failed.
+        """
+        self.batches += 1
+        groups: Dict[str, List[Tuple[Params, Future]]] = {}
+        for method, params, future in batch:
+            groups.setdefault(method, []).append((params, future))
+        for method, requests in groups.items():
+            handler = self._handlers[method]
+            try:
+                results = handler([params for params, _ in requests])
+            except Exception as error:
+                if len(requests) == 1:
+                    _fail(requests[0][1], error)
+                    continue
+                # Re-run one by one so a bad request cannot fail its neighbours.
+                for params, future in requests:
+                    try:
+                        future.set_result(handler([params])[0])
+                    except Exception as single_error:
+                        _fail(future, single_error)
+                continue
+            for (_, future), result in zip(requests, results):
+                if isinstance(result, Exception):
+                    _fail(future, result)
+                else:
+                    future.set_result(result)
+
+    def _analyze(self, requests: List[Params]) -> List[Any]:
+        analyzer = self.analyzer
+        return [
+            analyzer.analyze(
+                _required(params, "resume_path"),
+                _job(analyzer.matcher, params.get("job_description")),
+            )
+            for params in requests
+        ]
+
+    def _match(self, requests: List[Params]) -> List[Any]:
+        matcher = self.analyzer.matcher
+        results: List[Any] = [None] * len(requests)
+        by_job: Dict[str, List[int]] = {}
+        for i, params in enumerate(requests):
+            _required(params, "resume_data")
+            by_job.setdefault(_required(params, "job_description"), []).append(i)
+        for job_description, positions in by_job.items():
+            resumes = [requests[i]["resume_data"] for i in positions]
+            for i, result in zip(positions, matcher.match_many(resumes, job_description)):
+                results[i] = result
+        return results
+
+    def _ats_score(self, requests: List[Params]) -> List[Any]:
+        resumes = [_required(params, "resume_data") for params in requests]
+        return self.analyzer.matcher.calculate_ats_scores(resumes)
+
+    def _add_resume(self, requests: List[Params]) -> List[Any]:
+        # Adding is not idempotent, so errors are returned per request
+        # instead of failing the batch and re-running it.
+        results: List[Any] = []
+        for params in requests:
+            try:
+                resume_id: Hashable = _hashable(_required(params, "resume_id"))
+                resume_data = params.get("resume_data")
+                if resume_data is None:
+                    resume_data = self.analyzer.parser.parse(_required(params, "resume_path"))
+                self.index.add(resume_id, resume_data)
+                results.append(len(self.index))
+            except Exception as error:
+                results.append(error)
+        return results
+
+    def _top_k(self, requests: List[Params]) -> List[Any]:
+        return [
+            self.index.top_k(_required(params, "job_description"), int(params.get("k", 10)))
+            for params in requests
+        ]
+
+    def _stats(self, requests: List[Params]) -> List[Any]:
+        stats = {"resumes": len(self.index), "batches": self.batches}
+        return [dict(stats) for _ in requests]
+
+
+def _required(params: Params, name: str) -> Any:
+    if name not in params:
+        raise RPCError(RPCError.INVALID_PARAMS, f"Missing parameter: {name}")
+    return params[name]
+
+
+def _job(matcher: Any, job_description: Optional[str]) -> Any:
+    """Compile the job once per batch; the matcher memoizes by text hash."""
+    return matcher.compile_job(job_description) if job_description else None
+
+
+def _fail(future: Future, error: Exception) -> None:
+    """Resolve a future with an error, wrapped as an RPCError."""
+    if not isinstance(error, RPCError):
+        error = RPCError(RPCError.SERVER_ERROR, f"{type(error).__name__}: {error}")
+    future.set_exception(error)
+
+
+def _hashable(value: Any) -> Hashable:
+    """JSON delivers tuples as lists; restore them so ids stay hashable."""
+    return tuple(_hashable(v) for v in value) if isinstance(value, list) else value
@@ -1,11 +1,45 @@
 """Utility functions and helpers."""
 
-from resumematch.utils.file_utils import validate_file_path, get_file_extension
-from resumematch.utils.text_utils import clean_text, normalize_whitespace
+from typing import TYPE_CHECKING
+
+from resumematch._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from resumematch.utils.columnar import ColumnarStore
+    from resumematch.utils.file_utils import validate_file_path, get_file_extension
+    from resumematch.utils.profiling import MetricsRegistry, StageTimer
+    from resumematch.utils.skills import SkillAutomaton, default_skill_automaton
+    from resumematch.utils.text_utils import (
+        TextNormalizer,
+        clean_text,
+        normalize_whitespace,
+        tokenize,
+    )
 
 __all__ = [
+    "ColumnarStore",
+    "MetricsRegistry",
+    "StageTimer",
+    "SkillAutomaton",
+    "default_skill_automaton",
+    "TextNormalizer",
     "validate_file_path",
     "get_file_extension",
     "clean_text",
     "normalize_whitespace",
+    "tokenize",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ColumnarStore": "resumematch.utils.columnar",
+    "MetricsRegistry": "resumematch.utils.profiling",
+    "StageTimer": "resumematch.utils.profiling",
+    "SkillAutomaton": "resumematch.utils.skills",
+    "default_skill_automaton": "resumematch.utils.skills",
+    "TextNormalizer": "resumematch.utils.text_utils",
+    "validate_file_path": "resumematch.utils.file_utils",
+    "get_file_extension": "resumematch.utils.file_utils",
+    "clean_text": "resumematch.utils.text_utils",
+    "normalize_whitespace": "resumematch.utils.text_utils",
+    "tokenize": "resumematch.utils.text_utils",
+})
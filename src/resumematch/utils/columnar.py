@@ -0,0 +1,415 @@
+"""Columnar, memory-mapped storage for parsed resumes and extracted features."""
+
+import json
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+from array import array
+from bisect import bisect_right
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Bumped whenever the on-disk layout changes.
+_FORMAT_VERSION = 1
+_MANIFEST = "manifest.json"
+
+# Column file name -> array typecode. Ragged columns are a values file
+# plus an offsets file with one more entry than the segment has rows.
+_COLUMNS = {
+    "ids.data": "B",
+    "ids.offsets": "q",
+    "skills.values": "i",
+    "skills.offsets": "q",
+    "terms.data": "B",
+    "terms.offsets": "q",
+    "postings.values": "i",
+    "postings.offsets": "q",
+    "vectors": "f",
+}
+
+# Default number of resumes per segment written by ``append_resumes``.
+DEFAULT_SEGMENT_SIZE = 100_000
+
+# (resume_id, skill_ids, keywords, vector or None)
+FeatureRow = Tuple[Hashable, Sequence[int], Iterable[str], Optional[Sequence[float]]]
+
+
+class Segment:
+    """
+    One immutable, memory-mapped segment of a ColumnarStore.
+
+    Every column is exposed as a memoryview over the mapped file, so
+    reads copy nothing until values are used.
+
+    Attributes:
+        path: Segment directory.
+        rows: Number of resumes in the segment.
+        vector_dim: Length of each feature vector (0 if none are stored).
+    """
+
+    def __init__(self, path: Path, rows: int, vector_dim: int):
+        """
+        Map a segment's column files.
+
+        Args:
+            path: Segment directory.
+            rows: Number of resumes in the segment.
+            vector_dim: Length of each feature vector.
+        """
+        self.path = path
+        self.rows = rows
+        self.vector_dim = vector_dim
+        self._maps: List[mmap.mmap] = []
+        self._columns: Dict[str, memoryview] = {}
+        for name, typecode in _COLUMNS.items():
+            file = path / name
+            if not file.exists() or not file.stat().st_size:
+                self._columns[name] = memoryview(array(typecode))
+                continue
+            with open(file, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps.append(mapped)
+            self._columns[name] = memoryview(mapped).cast(typecode)
+
+    def resume_id(self, row: int) -> Hashable:
+        """Return the id of a row."""
+        offsets = self._columns["ids.offsets"]
+        data = self._columns["ids.data"][offsets[row]:offsets[row + 1]]
+        return _hashable(json.loads(bytes(data)))
+
+    def skill_ids(self, row: int) -> memoryview:
+        """Return the skill ids of a row (zero-copy)."""
+        offsets = self._columns["skills.offsets"]
+        return self._columns["skills.values"][offsets[row]:offsets[row + 1]]
+
+    def vector(self, row: int) -> memoryview:
+        """Return the feature vector of a row (zero-copy)."""
+        if not self.vector_dim:
+            raise KeyError("No feature vectors stored")
+        start = row * self.vector_dim
+        return self._columns["vectors"][start:start + self.vector_dim]
+
+    def postings(self, term: str) -> memoryview:
+        """
+        Return the ascending rows containing a keyword (zero-copy).
+
+        The term dictionary is sorted, so lookup is a binary search over
+        the mapped bytes.
+        """
+        key = term.encode("utf-8")
+        offsets, data = self._columns["terms.offsets"], self._columns["terms.data"]
+        lo, hi = 0, len(offsets) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if bytes(data[offsets[mid]:offsets[mid + 1]]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        values = self._columns["postings.values"]
+        if lo < len(offsets) - 1 and bytes(data[offsets[lo]:offsets[lo + 1]]) == key:
+            bounds = self._columns["postings.offsets"]
+            return values[bounds[lo]:bounds[lo + 1]]
+        return values[0:0]
+
+    def close(self) -> None:
+        """
+        Release the mapped files.
+
+        Views handed out earlier keep their file mapped until they are
+        garbage collected.
+        """
+        for view in self._columns.values():
+            view.release()
+        self._columns.clear()
+        for mapped in self._maps:
+            try:
+                mapped.close()
+            except BufferError:
+                pass
+        self._maps.clear()
+
+
+class ColumnarStore:
+    """
+    Append-only columnar store of resume ids and extracted features.
+
+    Each segment is a directory of flat, native-endian array files:
+    resume ids, skill-id lists, a keyword dictionary with postings, and
+    optional float32 feature vectors. A JSON manifest lists the committed
+    segments and is replaced atomically, so readers never see a
+    half-written segment. Opening a store maps the files; nothing is
+    deserialized, so a worker cold-starts in time independent of the
+    number of resumes. Only one process should append at a time; any
+    number may read and pick up new segments with ``refresh``.
+
+    Attributes:
+        directory: Store directory.
+        segments: Mapped segments, oldest first.
+        vector_dim: Length of each feature vector (0 if none are stored).
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Open or create a store.
+
+        Args:
+            directory: Store directory (created if missing).
+
+        Raises:
+            ValueError: If the store was written by an incompatible
+                       version or on a machine of different byte order.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segments: List[Segment] = []
+        self.vector_dim = 0
+        self._manifest: Dict[str, Any] = {
+            "version": _FORMAT_VERSION, "byteorder": sys.byteorder,
+            "vector_dim": 0, "segments": [],
+        }
+        self._bases: List[int] = []
+        self._rows = 0
+        self.refresh()
+
+    def __enter__(self) -> "ColumnarStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def refresh(self) -> None:
+        """Map segments committed (by any writer) since the store was opened."""
+        path = self.directory / _MANIFEST
+        if not path.exists():
+            return
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        if manifest.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported columnar store format: {manifest.get('version')}")
+        if manifest["byteorder"] != sys.byteorder:
+            raise ValueError(f"Store was written on a {manifest['byteorder']}-endian machine")
+        self._manifest = manifest
+        self.vector_dim = manifest["vector_dim"]
+        for entry in manifest["segments"][len(self.segments):]:
+            self._map_segment(entry["name"], entry["rows"])
+
+    def append_segment(self, rows: Iterable[FeatureRow]) -> int:
+        """
+        Write rows as a new segment and commit it.
+
+        Args:
+            rows: Iterable of ``(resume_id, skill_ids, keywords, vector)``
+                 tuples. Ids must be JSON-serializable; vector may be None
+                 (stored as zeros when the store holds vectors).
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            ValueError: If a vector's length differs from the store's.
+            FileExistsError: If a directory with the new segment's name
+                            exists but is not in the manifest.
+        """
+        # Pick up segments committed by other writers, so the new segment
+        # gets a fresh name and the manifest keeps their entries.
+        self.refresh()
+        columns = {name: array(typecode) for name, typecode in _COLUMNS.items()}
+        columns["ids.offsets"].append(0)
+        columns["skills.offsets"].append(0)
+        postings: Dict[str, array] = {}
+        dim = self.vector_dim
+        count = 0
+        for row, (resume_id, skill_ids, keywords, vector) in enumerate(rows):
+            columns["ids.data"].frombytes(json.dumps(resume_id).encode("utf-8"))
+            columns["ids.offsets"].append(len(columns["ids.data"]))
+            columns["skills.values"].extend(skill_ids)
+            columns["skills.offsets"].append(len(columns["skills.values"]))
+            for term in set(keywords):
+                rows_of_term = postings.get(term)
+                if rows_of_term is None:
+                    rows_of_term = postings[term] = array("i")
+                rows_of_term.append(row)
+            if vector is not None and not dim:
+                dim = len(vector)
+                if self._rows:
+                    raise ValueError("Feature vectors must be stored from the first segment")
+                columns["vectors"].extend([0.0] * (row * dim))
+            if dim:
+                if vector is None:
+                    vector = [0.0] * dim
+                elif len(vector) != dim:
+                    raise ValueError(f"Expected vectors of length {dim}, got {len(vector)}")
+                columns["vectors"].extend(vector)
+            count += 1
+        if not count:
+            return 0
+
+        columns["terms.offsets"].append(0)
+        columns["postings.offsets"].append(0)
+        for key, term in sorted((term.encode("utf-8"), term) for term in postings):
+            columns["terms.data"].frombytes(key)
+            columns["terms.offsets"].append(len(columns["terms.data"]))
+            columns["postings.values"].extend(postings[term])
+            columns["postings.offsets"].append(len(columns["postings.values"]))
+
+        name = f"seg-{len(self.segments):06d}"
+        segment_dir = self.directory / name
+        if segment_dir.exists():
+            raise FileExistsError(f"Segment directory already exists: {segment_dir}")
+        tmp_dir = Path(tempfile.mkdtemp(prefix=f".{name}.", dir=self.directory))
+        try:
+            for column, values in columns.items():
+                with open(tmp_dir / column, "wb") as f:
+                    values.tofile(f)
+            # Never replaces a populated directory: mapped segments stay intact.
+            os.rename(tmp_dir, segment_dir)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        manifest = dict(self._manifest, vector_dim=dim)
+        manifest["segments"] = self._manifest["segments"] + [{"name": name, "rows": count}]
+        tmp = self.directory / (_MANIFEST + ".tmp")
+        tmp.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp, self.directory / _MANIFEST)
+        self._manifest = manifest
+        self.vector_dim = dim
+        self._map_segment(name, count)
+        return count
+
+    def append_resumes(
+        self,
+        resumes: Iterable[Tuple[Hashable, Any]],
+        matcher: Any,
+        embedder: Any = None,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+    ) -> int:
+        """
+        Extract features from parsed resumes and append them in segments.
+
+        Args:
+            resumes: Iterable of ``(resume_id, resume_data)`` pairs.
+            matcher: ResumeMatcher providing keyword extraction and the
+                    skill automaton whose ids are stored.
+            embedder: Optional HashingEmbedder; when given, its vectors
+                     are stored too.
+            segment_size: Maximum number of resumes per segment.
+
+        Returns:
+            Number of resumes written.
+        """
+        def features(item: Tuple[Hashable, Any]) -> FeatureRow:
+            resume_id, resume_data = item
+            raw_text = resume_data.get("raw_text", "")
+            skills = resume_data.get("skills", [])
+            skill_ids = dict.fromkeys(matcher.skills.find_ids(raw_text))
+            for skill in skills:
+                skill_ids.update(dict.fromkeys(matcher.skills.find_ids(str(skill))))
+            keywords = set(matcher.extract_keywords(raw_text)) | matcher._skill_terms(skills)
+            vector = embedder.embed_resume(resume_data) if embedder is not None else None
+            return resume_id, list(skill_ids), keywords, vector
+
+        items = map(features, resumes)
+        total = 0
+        while True:
+            written = self.append_segment(islice(items, max(1, segment_size)))
+            if not written:
+                return total
+            total += written
+
+    def resume_id(self, row: int) -> Hashable:
+        """
+        Return the id of a resume.
+
+        Args:
+            row: Row number across all segments.
+
+        Returns:
+            The resume id.
+        """
+        segment, local = self._locate(row)
+        return segment.resume_id(local)
+
+    def resume_ids(self) -> Iterator[Hashable]:
+        """Yield every resume id in row order."""
+        for segment in self.segments:
+            for row in range(segment.rows):
+                yield segment.resume_id(row)
+
+    def skill_ids(self, row: int) -> memoryview:
+        """
+        Return the skill ids of a resume without copying.
+
+        Args:
+            row: Row number across all segments.
+
+        Returns:
+            memoryview of int32 skill ids.
+        """
+        segment, local = self._locate(row)
+        return segment.skill_ids(local)
+
+    def vector(self, row: int) -> memoryview:
+        """
+        Return the feature vector of a resume without copying.
+
+        Args:
+            row: Row number across all segments.
+
+        Returns:
+            memoryview of float32 values.
+
+        Raises:
+            KeyError: If the store holds no feature vectors.
+        """
+        segment, local = self._locate(row)
+        return segment.vector(local)
+
+    def postings(self, term: str) -> array:
+        """
+        Return the rows of every resume containing a keyword.
+
+        Args:
+            term: Lowercase keyword, as produced by ``extract_keywords``.
+
+        Returns:
+            Ascending row numbers across all segments. Use
+            ``Segment.postings`` for zero-copy per-segment access.
+        """
+        rows = array("l")
+        for base, segment in zip(self._bases, self.segments):
+            local = segment.postings(term)
+            if base:
+                rows.extend(base + row for row in local)
+            else:
+                rows.extend(local)
+        return rows
+
+    def close(self) -> None:
+        """Release every mapped segment."""
+        for segment in self.segments:
+            segment.close()
+        self.segments.clear()
+        self._bases.clear()
+        self._rows = 0
+
+    def _map_segment(self, name: str, rows: int) -> None:
+        self.segments.append(Segment(self.directory / name, rows, self.vector_dim))
+        self._bases.append(self._rows)
+        self._rows += rows
+
+    def _locate(self, row: int) -> Tuple[Segment, int]:
+        if not 0 <= row < self._rows:
+            raise IndexError(f"Row out of range: {row}")
+        i = bisect_right(self._bases, row) - 1
+        return self.segments[i], row - self._bases[i]
+
+
+def _hashable(value: Any) -> Hashable:
+    """JSON round-trips tuples as lists; restore them so ids stay hashable."""
+    return tuple(_hashable(v) for v in value) if isinstance(value, list) else value
@@ -0,0 +1,194 @@
+"""Lightweight stage timing and metrics for the analysis pipeline."""
+
+import bisect
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+MetricsSink = Callable[[str, float], None]
+
+# Histogram bucket upper bounds in seconds (Prometheus defaults).
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Stage:
+    """Context manager timing one stage of a StageTimer."""
+
+    __slots__ = ("timer", "name", "start")
+
+    def __init__(self, timer: "StageTimer", name: str):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self) -> "_Stage":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.timer.record(self.name, time.perf_counter() - self.start)
+
+
+class _NullStage:
+    """Shared no-op context manager used when timing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_STAGE = _NullStage()
+
+
+class StageTimer:
+    """
+    Accumulates wall-clock time per named pipeline stage.
+
+    Use ``with timer.stage("extract"): ...`` around each stage. Repeated
+    stages add up. Every measurement is also forwarded to an optional
+    metrics sink, such as ``MetricsRegistry.observe``.
+
+    Attributes:
+        timings: Seconds spent per stage, in first-seen order.
+        sink: Optional callable receiving ``(stage, seconds)``.
+    """
+
+    enabled = True
+
+    def __init__(self, sink: Optional[MetricsSink] = None):
+        """
+        Initialize the StageTimer.
+
+        Args:
+            sink: Optional callable receiving ``(stage, seconds)`` for
+                 every measurement.
+        """
+        self.timings: Dict[str, float] = {}
+        self.sink = sink
+
+    def stage(self, name: str) -> _Stage:
+        """
+        Time a block of code as the given stage.
+
+        Args:
+            name: Stage name.
+
+        Returns:
+            Context manager measuring the enclosed block.
+        """
+        return _Stage(self, name)
+
+    def record(self, name: str, seconds: float) -> None:
+        """
+        Add a measurement for a stage.
+
+        Args:
+            name: Stage name.
+            seconds: Elapsed time in seconds.
+        """
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+        if self.sink is not None:
+            self.sink(name, seconds)
+
+
+class _NullTimer(StageTimer):
+    """StageTimer that measures nothing."""
+
+    enabled = False
+
+    def stage(self, name: str) -> _NullStage:  # type: ignore[override]
+        return _NULL_STAGE
+
+    def record(self, name: str, seconds: float) -> None:
+        return None
+
+
+# Shared disabled timer: the default wherever a timer is optional.
+NULL_TIMER: StageTimer = _NullTimer()
+
+
+class MetricsRegistry:
+    """
+    In-process counters and histograms of stage durations.
+
+    Pass ``registry.observe`` as the metrics sink of a StageTimer (or the
+    ``metrics_sink`` option of ResumeAnalyzer), then read ``snapshot()`` or
+    expose ``render()`` on a Prometheus scrape endpoint.
+
+    Attributes:
+        buckets: Histogram bucket upper bounds in seconds.
+        prefix: Metric name prefix used by ``render``.
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "resumematch_stage"
+    ):
+        """
+        Initialize the MetricsRegistry.
+
+        Args:
+            buckets: Increasing histogram bucket upper bounds in seconds.
+            prefix: Metric name prefix used by ``render``.
+        """
+        self.buckets = tuple(buckets)
+        self.prefix = prefix
+        self._counts: Dict[str, List[int]] = {}
+        self._sums: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """
+        Record one stage duration.
+
+        Args:
+            stage: Stage name.
+            seconds: Elapsed time in seconds.
+        """
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            counts = self._counts.get(stage)
+            if counts is None:
+                counts = self._counts[stage] = [0] * (len(self.buckets) + 1)
+                self._sums[stage] = 0.0
+            counts[index] += 1
+            self._sums[stage] += seconds
+
+    __call__ = observe
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize the recorded durations.
+
+        Returns:
+            Mapping of stage name to ``count``, ``sum`` and ``mean`` (seconds).
+        """
+        with self._lock:
+            summary = {}
+            for stage, counts in self._counts.items():
+                count = sum(counts)
+                total = self._sums[stage]
+                summary[stage] = {"count": count, "sum": total, "mean": total / count}
+            return summary
+
+    def render(self) -> str:
+        """
+        Render the histograms in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text with one histogram labelled per stage.
+        """
+        name = f"{self.prefix}_seconds"
+        lines = [f"# TYPE {name} histogram"]
+        with self._lock:
+            for stage, counts in sorted(self._counts.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {self._sums[stage]!r}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {cumulative}')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,300 @@
+"""Skill taxonomy compiled into an Aho-Corasick automaton."""
+
+import marshal
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Tuple, Union
+
+# Canonical skill name -> synonyms and spelling variants (matched
+# case-insensitively; the canonical name matches too unless it is listed
+# in CONTEXT_ONLY_SKILLS). Single letter languages and "Go" are left out,
+# and no bare abbreviation that doubles as a common word or file suffix
+# ("ts", "dl") is listed: as whole words they are far more often ordinary
+# English than skills.
+DEFAULT_TAXONOMY: Dict[str, List[str]] = {
+    "Python": ["python3", "py3"],
+    "Java": [],
+    "JavaScript": ["js", "ecmascript", "es6"],
+    "TypeScript": [],
+    "C++": ["cpp"],
+    "C#": ["csharp", "c sharp"],
+    "Golang": [],
+    "Rust": ["rust lang", "rustlang", "rust programming"],
+    "Ruby": [],
+    "PHP": [],
+    "Scala": [],
+    "Kotlin": [],
+    "Swift": ["swiftui", "swift ui", "swift programming"],
+    "SQL": [],
+    "Bash": ["shell scripting"],
+    "HTML": ["html5"],
+    "CSS": ["css3"],
+    "Node.js": ["nodejs", "node js"],
+    "React": ["reactjs", "react.js", "react native", "react hooks"],
+    "Angular": ["angularjs"],
+    "Vue.js": ["vue", "vuejs"],
+    "Django": [],
+    "Flask": [],
+    "FastAPI": [],
+    "Spring": ["spring boot", "springboot", "spring framework", "spring mvc"],
+    ".NET": ["dotnet", "asp.net"],
+    "PostgreSQL": ["postgres", "psql"],
+    "MySQL": [],
+    "MongoDB": ["mongo"],
+    "Redis": [],
+    "Elasticsearch": ["elastic search"],
+    "Kafka": ["apache kafka"],
+    "Spark": ["apache spark", "pyspark"],
+    "Hadoop": [],
+    "Airflow": ["apache airflow"],
+    "AWS": ["amazon web services"],
+    "Azure": ["microsoft azure"],
+    "GCP": ["google cloud", "google cloud platform"],
+    "Docker": [],
+    "Kubernetes": ["k8s"],
+    "Terraform": [],
+    "Ansible": [],
+    "Jenkins": [],
+    "CI/CD": ["continuous integration", "continuous delivery", "continuous deployment"],
+    "Git": ["github", "gitlab"],
+    "Linux": ["unix"],
+    "REST": ["restful", "rest api", "rest apis"],
+    "GraphQL": [],
+    "Microservices": ["microservice"],
+    "Machine Learning": ["ml"],
+    "Deep Learning": [],
+    "Natural Language Processing": ["nlp"],
+    "Computer Vision": [],
+    "Data Analysis": ["data analytics"],
+    "Statistics": [],
+    "TensorFlow": [],
+    "PyTorch": ["torch"],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "pandas": [],
+    "NumPy": [],
+    "Tableau": [],
+    "Power BI": ["powerbi"],
+    "Excel": ["microsoft excel", "ms excel"],
+    "Agile": [],
+    "Scrum": [],
+    "Project Management": [],
+    "Leadership": ["team leadership", "technical leadership", "leadership skills"],
+    "Communication": ["communication skills", "written communication", "verbal communication"],
+}
+
+# Skills whose canonical name is also an everyday word ("Spring 2020",
+# "react to incidents", "Excel at ..."): only their synonyms, which carry
+# the context that makes them a skill, are matched.
+CONTEXT_ONLY_SKILLS = frozenset(
+    {"Rust", "Swift", "React", "Spring", "Excel", "Leadership", "Communication"}
+)
+
+# Characters that continue a word, so a match next to them is rejected.
+_WORD_CHARS = frozenset("+#_")
+
+# Bumped whenever the serialized layout changes.
+_FORMAT_VERSION = 1
+
+
+class SkillAutomaton:
+    """
+    Aho-Corasick automaton over a skill taxonomy.
+
+    All names and synonyms are compiled once into a trie with failure
+    links, so finding every known skill in a document is a single pass
+    over its case-folded text, independent of the number of skills.
+    Matches must start and end on word boundaries, and overlapping
+    matches are resolved leftmost-longest ("google cloud platform" wins
+    over "google cloud").
+
+    Automata can be saved to and loaded from disk, and pickled, without
+    rebuilding the trie.
+
+    Attributes:
+        names: Canonical skill names; a skill's id is its index here.
+    """
+
+    def __init__(
+        self, taxonomy: Mapping[str, Iterable[str]], context_only: Iterable[str] = ()
+    ):
+        """
+        Compile a taxonomy into an automaton.
+
+        Args:
+            taxonomy: Mapping of canonical skill name to its synonyms.
+            context_only: Canonical names that are not matched themselves,
+                         only through their synonyms.
+        """
+        self.names: List[str] = list(taxonomy)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._outputs: List[Tuple[Tuple[int, int], ...]] = [()]
+
+        context_only = frozenset(context_only)
+        outputs: List[List[Tuple[int, int]]] = [[]]
+        for skill_id, name in enumerate(self.names):
+            patterns = {s.casefold() for s in taxonomy[name]}
+            if name not in context_only:
+                patterns.add(name.casefold())
+            for pattern in patterns:
+                if pattern:
+                    state = self._insert(pattern, outputs)
+                    outputs[state].append((skill_id, len(pattern)))
+        self._fail = self._link(outputs)
+        self._outputs = [tuple(out) for out in outputs]
+        self._prepare_scan()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getstate__(self) -> Tuple:
+        return (_FORMAT_VERSION, self.names, self._goto, self._fail, self._outputs)
+
+    def __setstate__(self, state: Tuple) -> None:
+        version, self.names, self._goto, self._fail, self._outputs = state
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported skill automaton format: {version}")
+        self._prepare_scan()
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Find skill mentions in text.
+
+        Args:
+            text: Text to scan.
+
+        Yields:
+            ``(start, end, skill_id)`` for each non-overlapping match, in
+            order, with offsets into ``text.casefold()``.
+        """
+        folded = text.casefold()
+        delta, outputs = self._delta, self._outputs
+        n = len(folded)
+        candidates = []
+        state = 0
+        for end, ch in enumerate(folded, start=1):
+            nxt = delta[state].get(ch)
+            if nxt is None:
+                nxt = delta[state][ch] = self._transition(state, ch)
+            state = nxt
+            if not outputs[state]:
+                continue
+            if end < n and _is_word_char(folded[end]):
+                continue
+            for skill_id, length in outputs[state]:
+                start = end - length
+                if start == 0 or not _is_word_char(folded[start - 1]):
+                    candidates.append((start, -length, skill_id))
+
+        candidates.sort()
+        position = 0
+        for start, neg_length, skill_id in candidates:
+            if start >= position:
+                position = start - neg_length
+                yield start, position, skill_id
+
+    def find_ids(self, text: str) -> List[int]:
+        """
+        Find the ids of the skills mentioned in text.
+
+        Args:
+            text: Text to scan.
+
+        Returns:
+            Unique skill ids in order of first mention.
+        """
+        return list(dict.fromkeys(skill_id for _, _, skill_id in self.iter_matches(text)))
+
+    def find(self, text: str) -> List[str]:
+        """
+        Find the canonical names of the skills mentioned in text.
+
+        Args:
+            text: Text to scan.
+
+        Returns:
+            Unique canonical skill names in order of first mention.
+        """
+        return [self.names[skill_id] for skill_id in self.find_ids(text)]
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write the compiled automaton to disk.
+
+        Args:
+            path: Destination file.
+        """
+        Path(path).write_bytes(marshal.dumps(self.__getstate__()))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SkillAutomaton":
+        """
+        Load an automaton written by ``save`` without recompiling it.
+
+        Args:
+            path: File written by ``save``.
+
+        Returns:
+            The loaded SkillAutomaton.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version.
+        """
+        automaton = cls.__new__(cls)
+        automaton.__setstate__(marshal.loads(Path(path).read_bytes()))
+        return automaton
+
+    def _prepare_scan(self) -> None:
+        """Build the scanning helpers that are derived from the trie."""
+        # Full transition table, completed lazily from the failure links
+        # as characters are seen, so scanning never walks failure chains.
+        self._delta = [dict(edges) for edges in self._goto]
+
+    def _transition(self, state: int, ch: str) -> int:
+        """Follow failure links to the state reached from state on ch."""
+        while state and ch not in self._goto[state]:
+            state = self._fail[state]
+        return self._goto[state].get(ch, 0)
+
+    def _insert(self, pattern: str, outputs: List[List[Tuple[int, int]]]) -> int:
+        """Add a pattern to the trie and return its final state."""
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                outputs.append([])
+            state = nxt
+        return state
+
+    def _link(self, outputs: List[List[Tuple[int, int]]]) -> List[int]:
+        """Compute failure links breadth-first and merge suffix outputs."""
+        fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in self._goto[f]:
+                    f = fail[f]
+                fail[nxt] = self._goto[f].get(ch, 0)
+                outputs[nxt].extend(outputs[fail[nxt]])
+        return fail
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch in _WORD_CHARS
+
+
+@lru_cache(maxsize=1)
+def default_skill_automaton() -> SkillAutomaton:
+    """
+    Return the automaton for ``DEFAULT_TAXONOMY``, built once per process.
+
+    The names in ``CONTEXT_ONLY_SKILLS`` only match through their synonyms.
+
+    Returns:
+        Shared SkillAutomaton instance.
+    """
+    return SkillAutomaton(DEFAULT_TAXONOMY, context_only=CONTEXT_ONLY_SKILLS)
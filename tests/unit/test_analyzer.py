@@ -1,5 +1,7 @@
 """Test cases for the ResumeAnalyzer class."""
 
+import asyncio
+
 import pytest
 from resumematch import ResumeAnalyzer
 
@@ -18,12 +20,12 @@ def test_resume_analyzer_with_config():
     assert analyzer.config == config
 
 
-def test_analyze_returns_dict():
+def test_analyze_returns_dict(tmp_path):
     """Test that analyze method returns a dictionary."""
     analyzer = ResumeAnalyzer()
-    # Note: This is a placeholder test. In a real implementation,
-    # we would need to create a test resume file.
-    result = analyzer.analyze("test_resume.pdf")
+    resume_file = tmp_path / "test_resume.txt"
+    resume_file.write_text("Sample resume")
+    result = analyzer.analyze(str(resume_file))
     assert isinstance(result, dict)
     assert "overall_score" in result
     assert "keywords" in result
@@ -36,3 +38,161 @@ def test_get_version():
     analyzer = ResumeAnalyzer()
     version = analyzer.get_version()
     assert version == "0.1.0"
+
+
+def test_analyze_nonexistent_file():
+    """Test that analyze raises FileNotFoundError for missing resumes."""
+    analyzer = ResumeAnalyzer()
+    with pytest.raises(FileNotFoundError):
+        analyzer.analyze("test_resume.pdf")
+
+
+def test_analyze_uses_parse_cache(tmp_path):
+    """Test that a configured parse cache is filled by analyze."""
+    analyzer = ResumeAnalyzer(config={"parse_cache_path": str(tmp_path / "cache.db")})
+    resume_file = tmp_path / "resume.txt"
+    resume_file.write_text("Sample resume")
+
+    analyzer.analyze(str(resume_file), "Python developer")
+    analyzer.analyze(str(resume_file), "Java developer")
+
+    assert len(analyzer.parser.cache) == 1
+
+
+def _write_resumes(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"resume_{i}.txt"
+        path.write_text(f"Python developer number {i}")
+        paths.append(str(path))
+    return paths
+
+
+def test_analyze_async_matches_analyze(tmp_path):
+    """Test that analyze_async returns the same result as analyze."""
+    analyzer = ResumeAnalyzer()
+    path = _write_resumes(tmp_path, 1)[0]
+
+    result = asyncio.run(analyzer.analyze_async(path, "Python developer"))
+
+    assert result == analyzer.analyze(path, "Python developer")
+
+
+def test_analyze_many_async_reports_errors_inline(tmp_path):
+    """Test that analyze_many_async yields every resume, including failures."""
+    analyzer = ResumeAnalyzer()
+    paths = _write_resumes(tmp_path, 5) + [str(tmp_path / "missing.pdf")]
+
+    async def collect():
+        return [r async for r in analyzer.analyze_many_async(paths, "Python", concurrency=2)]
+
+    results = asyncio.run(collect())
+
+    assert sorted(r["resume_path"] for r in results) == sorted(paths)
+    errors = [r for r in results if "error" in r]
+    assert [r["resume_path"] for r in errors] == [paths[-1]]
+    assert all(r["analysis"]["overall_score"] == 100.0 for r in results if "analysis" in r)
+
+
+def test_analyze_many_async_bounds_concurrency(tmp_path):
+    """Test that no more than `concurrency` analyses run at once."""
+    analyzer = ResumeAnalyzer()
+    paths = _write_resumes(tmp_path, 12)
+    running = []
+    peak = []
+    original = analyzer.analyze_async
+
+    async def tracked(path, job=None, executor=None):
+        running.append(path)
+        peak.append(len(running))
+        try:
+            await asyncio.sleep(0.01)
+            return await original(path, job, executor)
+        finally:
+            running.remove(path)
+
+    analyzer.analyze_async = tracked
+
+    async def source():
+        for path in paths:
+            yield path
+
+    async def collect():
+        return [r async for r in analyzer.analyze_many_async(source(), concurrency=3)]
+
+    results = asyncio.run(collect())
+
+    assert len(results) == 12
+    assert max(peak) == 3
+
+
+def test_analyze_many_async_yields_in_completion_order(tmp_path):
+    """Test that finished results are yielded while the input is still slow."""
+    analyzer = ResumeAnalyzer()
+    slow, fast, last = _write_resumes(tmp_path, 3)
+    original = analyzer.analyze_async
+
+    async def delayed(path, job=None, executor=None):
+        await asyncio.sleep(0.05 if path == slow else 0)
+        return await original(path, job, executor)
+
+    analyzer.analyze_async = delayed
+
+    async def source():
+        yield slow
+        yield fast
+        await asyncio.sleep(0.3)
+        yield last
+
+    async def collect():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        return [
+            (r["resume_path"], loop.time() - start)
+            async for r in analyzer.analyze_many_async(source(), concurrency=3)
+        ]
+
+    results = asyncio.run(collect())
+
+    assert [path for path, _ in results] == [fast, slow, last]
+    assert results[1][1] < 0.3
+
+
+def test_analyze_many_async_rejects_bad_concurrency():
+    """Test that concurrency below 1 raises ValueError."""
+    analyzer = ResumeAnalyzer()
+
+    async def consume():
+        async for _ in analyzer.analyze_many_async([], concurrency=0):
+            pass
+
+    with pytest.raises(ValueError):
+        asyncio.run(consume())
+
+
+def test_analyze_timings_only_when_profiling(tmp_path):
+    """Test that the timing breakdown is opt-in."""
+    resume_file = tmp_path / "resume.txt"
+    resume_file.write_text("Python developer with Docker experience")
+
+    assert "timings" not in ResumeAnalyzer().analyze(str(resume_file))
+
+    analyzer = ResumeAnalyzer(config={"profile": True})
+    result = analyzer.analyze(str(resume_file), "Python and Docker required")
+    timings = result["timings"]
+    for stage in ("file_io", "extract", "skills", "keywords", "ats_score", "match", "total"):
+        assert stage in timings
+    assert timings["total"] >= timings["extract"]
+
+
+def test_analyze_metrics_sink(tmp_path):
+    """Test that every stage measurement reaches the metrics sink."""
+    from resumematch.utils import MetricsRegistry
+
+    resume_file = tmp_path / "resume.txt"
+    resume_file.write_text("Python developer")
+    registry = MetricsRegistry()
+    analyzer = ResumeAnalyzer(config={"metrics_sink": registry.observe})
+    analyzer.analyze(str(resume_file))
+    analyzer.analyze(str(resume_file))
+    assert registry.snapshot()["total"]["count"] == 2
@@ -0,0 +1,69 @@
+"""Test cases for ATS compatibility scoring."""
+
+import pytest
+from resumematch import ResumeMatcher
+from resumematch.matcher.ats import ATS_WEIGHTS, ats_features
+
+WELL_FORMED = """Jane Doe
+jane.doe@example.com | +1 (555) 123-4567
+
+Summary
+Data engineer with Python, SQL and Spark.
+
+Experience
+Data Engineer, Acme Corp
+Mar 2021 - Present
+- Built pipelines with Kafka, Airflow and Docker on AWS.
+
+Education
+BSc Computer Science, State University, 2019
+
+Skills
+Python, SQL, Spark, Kafka, Docker, AWS, Kubernetes, Terraform
+"""
+
+
+def test_well_formed_resume_passes_structural_checks():
+    """Test that headings, contact details, skills and dates are recognized."""
+    matcher = ResumeMatcher()
+    columns = ats_features([{"raw_text": WELL_FORMED}], matcher.skills)
+
+    assert columns["sections"][0] == 1.0
+    assert columns["contact"][0] == 1.0
+    assert columns["keywords"][0] == 1.0
+    assert columns["dates"][0] == 1.0
+    assert 0 < columns["length"][0] < 1.0
+
+
+def test_contact_info_and_mixed_dates():
+    """Test structured contact details and the penalty for mixed date formats."""
+    matcher = ResumeMatcher()
+    resume = {
+        "raw_text": "Worked 03/2020 to Jan 2022",
+        "contact_info": {"email": "a@b.co"},
+    }
+    columns = ats_features([resume], matcher.skills)
+
+    assert columns["contact"][0] == 0.5
+    assert columns["dates"][0] == 0.5
+    assert columns["sections"][0] == 0.0
+
+
+def test_batch_scores_equal_single_scores():
+    """Test that the batch mode returns exactly the single-resume scores."""
+    matcher = ResumeMatcher()
+    lines = WELL_FORMED.splitlines()
+    resumes = [{"raw_text": "\n".join(lines[:n] * 30)} for n in range(len(lines))]
+    resumes += [{"raw_text": WELL_FORMED, "skills": ["Go"]}, {"raw_text": ""}, {}]
+
+    batch = matcher.calculate_ats_scores(iter(resumes))
+
+    assert batch == [matcher.calculate_ats_score(resume) for resume in resumes]
+    assert all(0 <= score <= 100 for score in batch)
+    assert matcher.calculate_ats_score({"raw_text": WELL_FORMED}) > 80
+    assert matcher.calculate_ats_scores([]) == []
+
+
+def test_weights_sum_to_hundred():
+    """Test that a resume passing every check scores 100."""
+    assert sum(ATS_WEIGHTS.values()) == pytest.approx(100.0)
@@ -0,0 +1,83 @@
+"""Test cases for the ParseCache class."""
+
+import pickle
+
+import pytest
+from resumematch import ResumeParser
+from resumematch.parser import ParseCache
+
+
+def test_key_depends_on_content_not_name(tmp_path):
+    """Test that keys follow file content and parse variant."""
+    cache = ParseCache(tmp_path / "cache.db")
+    a = tmp_path / "a.txt"
+    b = tmp_path / "b.txt"
+    a.write_text("same content")
+    b.write_text("same content")
+
+    assert cache.key_for(a) == cache.key_for(b)
+    assert cache.key_for(a) != cache.key_for(a, variant="max_pages=1")
+
+    b.write_text("edited content")
+    assert cache.key_for(a) != cache.key_for(b)
+
+
+def test_get_put_roundtrip(tmp_path):
+    """Test that stored results are returned and misses give None."""
+    cache = ParseCache(tmp_path / "cache.db")
+    assert cache.get("missing") is None
+
+    cache.put("key", {"skills": ["Python"], "raw_text": "text"})
+
+    assert cache.get("key") == {"skills": ["Python"], "raw_text": "text"}
+    assert len(cache) == 1
+
+
+def test_lru_eviction(tmp_path):
+    """Test that least recently used entries are evicted over the size cap."""
+    payload = {"raw_text": "x" * 100}
+    cache = ParseCache(tmp_path / "cache.db", max_bytes=250)
+
+    cache.put("first", payload)
+    cache.put("second", payload)
+    cache.get("first")
+    cache.put("third", payload)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == payload
+    assert cache.get("third") == payload
+    assert cache.total_bytes <= 250
+
+
+def test_invalid_max_bytes(tmp_path):
+    """Test that a non-positive size cap is rejected."""
+    with pytest.raises(ValueError):
+        ParseCache(tmp_path / "cache.db", max_bytes=0)
+
+
+def test_parser_serves_repeat_parse_from_cache(tmp_path, monkeypatch):
+    """Test that an unchanged file is parsed only once."""
+    parser = ResumeParser(cache=ParseCache(tmp_path / "cache.db"))
+    resume = tmp_path / "resume.txt"
+    resume.write_text("Python developer")
+    calls = []
+    original = parser._parse_file
+    monkeypatch.setattr(
+        parser, "_parse_file", lambda path, *args: calls.append(path) or original(path, *args)
+    )
+
+    first = parser.parse(str(resume))
+    second = parser.parse(str(resume))
+
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_cache_survives_pickling(tmp_path):
+    """Test that a cache can be sent to worker processes."""
+    cache = ParseCache(tmp_path / "cache.db")
+    cache.put("key", {"raw_text": "text"})
+
+    clone = pickle.loads(pickle.dumps(cache))
+
+    assert clone.get("key") == {"raw_text": "text"}
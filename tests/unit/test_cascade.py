@@ -0,0 +1,118 @@
+"""Test cases for the pre-filter match cascade."""
+
+from datetime import date
+
+import pytest
+from resumematch import ResumeMatcher
+from resumematch.matcher import MatchCascade
+from resumematch.matcher.cascade import education_level, experience_years, skill_mask
+from resumematch.parser import ParsedResume, SkillVocabulary
+
+JOB = "Backend engineer.\nRequired: Python and Docker.\nNice to have: Go and Kubernetes."
+TODAY = date(2024, 1, 1)
+
+
+def resume(skills, start="Jan 2018", degree="Bachelor of Science"):
+    return {
+        "raw_text": "Backend engineer " + " ".join(skills),
+        "skills": list(skills),
+        "work_experience": [{"start_date": start, "end_date": "Present"}],
+        "education": [{"degree": degree}],
+    }
+
+
+RESUMES = [
+    ("full", resume(["Python", "Docker", "Go"])),
+    ("no_docker", resume(["Python", "Go"])),
+    ("junior", resume(["Python", "Docker"], start="Jun 2023")),
+    ("no_degree", resume(["Python", "Docker", "Kubernetes"], degree="")),
+    ("minimal", resume(["Docker", "Python"])),
+]
+
+
+def test_skill_mask_uses_vocabulary_ids():
+    """Test bitmaps for dictionaries, ParsedResume records and unknown skills."""
+    vocabulary = SkillVocabulary(["Python", "Docker", "Go"])
+    assert skill_mask({"skills": ["Go", "Python", "Cobol"]}, vocabulary) == 0b101
+    parsed = ParsedResume.from_dict({"skills": ["Docker"]}, vocabulary=vocabulary)
+    assert skill_mask(parsed, vocabulary) == 0b010
+
+
+def test_experience_years_merges_overlaps():
+    """Test that overlapping and open-ended positions are counted once."""
+    entries = [
+        {"start_date": "Jan 2018", "end_date": "Jan 2020"},
+        {"start_date": "2019", "end_date": "Present"},
+        {"start_date": "soon", "end_date": "later"},
+    ]
+    assert experience_years(entries, TODAY) == 6.0
+    assert experience_years([{"start_date": "03/2020", "end_date": "Sep 2020"}]) == 0.5
+    assert experience_years([]) == 0.0
+
+
+def test_education_level():
+    """Test that the highest recognized degree wins."""
+    assert education_level([{"degree": "B.Sc Physics"}, {"degree": "M.S. in CS"}]) == 3
+    assert education_level([{"degree": "PhD in Statistics"}]) == 4
+    assert education_level([{"degree": "Mastery of cooking"}]) == 0
+
+
+def test_required_skills_default_to_requirement_lines():
+    """Test that required skills come from the job's requirement lines."""
+    assert MatchCascade(JOB).required_skills == ["Python", "Docker"]
+    assert MatchCascade(JOB, required_skills=["Go"]).required_skills == ["Go"]
+    with pytest.raises(ValueError):
+        MatchCascade(JOB, min_education="kindergarten")
+
+
+def test_required_skills_under_requirements_heading():
+    """Test that bullets under a requirements heading are requirements."""
+    job = (
+        "Backend engineer.\nRequirements:\n- Python and Docker\n- 5+ years\n\n"
+        "Nice to have:\n- Go and Kubernetes"
+    )
+    assert MatchCascade(job).required_skills == ["Python", "Docker"]
+    markdown = "## Qualifications\nPostgreSQL\n## Benefits\nRemote work with Docker"
+    assert MatchCascade(markdown).required_skills == ["PostgreSQL"]
+
+
+def test_unknown_required_skill_rejects_everything():
+    """Test that an unknown required skill matches nothing and is not interned."""
+    vocabulary = SkillVocabulary(["Python", "Docker"])
+    cascade = MatchCascade(JOB, required_skills=["Python", "Cobol"], vocabulary=vocabulary)
+
+    assert cascade.match(RESUMES) == []
+    assert cascade.snapshot()["skills"]["passed"] == 0
+    assert "Cobol" not in vocabulary and len(vocabulary) == 2
+
+
+def test_cascade_filters_then_matches_with_pass_rates():
+    """Test stage rejections, final results and per-stage counters."""
+    matcher = ResumeMatcher()
+    cascade = MatchCascade(JOB, matcher, min_years=2, min_education="bachelor", today=TODAY)
+
+    assert cascade.accepts(RESUMES[1][1]) == "skills"
+    assert cascade.accepts(RESUMES[2][1]) == "constraints"
+    assert cascade.accepts(RESUMES[3][1]) == "constraints"
+    cascade.reset()
+
+    results = cascade.match(RESUMES)
+
+    assert [r["resume_id"] for r in results] == ["full", "minimal"]
+    assert results[0] == dict(resume_id="full", **matcher.match(RESUMES[0][1], JOB))
+    assert cascade.snapshot() == {
+        "skills": {"seen": 5, "passed": 4, "pass_rate": 0.8},
+        "constraints": {"seen": 4, "passed": 2, "pass_rate": 0.5},
+        "match": {"seen": 2, "passed": 2, "pass_rate": 1.0},
+    }
+
+
+def test_cascade_rank_streams_survivors():
+    """Test top-k ranking over a generator and the match-stage counts."""
+    cascade = MatchCascade(JOB, today=TODAY)
+
+    ranked = cascade.rank((pair for pair in RESUMES), k=2)
+
+    assert [r["resume_id"] for r in ranked] == ["full", "no_degree"]
+    assert cascade.snapshot()["match"] == {"seen": 4, "passed": 2, "pass_rate": 0.5}
+    assert MatchCascade(JOB).snapshot()["skills"]["pass_rate"] == 0.0
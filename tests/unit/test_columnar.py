@@ -0,0 +1,109 @@
+"""Test cases for the columnar resume store."""
+
+import json
+
+import pytest
+from resumematch import ResumeMatcher
+from resumematch.matcher import HashingEmbedder
+from resumematch.utils import ColumnarStore
+
+
+def test_segments_roundtrip_and_reopen(tmp_path):
+    """Test ids, skill ids, postings and vectors across segments and reopening."""
+    with ColumnarStore(tmp_path / "store") as store:
+        store.append_segment([
+            ("a", [3, 1], ["python", "sql"], [1.0, 0.0]),
+            (("batch", 2), [], ["java"], None),
+        ])
+        store.append_segment([(7, [5], ["python"], [0.5, 0.25])])
+
+    with ColumnarStore(tmp_path / "store") as store:
+        assert len(store) == 3
+        assert len(store.segments) == 2
+        assert list(store.resume_ids()) == ["a", ("batch", 2), 7]
+        assert store.skill_ids(0).tolist() == [3, 1]
+        assert store.skill_ids(1).tolist() == []
+        assert store.vector(1).tolist() == [0.0, 0.0]
+        assert store.vector(2).tolist() == [0.5, 0.25]
+        assert store.postings("python").tolist() == [0, 2]
+        assert store.postings("missing").tolist() == []
+        assert isinstance(store.segments[0].postings("sql"), memoryview)
+        with pytest.raises(IndexError):
+            store.resume_id(3)
+
+
+def test_refresh_sees_other_writers_and_ignores_uncommitted(tmp_path):
+    """Test that readers only see segments listed in the manifest."""
+    reader = ColumnarStore(tmp_path)
+    writer = ColumnarStore(tmp_path)
+    writer.append_segment([("x", [1], ["go"], None)])
+    (tmp_path / "seg-000001").mkdir()
+
+    assert len(reader) == 0
+    reader.refresh()
+    assert len(reader) == 1
+    assert reader.postings("go").tolist() == [0]
+    reader.close()
+    writer.close()
+
+
+def test_stale_writer_appends_a_new_segment(tmp_path):
+    """Test that a writer opened earlier never overwrites another writer's segment."""
+    first = ColumnarStore(tmp_path)
+    first.append_segment([("a", [], [], None), ("b", [], [], None)])
+    first.append_segment([("c", [], [], None)])
+    second = ColumnarStore(tmp_path)
+    first.append_segment([("d", [], [], None)])
+    mapped = first.segments[2]
+
+    second.append_segment([("e", [], [], None)])
+
+    assert mapped.resume_id(0) == "d"
+    with ColumnarStore(tmp_path) as store:
+        assert list(store.resume_ids()) == ["a", "b", "c", "d", "e"]
+        assert [segment.path.name for segment in store.segments] == [
+            "seg-000000", "seg-000001", "seg-000002", "seg-000003",
+        ]
+    assert not [path for path in tmp_path.iterdir() if path.name.startswith(".")]
+
+    (tmp_path / "seg-000004").mkdir()
+    with pytest.raises(FileExistsError):
+        second.append_segment([("f", [], [], None)])
+    first.close()
+    second.close()
+
+
+def test_vector_length_is_checked(tmp_path):
+    """Test that feature vectors must all have the same length."""
+    with ColumnarStore(tmp_path) as store:
+        with pytest.raises(ValueError):
+            store.append_segment([("a", [], [], [1.0]), ("b", [], [], [1.0, 2.0])])
+
+
+def test_incompatible_manifest_is_rejected(tmp_path):
+    """Test that a store from another format version is refused."""
+    (tmp_path / "manifest.json").write_text(json.dumps({"version": 99}))
+    with pytest.raises(ValueError):
+        ColumnarStore(tmp_path)
+
+
+def test_append_resumes_extracts_features(tmp_path):
+    """Test that parsed resumes are split into segments with their features."""
+    matcher = ResumeMatcher()
+    resumes = [
+        ("r1", {"raw_text": "Python and Kubernetes engineer", "skills": ["Docker"]}),
+        ("r2", {"raw_text": "Java developer", "skills": []}),
+        ("r3", {"raw_text": "k8s operator", "skills": []}),
+    ]
+    with ColumnarStore(tmp_path) as store:
+        written = store.append_resumes(
+            iter(resumes), matcher, HashingEmbedder(dim=16), segment_size=2
+        )
+
+        assert written == 3
+        assert [segment.rows for segment in store.segments] == [2, 1]
+        assert store.postings("kubernetes").tolist() == [0, 2]
+        assert store.postings("docker").tolist() == [0]
+        names = [matcher.skills.names[i] for i in store.skill_ids(0)]
+        assert "Docker" in names and "Python" in names
+        assert len(store.vector(1)) == 16
@@ -0,0 +1,77 @@
+"""Test cases for resume deduplication."""
+
+import pytest
+from resumematch import ResumeMatcher
+from resumematch.parser import ResumeDeduplicator
+from resumematch.parser.dedup import MinHasher, lsh_bands, normalize, similarity
+
+BASE = " ".join(
+    f"Senior engineer at company{i} building services in Python and Go for team{i}."
+    for i in range(40)
+)
+
+
+def test_signature_similarity_tracks_jaccard():
+    """Test that near-identical texts have close signatures and unrelated ones do not."""
+    hasher = MinHasher(num_perm=128)
+    a = hasher.signature(normalize(BASE))
+    b = hasher.signature(normalize(BASE + " Also mentors interns."))
+    c = hasher.signature(normalize("Pastry chef specialising in sourdough and viennoiserie."))
+
+    assert len(a) == 128
+    assert similarity(a, a) == 1.0
+    assert similarity(a, b) > 0.9
+    assert similarity(a, c) < 0.1
+
+
+def test_lsh_band_choice_covers_signature():
+    """Test that bands times rows fits in the signature length."""
+    bands, rows = lsh_bands(0.85, 128)
+    assert bands * rows <= 128
+    assert abs((1 / bands) ** (1 / rows) - 0.85) < 0.1
+
+
+def test_exact_and_near_duplicates_are_clustered():
+    """Test content-hash collapsing, near-duplicate grouping and representatives."""
+    dedup = ResumeDeduplicator()
+    assert dedup.add("orig", {"raw_text": BASE}) == "orig"
+    assert dedup.add("resubmit", {"raw_text": "  " + BASE.upper() + "\n"}) == "orig"
+    assert dedup.add("edited", {"raw_text": BASE + " Also mentors interns."}) == "orig"
+    assert dedup.add("other", {"raw_text": "Nurse with ICU experience."}) == "other"
+
+    assert dedup.exact_duplicates == 1
+    assert dedup.n_clusters == 2
+    assert dedup.clusters() == [["orig", "resubmit", "edited"], ["other"]]
+    assert dedup.representative("edited") == "orig"
+    with pytest.raises(ValueError):
+        dedup.add("orig", {"raw_text": BASE})
+
+
+def test_empty_texts_are_never_duplicates():
+    """Test that resumes without text each get their own cluster."""
+    dedup = ResumeDeduplicator()
+    dedup.add_many([("a", {"raw_text": ""}), ("b", {"raw_text": "  \n"}), ("c", {})])
+
+    assert dedup.exact_duplicates == 0
+    assert dedup.clusters() == [["a"], ["b"], ["c"]]
+    assert dedup.add("d", {"raw_text": BASE}) == "d"
+
+
+def test_match_scores_representatives_once():
+    """Test that match fans the representative's result out to its cluster."""
+    matcher = ResumeMatcher()
+    calls = []
+    original = matcher.match_many
+    matcher.match_many = lambda resumes, job: calls.append(len(resumes)) or original(resumes, job)
+    dedup = ResumeDeduplicator()
+    dedup.add_many([
+        ("a", {"raw_text": BASE}),
+        ("b", {"raw_text": BASE}),
+        ("c", {"raw_text": "Python and Django developer"}),
+    ])
+
+    results = dedup.match(matcher, "Python Go engineer")
+
+    assert calls == [2]
+    assert results["a"] == results["b"] == matcher.match({"raw_text": BASE}, "Python Go engineer")
+    assert set(results) == {"a", "b", "c"}
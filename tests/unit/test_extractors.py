@@ -0,0 +1,277 @@
+"""Test cases for streaming text extraction."""
+
+import zipfile
+import zlib
+
+import pytest
+from resumematch import ResumeParser
+from resumematch.parser import extractors
+from resumematch.parser.extractors import detect_format, extract_text, iter_pages
+from resumematch.parser.formats import rtf, txt
+from resumematch.parser.formats.pdf import content_stream_text
+
+
+def write_pdf(path, pages, compress=True, font=None):
+    """
+    Write a minimal PDF whose pages each show the given lines of text.
+
+    A page given as bytes is used as its raw content stream. A font
+    dictionary given as bytes is inherited by every page as /F1.
+    """
+    objects = {}
+    kids = []
+    resources = b""
+    if font is not None:
+        objects[3] = font
+        resources = b" /Resources << /Font << /F1 3 0 R >> >>"
+    next_num = 4
+    for lines in pages:
+        page_num, content_num = next_num, next_num + 1
+        next_num += 2
+        if isinstance(lines, bytes):
+            stream = lines
+        else:
+            ops = ["BT", "/F1 12 Tf", "72 720 Td"]
+            for i, line in enumerate(lines):
+                if i:
+                    ops.append("0 -14 Td")
+                escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+                ops.append(f"({escaped}) Tj")
+            ops.append("ET")
+            stream = "\n".join(ops).encode("latin-1")
+        head = b""
+        if compress:
+            stream = zlib.compress(stream)
+            head = b" /Filter /FlateDecode"
+        objects[content_num] = (
+            b"<< /Length %d%s >>\nstream\n" % (len(stream), head) + stream + b"\nendstream"
+        )
+        objects[page_num] = b"<< /Type /Page /Parent 2 0 R /Contents %d 0 R >>" % content_num
+        kids.append(b"%d 0 R" % page_num)
+    objects[1] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[2] = b"<< /Type /Pages /Kids [%s] /Count %d%s >>" % (
+        b" ".join(kids), len(kids), resources
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for num in sorted(objects):
+        offsets[num] = len(out)
+        out += b"%d 0 obj\n" % num + objects[num] + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for num in sorted(objects):
+        out += b"%010d 00000 n \n" % offsets[num]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+    return path
+
+
+def write_docx(path, paragraphs):
+    """Write a minimal DOCX; None in paragraphs inserts a page break."""
+    body = []
+    for text in paragraphs:
+        if text is None:
+            body.append('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+        else:
+            body.append(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>")
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{''.join(body)}</w:body></w:document>"
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        archive.writestr("word/document.xml", xml)
+    return path
+
+
+def test_txt_pages_split_on_form_feed(tmp_path):
+    """Test that plain text pages are delimited by form feeds."""
+    path = tmp_path / "resume.txt"
+    path.write_text("Jane Doe\nEngineer\fEducation\fSkills")
+
+    assert list(iter_pages(path)) == ["Jane Doe\nEngineer", "Education", "Skills"]
+
+
+def test_txt_long_page_is_chunked(tmp_path, monkeypatch):
+    """Test that text without form feeds is emitted in bounded pages."""
+    monkeypatch.setattr(txt, "READ_CHUNK_SIZE", 16)
+    monkeypatch.setattr(txt, "TEXT_PAGE_CHARS", 32)
+    text = "".join(f"line {i:03d}\n" for i in range(40))
+    path = tmp_path / "resume.txt"
+    path.write_text(text)
+
+    pages = list(iter_pages(path))
+
+    assert "".join(pages) == text
+    assert max(len(page) for page in pages) < 64
+
+
+def test_budgets_stop_extraction(tmp_path):
+    """Test max_pages and max_bytes budgets."""
+    path = tmp_path / "resume.txt"
+    path.write_text("one\ftwo\fthree")
+
+    assert list(iter_pages(path, max_pages=2)) == ["one", "two"]
+    assert extract_text(path, max_bytes=5) == "one\ntw"
+    assert list(iter_pages(path, max_pages=0)) == []
+
+
+def test_rtf_extraction(tmp_path, monkeypatch):
+    """Test that RTF control words and destinations are stripped."""
+    monkeypatch.setattr(rtf, "READ_CHUNK_SIZE", 7)
+    path = tmp_path / "resume.rtf"
+    path.write_text(
+        r"{\rtf1\ansi{\fonttbl{\f0 Arial;}}{\*\generator Word;}"
+        r"\f0 Jane Doe\par Caf\'e9 \u8364? owner\page Skills: Python\par}"
+    )
+
+    assert list(iter_pages(path)) == ["Jane Doe\nCafé € owner", "Skills: Python\n"]
+
+
+def test_docx_extraction(tmp_path):
+    """Test that DOCX paragraphs and page breaks are streamed."""
+    path = write_docx(tmp_path / "resume.docx", ["Jane Doe", "Engineer", None, "Skills"])
+
+    pages = list(iter_pages(path))
+
+    assert pages[0] == "Jane Doe\nEngineer\n"
+    assert pages[1].strip() == "Skills"
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_pdf_extraction(tmp_path, compress):
+    """Test that PDF pages are read in page-tree order."""
+    path = write_pdf(
+        tmp_path / "resume.pdf", [["Jane Doe", "Engineer (Python)"], ["Page two"]], compress
+    )
+
+    assert list(iter_pages(path)) == ["Jane Doe\nEngineer (Python)", "Page two"]
+    assert list(iter_pages(path, max_pages=1)) == ["Jane Doe\nEngineer (Python)"]
+
+
+def test_pdf_with_composite_fonts_is_rejected(tmp_path):
+    """Test that pages drawn with CID fonts raise instead of yielding garbage."""
+    simple = write_pdf(
+        tmp_path / "simple.pdf", [["Jane Doe"]], font=b"<< /Type /Font /Subtype /Type1 >>"
+    )
+    cid = write_pdf(
+        tmp_path / "cid.pdf",
+        [b"BT /F1 12 Tf <0012002B> Tj ET"],
+        font=b"<< /Type /Font /Subtype /Type0 /Encoding /Identity-H >>",
+    )
+
+    assert extract_text(simple) == "Jane Doe"
+    for mode in ("fast", "layout"):
+        with pytest.raises(ValueError, match="composite"):
+            extract_text(cid, mode=mode)
+
+
+def test_content_stream_operators():
+    """Test TJ arrays, hex strings and line operators."""
+    content = b"BT [(Hel) 20 (lo) -300 (World)] TJ T* <4869> Tj ET"
+
+    assert content_stream_text(content) == "Hello World\nHi"
+
+
+def test_empty_pdf(tmp_path):
+    """Test that an empty PDF file yields no pages."""
+    path = tmp_path / "empty.pdf"
+    path.write_bytes(b"")
+
+    assert list(iter_pages(path)) == []
+
+
+def test_parser_fills_raw_text(tmp_path):
+    """Test that ResumeParser.parse returns extracted raw_text within budget."""
+    path = write_pdf(tmp_path / "resume.pdf", [["Jane Doe"], ["Second page"]])
+
+    assert ResumeParser().parse(str(path))["raw_text"] == "Jane Doe\nSecond page"
+    assert ResumeParser(max_pages=1).parse(str(path))["raw_text"] == "Jane Doe"
+
+
+def test_format_sniffed_when_suffix_is_unknown(tmp_path):
+    """Test that magic bytes identify files without a known suffix."""
+    pdf = write_pdf(tmp_path / "upload.bin", [["Jane Doe"]])
+    docx = write_docx(tmp_path / "upload", ["Python developer"])
+    rtf = tmp_path / "upload.dat"
+    rtf.write_text(r"{\rtf1 Hello}")
+    unknown = tmp_path / "upload.xyz"
+    unknown.write_text("plain text")
+
+    assert [detect_format(path) for path in (pdf, docx, rtf, unknown)] == [
+        ".pdf", ".docx", ".rtf", None
+    ]
+    assert ResumeParser().parse(str(docx))["raw_text"] == "Python developer\n"
+    with pytest.raises(ValueError):
+        ResumeParser().parse(str(unknown))
+
+
+def test_non_docx_zip_is_not_treated_as_docx(tmp_path):
+    """Test that zip archives without word/document.xml are rejected."""
+    for name in ("upload.odt", "upload.zip", "upload"):
+        with zipfile.ZipFile(tmp_path / name, "w") as archive:
+            archive.writestr("content.xml", "<office:document/>")
+    renamed = tmp_path / "upload.docx"
+    renamed.write_bytes((tmp_path / "upload.zip").read_bytes())
+
+    parser = ResumeParser()
+    for name in ("upload.odt", "upload.zip", "upload"):
+        path = tmp_path / name
+        assert detect_format(path) is None
+        assert not parser.is_supported_format(str(path))
+        with pytest.raises(ValueError, match="Unsupported file format"):
+            parser.parse(str(path))
+    with pytest.raises(ValueError, match="not a DOCX document"):
+        parser.parse(str(renamed))
+    assert parser.is_supported_format(str(write_docx(tmp_path / "resume", ["Go"])))
+
+
+def test_pdf_layout_mode_restores_reading_order(tmp_path):
+    """Test that layout mode orders text by position, not drawing order."""
+    content = (
+        b"BT /F1 10 Tf 1 0 0 1 72 700 Tm (Experience) Tj ET\n"
+        b"BT /F1 10 Tf 1 0 0 1 300 720 Tm (jane@example.com) Tj ET\n"
+        b"BT /F1 10 Tf 1 0 0 1 72 720 Tm (Jane Doe) Tj ET\n"
+        b"BT /F1 10 Tf 72 680 Td (Acme Corp,) Tj ( Engineer) Tj ET"
+    )
+    path = write_pdf(tmp_path / "resume.pdf", [content])
+
+    fast = extract_text(path)
+    layout = extract_text(path, mode="layout")
+
+    assert fast.index("Experience") < fast.index("Jane Doe")
+    lines = layout.splitlines()
+    assert lines[0].startswith("Jane Doe") and lines[0].endswith("jane@example.com")
+    assert lines[0].split() == ["Jane", "Doe", "jane@example.com"]
+    assert lines[1:] == ["Experience", "Acme Corp, Engineer"]
+    parser = ResumeParser(mode="layout")
+    assert parser.parse(str(path))["raw_text"] == layout
+    assert ResumeParser().parse(str(path), mode="layout")["raw_text"] == layout
+
+
+def test_unknown_mode_rejected(tmp_path):
+    """Test that an unknown extraction mode raises ValueError."""
+    path = tmp_path / "resume.txt"
+    path.write_text("Jane Doe")
+    with pytest.raises(ValueError):
+        extract_text(path, mode="ocr")
+
+
+def test_register_backend(tmp_path, monkeypatch):
+    """Test that registered backends are used by suffix and by magic bytes."""
+    monkeypatch.setattr(extractors, "_REGISTRY", dict(extractors._REGISTRY))
+    extractors.register_backend(
+        ".md", fast=lambda path: iter([path.read_text().lstrip("# ")]), magic=[b"# "]
+    )
+    markdown = tmp_path / "resume.md"
+    markdown.write_text("# Python developer")
+    unnamed = tmp_path / "resume"
+    unnamed.write_text("# Go developer")
+
+    parser = ResumeParser()
+    assert parser.is_supported_format("resume.md")
+    assert parser.parse(str(markdown))["raw_text"] == "Python developer"
+    assert parser.parse(str(unnamed))["raw_text"] == "Go developer"
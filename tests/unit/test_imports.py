@@ -0,0 +1,68 @@
+"""Test cases for import-time cost and lazy loading."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import resumematch
+
+# Cumulative import time allowed for ``import resumematch``, in microseconds.
+IMPORT_BUDGET_US = 100_000
+
+HEAVY_MODULES = ("asyncio", "sqlite3", "zipfile", "xml.etree.ElementTree", "mmap")
+
+
+def run_python(*args):
+    """Run a fresh interpreter that imports this checkout of resumematch."""
+    env = dict(os.environ, PYTHONPATH=str(Path(resumematch.__file__).parents[1]))
+    return subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def loaded_modules(code):
+    """Return the modules loaded after running code in a fresh interpreter."""
+    out = run_python("-c", code + "\nimport json, sys; print(json.dumps(sorted(sys.modules)))")
+    return set(json.loads(out.stdout.splitlines()[-1]))
+
+
+def test_import_is_lazy():
+    """Test that importing the package loads none of its machinery."""
+    modules = loaded_modules("import resumematch")
+    assert "resumematch.parser.resume_parser" not in modules
+    assert "resumematch.core.analyzer" not in modules
+    assert not modules & set(HEAVY_MODULES)
+
+
+def test_lazy_exports_resolve():
+    """Test that lazily exported names resolve to the defining objects."""
+    from resumematch.parser.resume_parser import ResumeParser
+
+    assert resumematch.ResumeParser is ResumeParser
+    assert "ResumeAnalyzer" in dir(resumematch)
+
+
+def test_txt_parse_loads_only_txt_backend(tmp_path):
+    """Test that format backends load on the first parse of their suffix."""
+    resume = tmp_path / "resume.txt"
+    resume.write_text("Python developer")
+    modules = loaded_modules(
+        f"from resumematch import ResumeAnalyzer\nResumeAnalyzer().analyze({str(resume)!r})"
+    )
+    assert "resumematch.parser.formats.txt" in modules
+    for backend in ("pdf", "docx", "rtf"):
+        assert f"resumematch.parser.formats.{backend}" not in modules
+    assert not modules & set(HEAVY_MODULES)
+
+
+def test_import_time_budget():
+    """Test that ``import resumematch`` stays within its time budget."""
+    stderr = run_python("-X", "importtime", "-c", "import resumematch").stderr
+    cumulative = [
+        int(line.split("|")[1])
+        for line in stderr.splitlines()
+        if line.rstrip().endswith("| resumematch")
+    ]
+    assert cumulative and cumulative[0] < IMPORT_BUDGET_US
@@ -0,0 +1,83 @@
+"""Test cases for incremental re-scoring."""
+
+import random
+
+import pytest
+from resumematch import ResumeMatcher
+from resumematch.matcher import IncrementalScorer
+
+WORDS = (
+    "python java sql docker kubernetes aws react django flask spark linux git "
+    "terraform pandas kafka redis postgresql mongodb graphql agile team projects"
+).split()
+
+
+def make_pool(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        (f"r{i}", {"raw_text": " ".join(rng.choices(WORDS, k=30)), "skills": rng.sample(WORDS, 3)})
+        for i in range(n)
+    ]
+
+
+def expected_ranking(matcher, pool, job):
+    results = [(rid, matcher.match(data, job)) for rid, data in pool]
+    results.sort(key=lambda item: item[1]["overall_score"], reverse=True)
+    return [
+        {
+            "resume_id": rid,
+            "overall_score": result["overall_score"],
+            "skill_score": result["skill_score"],
+        }
+        for rid, result in results
+    ]
+
+
+def test_score_matches_full_matching():
+    """Test that initial scores equal ResumeMatcher.match."""
+    matcher = ResumeMatcher()
+    pool = make_pool(50)
+    scorer = IncrementalScorer(matcher)
+    scorer.add_many(pool)
+    job = "Python and Docker required. Kafka, Redis nice to have."
+
+    assert scorer.score(job) == expected_ranking(matcher, pool, job)
+    assert scorer.score(job, k=5) == expected_ranking(matcher, pool, job)[:5]
+
+
+def test_rescore_delta_applies_edits():
+    """Test that delta updates agree with re-matching the edited job."""
+    matcher = ResumeMatcher()
+    pool = make_pool(80, seed=1)
+    scorer = IncrementalScorer(matcher)
+    scorer.add_many(pool[:40])
+    old = "Python and Docker required. Kafka, Redis nice to have."
+    scorer.score(old)
+    scorer.add_many(pool[40:])
+    new = "Python and Kubernetes required. Kafka, Redis, GraphQL nice to have."
+
+    assert scorer.rescore_delta(old, new) == expected_ranking(matcher, pool, new)
+    newer = "Java required."
+    assert scorer.rescore_delta(new, newer, k=3) == expected_ranking(matcher, pool, newer)[:3]
+
+
+def test_rescore_delta_without_old_scores():
+    """Test that an unknown old job falls back to a full score."""
+    matcher = ResumeMatcher()
+    pool = make_pool(10, seed=2)
+    scorer = IncrementalScorer(matcher, max_jobs=1)
+    scorer.add_many(pool)
+    job = "SQL and Linux"
+    assert scorer.rescore_delta("never scored", job) == expected_ranking(matcher, pool, job)
+
+
+def test_contributions_and_duplicates():
+    """Test per-term breakdown and duplicate ids."""
+    scorer = IncrementalScorer()
+    scorer.add("a", {"raw_text": "python developer", "skills": ["Docker"]})
+    assert scorer.contributions("a", "python docker java sql") == {
+        "python": 25.0, "docker": 25.0, "java": 0.0, "sql": 0.0
+    }
+    assert "a" in scorer and len(scorer) == 1
+    with pytest.raises(ValueError):
+        scorer.add("a", {"raw_text": ""})
@@ -0,0 +1,66 @@
+"""Test cases for the ResumeIndex class."""
+
+import pytest
+from resumematch.matcher import ResumeIndex
+
+
+def _resume(text, skills=()):
+    return {"raw_text": text, "skills": list(skills)}
+
+
+@pytest.fixture
+def index():
+    idx = ResumeIndex()
+    idx.add("alice", _resume("Python developer building Django services", ["Python", "Django"]))
+    idx.add("bob", _resume("Java engineer with Spring and Kubernetes", ["Java", "Kubernetes"]))
+    idx.add("carol", _resume("Data scientist using Python, pandas and machine learning"))
+    idx.add("dave", _resume("Sales manager with retail experience"))
+    return idx
+
+
+def test_add_and_len(index):
+    """Test that added resumes are counted and addressable."""
+    assert len(index) == 4
+    assert "alice" in index
+    assert "zoe" not in index
+
+
+def test_add_duplicate_id_raises(index):
+    """Test that indexing the same id twice raises ValueError."""
+    with pytest.raises(ValueError):
+        index.add("alice", _resume("anything"))
+
+
+def test_top_k_ranks_best_match_first(index):
+    """Test that top_k returns the strongest keyword match first."""
+    results = index.top_k("Senior Python Django developer", k=2)
+    assert [r["resume_id"] for r in results] == ["alice", "carol"]
+    assert results[0]["score"] > results[1]["score"] > 0
+
+
+def test_top_k_skips_non_matching(index):
+    """Test that resumes sharing no keyword are not returned."""
+    results = index.top_k("Kubernetes", k=10)
+    assert [r["resume_id"] for r in results] == ["bob"]
+    assert index.top_k("astronaut", k=10) == []
+    assert index.top_k("Python", k=0) == []
+
+
+def test_top_k_agrees_with_exhaustive_scoring():
+    """Test that WAND pruning returns the same ranking as scoring everything."""
+    words = ["python", "java", "sql", "docker", "aws", "react", "go", "rust", "linux", "spark"]
+    idx = ResumeIndex()
+    for i in range(200):
+        text = " ".join(words[(i * j) % len(words)] for j in range(1, 2 + i % 7))
+        idx.add(i, _resume(text, [words[i % len(words)]]))
+
+    job = "python sql aws spark rust"
+    expected = sorted(
+        ((idx.score(i, job), -i) for i in range(200) if idx.score(i, job) > 0),
+        reverse=True,
+    )[:15]
+    results = idx.top_k(job, k=15)
+
+    assert [r["resume_id"] for r in results] == [-neg for _, neg in expected]
+    for result, (score, _) in zip(results, expected):
+        assert result["score"] == pytest.approx(score)
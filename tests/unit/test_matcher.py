@@ -53,3 +53,116 @@ def test_extract_keywords():
     keywords = matcher.extract_keywords(text)
     
     assert isinstance(keywords, list)
+
+
+def test_extract_keywords_filters_and_dedupes():
+    """Test that extract_keywords drops stop words and keeps first occurrence order."""
+    matcher = ResumeMatcher()
+    text = "Python and C++ developer; the Python developer knows Node.js and 2020"
+
+    keywords = matcher.extract_keywords(text)
+
+    assert keywords == ["python", "c++", "developer", "knows", "node.js"]
+
+
+def test_match_scores_keyword_coverage():
+    """Test that match reports matched and missing job keywords."""
+    matcher = ResumeMatcher()
+    resume_data = {
+        "raw_text": "Backend developer writing Python services on AWS",
+        "skills": ["Docker"],
+    }
+
+    result = matcher.match(resume_data, "Python developer with Docker and Kubernetes")
+
+    assert result["keyword_matches"] == ["python", "developer", "docker"]
+    assert result["missing_keywords"] == ["kubernetes"]
+    assert result["overall_score"] == 75.0
+    assert result["skill_score"] == 25.0
+    assert len(result["recommendations"]) == 1
+
+
+def test_match_many_equals_match():
+    """Test that match_many returns the same results as per-resume match."""
+    matcher = ResumeMatcher()
+    resumes = [
+        {"raw_text": "Python and SQL analyst", "skills": ["Tableau"]},
+        {"raw_text": "", "skills": ["Python", "Machine Learning"]},
+        {"raw_text": "Chef and restaurant manager"},
+        {},
+    ]
+    job = "Data analyst: Python, SQL, Tableau, machine learning a plus"
+
+    assert matcher.match_many(resumes, job) == [matcher.match(r, job) for r in resumes]
+    assert matcher.match_many([], job) == []
+
+
+def test_compile_job_precomputes_keywords_and_requirements():
+    """Test that compile_job captures keywords, weights and required skills."""
+    matcher = ResumeMatcher()
+    job = "Backend developer, Python and Go.\nRequired: Python, PostgreSQL\nNice to have: Go"
+
+    compiled = matcher.compile_job(job)
+
+    assert compiled.keywords == (
+        "backend", "developer", "python", "go", "required", "postgresql", "nice",
+    )
+    assert compiled.weights["python"] == 1.0
+    assert compiled.weights["backend"] == 0.5
+    assert set(compiled.required_keywords) == {"required", "python", "postgresql"}
+    assert compiled.mask_of(["python", "rust"]) == 1 << compiled.positions["python"]
+
+
+def test_compile_job_is_memoized():
+    """Test that raw job descriptions are compiled once and evicted LRU."""
+    matcher = ResumeMatcher(job_cache_size=2)
+
+    first = matcher.compile_job("Python developer")
+    assert matcher.compile_job("Python developer") is first
+    assert matcher.compile_job(first) is first
+
+    matcher.compile_job("Java developer")
+    matcher.compile_job("Go developer")
+    assert matcher.compile_job("Python developer") is not first
+
+
+def test_match_accepts_compiled_job():
+    """Test that match gives the same result for text and CompiledJob."""
+    matcher = ResumeMatcher()
+    resume_data = {"raw_text": "Python developer", "skills": ["SQL"]}
+    job = "Python and SQL developer"
+
+    compiled = matcher.compile_job(job)
+
+    assert matcher.match(resume_data, compiled) == matcher.match(resume_data, job)
+    assert matcher.match_many([resume_data], compiled) == [matcher.match(resume_data, job)]
+
+
+def test_rank_keeps_top_k_of_a_stream():
+    """Test that rank equals sorting every match result and truncating."""
+    matcher = ResumeMatcher()
+    job = "Data analyst: Python, SQL, Tableau, machine learning a plus"
+    texts = ["Python", "Python SQL", "Chef", "Python SQL Tableau", "SQL", "Python", ""]
+    resumes = ((f"r{i}", {"raw_text": text}) for i, text in enumerate(texts))
+
+    ranked = matcher.rank(resumes, job, k=4)
+
+    expected = [
+        dict(resume_id=f"r{i}", **matcher.match({"raw_text": text}, job))
+        for i, text in enumerate(texts)
+    ]
+    expected.sort(key=lambda r: r["overall_score"], reverse=True)
+    assert ranked == expected[:4]
+    assert [r["resume_id"] for r in ranked] == ["r3", "r1", "r0", "r4"]
+
+
+def test_rank_threshold_and_small_inputs():
+    """Test early rejection below the threshold and k edge cases."""
+    matcher = ResumeMatcher()
+    resumes = [("a", {"raw_text": "Python SQL"}), ("b", {"raw_text": "Python"}), ("c", {})]
+    job = "Python SQL"
+
+    assert [r["resume_id"] for r in matcher.rank(resumes, job, k=10)] == ["a", "b", "c"]
+    assert [r["resume_id"] for r in matcher.rank(resumes, job, threshold=50.0)] == ["a", "b"]
+    assert matcher.rank(resumes, job, k=0) == []
+    assert matcher.rank([], job) == []
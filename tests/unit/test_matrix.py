@@ -0,0 +1,77 @@
+"""Test cases for many-to-many matching."""
+
+import json
+
+import pytest
+from resumematch import ResumeMatcher
+from resumematch.matcher.matrix import match_matrix
+
+
+RESUMES = [
+    ("a", {"raw_text": "Python developer with Django and SQL", "skills": ["Python"]}),
+    ("b", {"raw_text": "Java engineer, Spring and Kubernetes", "skills": ["k8s"]}),
+    ("c", {"raw_text": "Data scientist using Python, pandas and SQL", "skills": []}),
+    ("d", {"raw_text": "Frontend developer, React", "skills": ["JavaScript"]}),
+    ("e", {"raw_text": "", "skills": []}),
+]
+JOBS = {
+    "backend": "Python developer with Django and PostgreSQL",
+    "platform": "Kubernetes and Java engineer",
+    "data": "Python, SQL and pandas for analytics",
+}
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _expected(k):
+    """Top-k lists from plain match calls, ties in input order."""
+    matcher = ResumeMatcher()
+    scores = {
+        (rid, jid): matcher.match(data, text)["overall_score"]
+        for rid, data in RESUMES for jid, text in JOBS.items()
+    }
+    job_ids, resume_ids = list(JOBS), [rid for rid, _ in RESUMES]
+    per_resume = {
+        rid: sorted(job_ids, key=lambda j: (-scores[rid, j], job_ids.index(j)))[:k]
+        for rid in resume_ids
+    }
+    per_job = {
+        jid: sorted(resume_ids, key=lambda r: (-scores[r, jid], resume_ids.index(r)))[:k]
+        for jid in job_ids
+    }
+    return scores, per_resume, per_job
+
+
+@pytest.mark.parametrize("block_size,job_block", [(256, 256), (2, 1)])
+def test_matrix_matches_nested_match_calls(tmp_path, block_size, job_block):
+    """Test that top-k lists and scores equal those of ResumeMatcher.match."""
+    summary = match_matrix(
+        iter(RESUMES), JOBS, tmp_path, k=2, block_size=block_size, job_block=job_block
+    )
+    scores, per_resume, per_job = _expected(2)
+
+    assert summary["resumes"] == 5 and summary["jobs"] == 3
+    resume_lines = _read(summary["resumes_path"])
+    assert [line["resume_id"] for line in resume_lines] == ["a", "b", "c", "d", "e"]
+    for line in resume_lines:
+        rid = line["resume_id"]
+        assert [m["job_id"] for m in line["matches"]] == per_resume[rid]
+        assert [m["overall_score"] for m in line["matches"]] == [
+            scores[rid, jid] for jid in per_resume[rid]
+        ]
+    for line in _read(summary["jobs_path"]):
+        assert [m["resume_id"] for m in line["matches"]] == per_job[line["job_id"]]
+
+
+def test_matrix_with_worker_processes(tmp_path):
+    """Test that the process pool gives the same files as in-process scoring."""
+    serial = match_matrix(RESUMES, JOBS, tmp_path / "serial", k=3, block_size=2)
+    parallel = ResumeMatcher().match_matrix(
+        RESUMES, list(JOBS.items()), tmp_path / "parallel", k=3, workers=2, block_size=2
+    )
+
+    assert _read(parallel["resumes_path"]) == _read(serial["resumes_path"])
+    assert _read(parallel["jobs_path"]) == _read(serial["jobs_path"])
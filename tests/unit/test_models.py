@@ -0,0 +1,105 @@
+"""Test cases for the ParsedResume record."""
+
+import pickle
+
+from resumematch import ResumeMatcher, ResumeParser
+from resumematch.parser import ParsedResume, SkillVocabulary, default_vocabulary
+
+RESUME = {
+    "contact_info": {"name": "Jane Doe", "email": "jane@example.com"},
+    "work_experience": [
+        {
+            "title": "Engineer",
+            "company": "Acme",
+            "start_date": "2019",
+            "end_date": "2023",
+            "description": "Built APIs",
+        },
+    ],
+    "education": [{"degree": "BSc", "institution": "State University", "year": "2018"}],
+    "skills": ["Python", "Kubernetes", "Underwater Basket Weaving"],
+    "certifications": ["CKA"],
+    "raw_text": "Jane Doe, Python engineer running Kubernetes",
+}
+
+
+def test_round_trip_to_dict():
+    """Test that to_dict restores the parse() dictionary."""
+    record = ParsedResume.from_dict(RESUME)
+
+    assert record.to_dict() == RESUME
+    assert record.skills == RESUME["skills"]
+
+
+def test_records_are_slotted():
+    """Test that records carry no per-instance __dict__."""
+    record = ParsedResume.from_dict(RESUME)
+
+    for obj in (record, record.contact_info, record.work_experience[0], record.education[0]):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_skills_share_vocabulary_ids():
+    """Test that skills are interned once across records."""
+    vocabulary = SkillVocabulary()
+    first = ParsedResume.from_dict(RESUME, vocabulary=vocabulary)
+    second = ParsedResume.from_dict({"skills": ["Kubernetes", "Go"]}, vocabulary=vocabulary)
+
+    assert list(first.skill_ids) == [0, 1, 2]
+    assert list(second.skill_ids) == [1, 3]
+    assert len(vocabulary) == 4
+
+
+def test_default_vocabulary_follows_skill_automaton():
+    """Test that known skills get their automaton ids in the shared vocabulary."""
+    matcher = ResumeMatcher()
+    vocabulary = default_vocabulary()
+
+    assert vocabulary.id_of("Kubernetes") == matcher.skills.names.index("Kubernetes")
+
+
+def test_default_vocabulary_is_not_grown():
+    """Test that unknown skills are kept by name instead of interned globally."""
+    vocabulary = default_vocabulary()
+    size = len(vocabulary)
+
+    record = ParsedResume.from_dict(RESUME)
+
+    assert len(vocabulary) == size
+    assert "Underwater Basket Weaving" not in vocabulary
+    assert record.extra_skills == ("Underwater Basket Weaving",)
+    assert record.skills == RESUME["skills"]
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_text_can_be_dropped_or_loaded_lazily():
+    """Test the raw_text holding options."""
+    dropped = ParsedResume.from_dict(RESUME, keep_text=False)
+    lazy = ParsedResume.from_dict(RESUME, keep_text=False, text_loader=lambda: "loaded")
+
+    assert dropped.raw_text == "" and not dropped.has_text
+    assert lazy.raw_text == "loaded"
+
+
+def test_matcher_accepts_parsed_resume():
+    """Test that match gives the same result for a dict and a record."""
+    matcher = ResumeMatcher()
+    record = ParsedResume.from_dict(RESUME)
+    job = "Python and Kubernetes engineer"
+
+    assert matcher.match(record, job) == matcher.match(RESUME, job)
+    assert matcher.match_many([record], job) == [matcher.match(RESUME, job)]
+
+
+def test_parse_record(tmp_path):
+    """Test that parse_record builds a record and can re-load dropped text."""
+    path = tmp_path / "resume.txt"
+    path.write_text("Python developer with Docker")
+    parser = ResumeParser()
+
+    record = parser.parse_record(str(path), keep_text=False)
+
+    assert not record.has_text
+    assert record.raw_text == "Python developer with Docker"
+    assert record.skills == ["Python", "Docker"]
+    assert pickle.loads(pickle.dumps(record)) == record
@@ -51,3 +51,58 @@ def test_parse_unsupported_format(tmp_path):
     
     with pytest.raises(ValueError):
         parser.parse(str(test_file))
+
+
+def _write_resumes(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"resume_{i}.txt"
+        path.write_text(f"Resume number {i}")
+        paths.append(str(path))
+    return paths
+
+
+def test_iter_parse_reports_errors_inline(tmp_path):
+    """Test that a failing file yields an error entry instead of aborting."""
+    parser = ResumeParser()
+    paths = _write_resumes(tmp_path, 3)
+    paths.insert(1, str(tmp_path / "missing.pdf"))
+
+    results = list(parser.iter_parse(paths, chunksize=2))
+
+    assert [r["resume_path"] for r in results] == paths
+    assert "error" in results[1]
+    assert all("data" in r for i, r in enumerate(results) if i != 1)
+
+
+def test_iter_parse_is_lazy(tmp_path):
+    """Test that paths are consumed chunk by chunk, not all up front."""
+    parser = ResumeParser()
+    paths = _write_resumes(tmp_path, 10)
+    consumed = []
+
+    def path_source():
+        for path in paths:
+            consumed.append(path)
+            yield path
+
+    first = next(parser.iter_parse(path_source(), chunksize=3))
+
+    assert first["resume_path"] == paths[0]
+    assert len(consumed) <= 4
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_parse_many_with_process_pool(tmp_path, ordered):
+    """Test that parse_many fans out to worker processes."""
+    parser = ResumeParser()
+    paths = _write_resumes(tmp_path, 25)
+
+    results = parser.parse_many(paths, workers=2, chunksize=4, ordered=ordered)
+
+    assert len(results) == 25
+    assert all("data" in r for r in results)
+    if ordered:
+        assert [r["resume_path"] for r in results] == paths
+    else:
+        assert sorted(r["resume_path"] for r in results) == sorted(paths)
@@ -0,0 +1,42 @@
+"""Test cases for stage timing and metrics."""
+
+from resumematch.utils.profiling import NULL_TIMER, MetricsRegistry, StageTimer
+
+
+def test_stage_timer_accumulates_and_forwards():
+    """Test that repeated stages add up and reach the sink."""
+    seen = []
+    timer = StageTimer(sink=lambda stage, seconds: seen.append(stage))
+    for _ in range(2):
+        with timer.stage("extract"):
+            pass
+    with timer.stage("match"):
+        pass
+    assert list(timer.timings) == ["extract", "match"]
+    assert all(seconds >= 0 for seconds in timer.timings.values())
+    assert seen == ["extract", "extract", "match"]
+
+
+def test_null_timer_records_nothing():
+    """Test that the shared null timer stays empty."""
+    with NULL_TIMER.stage("extract"):
+        pass
+    NULL_TIMER.record("match", 1.0)
+    assert NULL_TIMER.timings == {}
+    assert not NULL_TIMER.enabled
+
+
+def test_metrics_registry_histograms():
+    """Test counters, sums and Prometheus rendering."""
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.observe("extract", 0.05)
+    registry.observe("extract", 0.5)
+    registry("extract", 5.0)
+    snapshot = registry.snapshot()
+    assert snapshot["extract"]["count"] == 3
+    assert abs(snapshot["extract"]["sum"] - 5.55) < 1e-9
+    text = registry.render()
+    assert 'resumematch_stage_seconds_bucket{stage="extract",le="0.1"} 1' in text
+    assert 'resumematch_stage_seconds_bucket{stage="extract",le="1.0"} 2' in text
+    assert 'resumematch_stage_seconds_bucket{stage="extract",le="+Inf"} 3' in text
+    assert 'resumematch_stage_seconds_count{stage="extract"} 3' in text
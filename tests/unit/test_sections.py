@@ -0,0 +1,122 @@
+"""Test cases for resume section segmentation."""
+
+from resumematch.parser import ResumeParser, SectionSegmenter
+from resumematch.parser.sections import extract_sections
+
+RESUME = """Jane Doe
+jane.doe@example.com | +1 (555) 123-4567
+
+Summary
+Backend engineer who likes boring technology.
+
+## Work Experience:
+Senior Engineer, Globex
+Mar 2019 - Present
+- Built billing services in Python
+- Led a team of 4
+
+Data Analyst at Initech  2015 - 2019
+Wrote SQL reports.
+
+EDUCATION
+Master of Science in Computer Science, State University, 2015
+
+Skills
+Python, SQL
+
+Certifications
+- AWS Certified Solutions Architect
+- PMP
+"""
+
+
+def test_classify_recognizes_heading_variants():
+    """Test that heading lines map to sections and body lines do not."""
+    segmenter = SectionSegmenter()
+    assert segmenter.classify("Experience") == "experience"
+    assert segmenter.classify("## Work Experience:") == "experience"
+    assert segmenter.classify("  EDUCATION  ") == "education"
+    assert segmenter.classify("Licenses & Certifications") == "certifications"
+    assert segmenter.classify("Experience with Python and Go") is None
+    assert segmenter.classify("Skills: Python, SQL") is None
+
+
+def test_segment_spans_exclude_headings():
+    """Test preamble, per-section spans and repeated sections."""
+    lines = ["Jane", "Skills", "Python", "Education", "BSc", "Skills", "Go"]
+    spans = SectionSegmenter().segment(lines)
+    assert spans == {
+        "contact": [(0, 1)],
+        "skills": [(2, 3), (6, 7)],
+        "education": [(4, 5)],
+    }
+
+
+def test_custom_headings():
+    """Test that a custom heading mapping replaces the defaults."""
+    segmenter = SectionSegmenter({"experience": ["Berufserfahrung"]})
+    assert segmenter.classify("BERUFSERFAHRUNG") == "experience"
+    assert segmenter.classify("Experience") is None
+
+
+def test_extract_fields():
+    """Test contact, experience, education and certification extraction."""
+    fields = extract_sections(RESUME)
+
+    assert fields["contact_info"] == {
+        "name": "Jane Doe",
+        "email": "jane.doe@example.com",
+        "phone": "+1 (555) 123-4567",
+    }
+    assert fields["work_experience"] == [
+        {
+            "title": "Senior Engineer",
+            "company": "Globex",
+            "start_date": "Mar 2019",
+            "end_date": "Present",
+            "description": "Built billing services in Python\nLed a team of 4",
+        },
+        {
+            "title": "Data Analyst",
+            "company": "Initech",
+            "start_date": "2015",
+            "end_date": "2019",
+            "description": "Wrote SQL reports.",
+        },
+    ]
+    assert fields["education"] == [{
+        "degree": "Master of Science in Computer Science",
+        "institution": "State University",
+        "year": "2015",
+    }]
+    assert fields["certifications"] == ["AWS Certified Solutions Architect", "PMP"]
+
+
+def test_education_parts_are_stripped():
+    """Test that removing a date range leaves no stray whitespace in the degree."""
+    fields = extract_sections("Education\nBSc Computer Science 2015 - 2019\n")
+    assert fields["education"] == [
+        {"degree": "BSc Computer Science", "institution": "", "year": "2019"}
+    ]
+
+
+def test_extract_without_headings():
+    """Test that unstructured text yields empty sections."""
+    fields = extract_sections("Just some text without any headings.")
+    assert fields["work_experience"] == []
+    assert fields["education"] == []
+    assert fields["certifications"] == []
+
+
+def test_parse_fills_structured_fields(tmp_path):
+    """Test that ResumeParser.parse returns the segmented fields."""
+    path = tmp_path / "resume.txt"
+    path.write_text(RESUME)
+
+    result = ResumeParser().parse(str(path))
+
+    assert result["contact_info"]["email"] == "jane.doe@example.com"
+    assert [job["company"] for job in result["work_experience"]] == ["Globex", "Initech"]
+    assert result["education"][0]["institution"] == "State University"
+    assert result["certifications"] == ["AWS Certified Solutions Architect", "PMP"]
+    assert "Python" in result["skills"]
@@ -0,0 +1,167 @@
+"""Test cases for embedding-based similarity search."""
+
+import pytest
+from resumematch.matcher import HashingEmbedder, SemanticIndex
+from resumematch.matcher.semantic import IVFIndex, VectorStore, cosine
+
+
+RESUMES = {
+    "ml": {"raw_text": "ML engineer building deep learning models", "skills": ["PyTorch"]},
+    "web": {"raw_text": "Frontend developer with React and CSS", "skills": ["JavaScript"]},
+    "ops": {"raw_text": "Site reliability engineer running Kubernetes", "skills": ["Docker"]},
+}
+
+
+def test_embedding_is_unit_length_and_canonicalizes_skills():
+    """Test that skill aliases land close together and vectors are normalized."""
+    embedder = HashingEmbedder(dim=64)
+    ml = embedder.embed("ML engineer")
+    long_form = embedder.embed("machine learning engineer")
+    web = embedder.embed("frontend web designer")
+
+    assert len(ml) == 64
+    assert cosine(ml, ml) == pytest.approx(1.0, abs=1e-5)
+    assert cosine(ml, long_form) > cosine(ml, web)
+    assert not any(embedder.embed(""))
+
+
+def test_vector_store_roundtrip(tmp_path):
+    """Test that float16 rows survive reopening the store."""
+    store = VectorStore(tmp_path / "v.f16", dim=4)
+    store.append([0.5, -0.25, 1.0, 0.0])
+    assert store.row(0) == (0.5, -0.25, 1.0, 0.0)
+    store.append([1.0, 1.0, 1.0, 1.0])
+    assert store.row(1) == (1.0, 1.0, 1.0, 1.0)
+    store.close()
+
+    reopened = VectorStore(tmp_path / "v.f16", dim=99)
+    assert reopened.dim == 4
+    assert len(reopened) == 2
+    with pytest.raises(IndexError):
+        reopened.row(2)
+    reopened.close()
+
+
+def test_vector_store_rejects_foreign_file(tmp_path):
+    """Test that a file without the store header is refused."""
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a vector store at all")
+    with pytest.raises(ValueError):
+        VectorStore(path)
+
+
+def test_ivf_search_matches_exact_scan_with_full_probe(tmp_path):
+    """Test that probing every cluster returns the exact top-k."""
+    embedder = HashingEmbedder(dim=32)
+    store = VectorStore(tmp_path / "v.f16", dim=32)
+    texts = [f"engineer skilled in topic{i % 7} and area{i % 5}" for i in range(60)]
+    for text in texts:
+        store.append(embedder.embed(text))
+    index = IVFIndex(store)
+    index.train(n_lists=6, seed=1)
+    query = embedder.embed("topic3 area2 engineer")
+
+    exact = sorted(
+        ((cosine(query, store.row(i)), i) for i in range(len(store))),
+        key=lambda hit: (-hit[0], hit[1]),
+    )[:5]
+    found = index.search(query, k=5, nprobe=6)
+
+    assert [row for _, row in found] == [row for _, row in exact]
+    assert sum(len(rows) for rows in index.lists) == 60
+    store.close()
+
+
+def test_ivf_sample_smaller_than_lists(tmp_path):
+    """Test that a sample size below n_lists is raised to n_lists."""
+    embedder = HashingEmbedder(dim=16)
+    store = VectorStore(tmp_path / "v.f16", dim=16)
+    for i in range(10):
+        store.append(embedder.embed(f"topic{i}"))
+    index = IVFIndex(store)
+    index.train(n_lists=4, sample_size=2)
+
+    assert len(index.centroids) == 4
+    assert sum(len(rows) for rows in index.lists) == 10
+    store.close()
+
+
+def test_semantic_index_searches_both_ways(tmp_path):
+    """Test top resumes for a job and top jobs for a resume."""
+    with SemanticIndex(tmp_path / "idx", HashingEmbedder(dim=64)) as index:
+        for resume_id, resume in RESUMES.items():
+            index.add_resume(resume_id, resume)
+        index.add_job("ml-job", "Machine learning engineer, PyTorch and deep learning")
+        index.add_job("web-job", "React frontend developer")
+
+        assert index.top_resumes("machine learning PyTorch", k=1)[0]["resume_id"] == "ml"
+        assert index.top_jobs(RESUMES["web"], k=1)[0]["job_id"] == "web-job"
+
+        index.build(n_lists=2)
+        assert index.top_resumes("Kubernetes reliability", k=1, nprobe=2)[0]["resume_id"] == "ops"
+
+
+def test_semantic_index_persists(tmp_path):
+    """Test that vectors, ids and the IVF index are reloaded from disk."""
+    with SemanticIndex(tmp_path / "idx", HashingEmbedder(dim=64)) as index:
+        for resume_id, resume in RESUMES.items():
+            index.add_resume(resume_id, resume)
+        index.build(n_lists=2)
+        index.add_resume(("batch", 7), {"raw_text": "Data scientist, statistics, pandas"})
+        expected = index.top_resumes("frontend React", k=4, nprobe=2)
+
+    with SemanticIndex(tmp_path / "idx", HashingEmbedder(dim=64)) as reopened:
+        assert reopened.top_resumes("frontend React", k=4, nprobe=2) == expected
+        assert ("batch", 7) in [hit["resume_id"] for hit in
+                                reopened.top_resumes("pandas statistics", k=4, nprobe=2)]
+
+
+def test_semantic_index_recovers_from_unsaved_ids(tmp_path):
+    """Test that vectors without a saved id are dropped on reopen."""
+    with SemanticIndex(tmp_path / "idx", HashingEmbedder(dim=64)) as index:
+        for resume_id, resume in RESUMES.items():
+            index.add_resume(resume_id, resume)
+        index.build(n_lists=2)
+    ids_path = tmp_path / "idx" / "resumes.ids.jsonl"
+    lines = ids_path.read_text().splitlines(keepends=True)
+    ids_path.write_text("".join(lines[:-1]))
+
+    with SemanticIndex(tmp_path / "idx", HashingEmbedder(dim=64)) as reopened:
+        hits = reopened.top_resumes("Kubernetes reliability", k=3, nprobe=2)
+        assert sorted(hit["resume_id"] for hit in hits) == ["ml", "web"]
+        reopened.add_resume("ops", RESUMES["ops"])
+        top = reopened.top_resumes("Kubernetes reliability", k=1, nprobe=2)
+        assert top[0]["resume_id"] == "ops"
+
+    with SemanticIndex(tmp_path / "idx", HashingEmbedder(dim=64)) as again:
+        assert ids_path.read_text().splitlines() == ['"ml"', '"web"', '"ops"']
+        for query, expected in (("Kubernetes reliability", "ops"), ("React CSS", "web")):
+            assert again.top_resumes(query, k=1, nprobe=2)[0]["resume_id"] == expected
+
+
+def test_semantic_index_rejects_other_dimension(tmp_path):
+    """Test that reopening with an embedder of another size is refused."""
+    with SemanticIndex(tmp_path / "idx", HashingEmbedder(dim=64)) as index:
+        index.add_resume("ml", RESUMES["ml"])
+    with pytest.raises(ValueError):
+        SemanticIndex(tmp_path / "idx", HashingEmbedder(dim=32))
+
+
+def test_semantic_index_recovers_from_lost_vectors(tmp_path):
+    """Test that ids without a vector are dropped from disk, not just memory."""
+    with SemanticIndex(tmp_path / "idx", HashingEmbedder(dim=64)) as index:
+        index.add_resume("ml", RESUMES["ml"])
+        index.add_resume("web", RESUMES["web"])
+    store_path = tmp_path / "idx" / "resumes.f16"
+    with open(store_path, "r+b") as f:
+        f.truncate(store_path.stat().st_size - 64 * 2)
+
+    with SemanticIndex(tmp_path / "idx", HashingEmbedder(dim=64)) as reopened:
+        reopened.add_resume("ops", RESUMES["ops"])
+
+    with SemanticIndex(tmp_path / "idx", HashingEmbedder(dim=64)) as again:
+        top = again.top_resumes("Kubernetes reliability", k=1)
+        assert top[0]["resume_id"] == "ops"
+        assert sorted(hit["resume_id"] for hit in again.top_resumes("engineer", k=5)) == [
+            "ml", "ops",
+        ]
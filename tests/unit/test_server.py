@@ -0,0 +1,80 @@
+"""Test cases for the warm RPC service."""
+
+import threading
+
+import pytest
+from resumematch import ResumeMatcher
+from resumematch.server import LocalClient, ResumeService, RPCClient, RPCError, make_server
+
+JOB = "Python developer with Django and SQL"
+RESUME = {"raw_text": "Python developer, Django, PostgreSQL", "skills": ["Python"]}
+
+
+def test_local_client_matches_direct_calls(tmp_path):
+    """Test that the in-process client returns the library results."""
+    resume_file = tmp_path / "resume.txt"
+    resume_file.write_text("Python developer with SQL experience")
+    matcher = ResumeMatcher()
+
+    with LocalClient() as client:
+        assert client.match(RESUME, JOB) == matcher.match(RESUME, JOB)
+        assert client.ats_score(RESUME) == matcher.calculate_ats_score(RESUME)
+        assert client.analyze(str(resume_file), JOB)["overall_score"] > 0
+        assert client.add_resume("a", RESUME) == 1
+        assert client.add_resume(["b", 2], resume_path=str(resume_file)) == 2
+        assert client.top_k("Django", k=1)[0]["resume_id"] == "a"
+        assert client.top_k("SQL experience", k=1)[0]["resume_id"] == ["b", 2]
+
+
+def test_errors_are_reported_per_request():
+    """Test unknown methods, missing parameters and handler failures."""
+    with LocalClient() as client:
+        with pytest.raises(RPCError) as unknown:
+            client.call("nope")
+        assert unknown.value.code == RPCError.METHOD_NOT_FOUND
+        with pytest.raises(RPCError) as missing:
+            client.call("match", resume_data=RESUME)
+        assert missing.value.code == RPCError.INVALID_PARAMS
+        client.add_resume("a", RESUME)
+        with pytest.raises(RPCError) as duplicate:
+            client.add_resume("a", RESUME)
+        assert duplicate.value.code == RPCError.SERVER_ERROR
+
+
+def test_concurrent_requests_are_batched():
+    """Test that requests queued together run as one batch with correct results."""
+    service = ResumeService(max_wait=0.5)
+    resumes = [{"raw_text": f"Python developer {i}", "skills": []} for i in range(20)]
+    with service:
+        futures = [service.submit("match", {"resume_data": r, "job_description": JOB})
+                   for r in resumes]
+        futures.append(service.submit("match", {"resume_data": RESUME}))
+        results = [future.result() for future in futures[:-1]]
+        with pytest.raises(RPCError):
+            futures[-1].result()
+        assert service.call("stats")["batches"] == 2
+
+    assert results == ResumeMatcher().match_many(resumes, JOB)
+
+
+@pytest.mark.parametrize("transport", ["tcp", "unix"])
+def test_rpc_client_over_http(tmp_path, transport):
+    """Test JSON-RPC over TCP and a Unix socket."""
+    service = ResumeService()
+    if transport == "tcp":
+        server = make_server(service, port=0)
+        address = "127.0.0.1:%d" % server.server_address[1]
+    else:
+        address = str(tmp_path / "rm.sock")
+        server = make_server(service, socket_path=address)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    with service:
+        thread.start()
+        try:
+            with RPCClient(address, timeout=10) as client:
+                assert client.match(RESUME, JOB) == ResumeMatcher().match(RESUME, JOB)
+                with pytest.raises(RPCError):
+                    client.call("missing")
+        finally:
+            server.shutdown()
+            server.server_close()
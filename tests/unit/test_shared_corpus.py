@@ -0,0 +1,85 @@
+"""Test cases for the shared-memory resume corpus."""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from resumematch import ResumeMatcher
+from resumematch.matcher import SharedCorpus
+
+JOB = "Python developer with Django, SQL and Kubernetes"
+RESUMES = [
+    ("a", {"raw_text": "Python developer, Django and PostgreSQL", "skills": ["Python"]}),
+    (("b", 1), {"raw_text": "Java engineer running k8s clusters", "skills": ["Kubernetes"]}),
+    ("c", {"raw_text": "SQL analyst", "skills": []}),
+    ("d", {"raw_text": "", "skills": []}),
+    ("e", {"raw_text": "Django and Python developer using SQL", "skills": ["Docker"]}),
+]
+
+
+def _top_k_in_worker(corpus, start, stop):
+    return corpus.top_k(JOB, k=10, start=start, stop=stop)
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    with SharedCorpus.create(RESUMES, directory=tmp_path) as corpus:
+        yield corpus
+
+
+def test_match_equals_resume_matcher(corpus):
+    """Test that per-row results are identical to ResumeMatcher.match."""
+    matcher = ResumeMatcher()
+    assert len(corpus) == 5
+    for row, (resume_id, data) in enumerate(RESUMES):
+        assert corpus.resume_id(row) == resume_id
+        assert corpus.match(row, JOB) == matcher.match(data, JOB)
+
+
+def test_top_k_ranks_by_match_score(corpus):
+    """Test ranking, tie order, slicing and skill scores."""
+    matcher = ResumeMatcher()
+    expected = sorted(
+        range(len(RESUMES)),
+        key=lambda row: -matcher.match(RESUMES[row][1], JOB)["overall_score"],
+    )
+    ranking = corpus.top_k(JOB, k=5)
+
+    assert [hit["row"] for hit in ranking] == expected
+    for hit in ranking:
+        result = matcher.match(RESUMES[hit["row"]][1], JOB)
+        assert hit["overall_score"] == result["overall_score"]
+        assert hit["skill_score"] == result["skill_score"]
+    assert [hit["row"] for hit in corpus.top_k(JOB, k=2, start=2, stop=4)] == [2, 3]
+    assert corpus.top_k(JOB, start=5) == []
+
+
+def test_workers_attach_by_path(corpus):
+    """Test that a pickled corpus is attached, not copied, in worker processes."""
+    assert len(pickle.dumps(corpus)) < 200
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        parts = list(pool.map(_top_k_in_worker, [corpus, corpus], [0, 3], [3, 5]))
+
+    merged = sorted(
+        (hit for part in parts for hit in part),
+        key=lambda hit: (-hit["overall_score"], hit["row"]),
+    )
+    assert merged == corpus.top_k(JOB, k=5)
+
+
+def test_owner_unlinks_file(tmp_path):
+    """Test that the creating instance deletes the file and others only unmap."""
+    with SharedCorpus.create(RESUMES, directory=tmp_path) as owner:
+        attached = SharedCorpus.attach(owner.path)
+        assert attached.term_ids(0).tolist() == owner.term_ids(0).tolist()
+        attached.close()
+        assert owner.path.exists()
+    assert not owner.path.exists()
+
+
+def test_rejects_foreign_file(tmp_path):
+    """Test that a file that is not a corpus is refused."""
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        SharedCorpus.attach(path)
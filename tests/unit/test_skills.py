@@ -0,0 +1,97 @@
+"""Test cases for the SkillAutomaton class."""
+
+import pickle
+
+import pytest
+from resumematch import ResumeMatcher, ResumeParser
+from resumematch.utils import SkillAutomaton, default_skill_automaton
+
+TAXONOMY = {
+    "Kubernetes": ["k8s"],
+    "PostgreSQL": ["postgres"],
+    "C++": ["cpp"],
+    "C": [],
+    "Machine Learning": ["ml"],
+    "Google Cloud": ["gcp"],
+    "Google Cloud Platform": [],
+}
+
+
+@pytest.fixture
+def automaton():
+    return SkillAutomaton(TAXONOMY)
+
+
+def test_find_canonical_names_through_synonyms(automaton):
+    """Test that synonyms and case variants map to canonical names."""
+    text = "Ran K8S clusters backed by Postgres; applied ML and machine learning."
+
+    assert automaton.find(text) == ["Kubernetes", "PostgreSQL", "Machine Learning"]
+
+
+def test_word_boundaries(automaton):
+    """Test that matches inside larger words are rejected."""
+    assert automaton.find("html5 mlops postgresx k8sx") == []
+    assert automaton.find("(k8s), ml.") == ["Kubernetes", "Machine Learning"]
+
+
+def test_leftmost_longest(automaton):
+    """Test that overlapping matches prefer the longest pattern."""
+    assert automaton.find("C++ and C") == ["C++", "C"]
+    assert automaton.find("Google Cloud Platform") == ["Google Cloud Platform"]
+    spans = list(automaton.iter_matches("use gcp or google cloud"))
+    assert [(start, end) for start, end, _ in spans] == [(4, 7), (11, 23)]
+
+
+def test_find_ids(automaton):
+    """Test that ids index into names."""
+    ids = automaton.find_ids("postgres and k8s and postgres")
+    assert [automaton.names[i] for i in ids] == ["PostgreSQL", "Kubernetes"]
+
+
+def test_save_load_and_pickle(automaton, tmp_path):
+    """Test that a compiled automaton round-trips without rebuilding."""
+    path = tmp_path / "skills.bin"
+    automaton.save(path)
+
+    for clone in (SkillAutomaton.load(path), pickle.loads(pickle.dumps(automaton))):
+        assert clone.names == automaton.names
+        assert clone.find("cpp, ML, k8s") == ["C++", "Machine Learning", "Kubernetes"]
+
+
+def test_default_automaton_is_shared():
+    """Test that the default automaton is built once."""
+    assert default_skill_automaton() is default_skill_automaton()
+    assert "Kubernetes" in default_skill_automaton().find("k8s")
+
+
+def test_context_only_names_need_a_synonym():
+    """Test that everyday words only count as skills in context."""
+    skills = default_skill_automaton()
+    assert skills.find("Education\nBSc, State University, Spring 2020") == []
+    assert skills.find("Quick to react; excel at communication") == []
+    assert skills.find("Spring Boot and React Native apps") == ["Spring", "React"]
+    assert SkillAutomaton({"Spring": ["spring boot"]}, context_only=["Spring"]).find(
+        "Spring 2020, Spring Boot"
+    ) == ["Spring"]
+
+
+def test_matcher_matches_synonyms():
+    """Test that a synonym in the resume satisfies the job's skill."""
+    matcher = ResumeMatcher()
+    resume = {"raw_text": "Deployed services to k8s with postgres", "skills": []}
+
+    result = matcher.match(resume, "Kubernetes and PostgreSQL")
+
+    assert result["missing_keywords"] == []
+    assert matcher.match_many([resume], "Kubernetes and PostgreSQL") == [result]
+
+
+def test_parser_fills_skills(tmp_path):
+    """Test that parse lists the skills found in the resume text."""
+    path = tmp_path / "resume.txt"
+    path.write_text("Python developer. Tools: Docker, k8s, Postgres.")
+
+    assert ResumeParser().parse(str(path))["skills"] == [
+        "Python", "Docker", "Kubernetes", "PostgreSQL",
+    ]
@@ -1,12 +1,17 @@
 """Test cases for utility functions."""
 
+import random
+import re
+
 import pytest
 from pathlib import Path
 from resumematch.utils import (
+    TextNormalizer,
     validate_file_path,
     get_file_extension,
     clean_text,
     normalize_whitespace,
+    tokenize,
 )
 
 
@@ -64,3 +69,25 @@ class TestTextUtils:
         # Special characters should be removed but basic punctuation kept
         assert "@" not in result
         assert "#" not in result
+
+    def test_tokenize(self):
+        """Test tokenize keeps technical terms intact."""
+        assert tokenize("Python, C++ and C#.") == ["python", "c++", "and", "c#"]
+        assert tokenize("Node.js CI/CD pipelines") == ["node.js", "ci/cd", "pipelines"]
+
+    def test_text_normalizer_matches_regex_reference(self):
+        """Test TextNormalizer output is identical to the chained re.sub version."""
+        def reference(text):
+            text = re.sub(r'\s+', ' ', text).strip()
+            return re.sub(r'[^\w\s\.\,\(\)\:\;\-]', '', text).strip()
+
+        alphabet = "ab Z9_.,():;-@#$%+/\t\n\r\x0b\x0c\x1c\u00a0\u2003é中€—"
+        rng = random.Random(7)
+        samples = ["", "   ", "@", " @ a @ ", "a \t@\t b", "Café — naïve résumé!"]
+        samples += ["".join(rng.choices(alphabet, k=rng.randint(0, 40))) for _ in range(2000)]
+
+        normalizer = TextNormalizer()
+        for text in samples:
+            assert normalizer.normalize(text) == reference(text), repr(text)
+            assert clean_text(text) == reference(text)
+        assert normalizer.normalize_many(samples) == [reference(t) for t in samples]